@@ -0,0 +1,26 @@
+"""Static assets of the Streamlit app.
+
+The stylesheet lives in ``static/style.css``. It is read and minified once per
+process and every rerun reuses the same ``<style>`` block, which keeps the
+per-rerun payload small and avoids re-reading the file.
+"""
+import os
+import re
+from functools import lru_cache
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+def minify_css(css):
+    """Strips comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+@lru_cache(maxsize=None)
+def style_tag(name="style.css"):
+    """Returns the minified ``<style>`` block for a stylesheet in ``static/``."""
+    with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+        return f"<style>{minify_css(f.read())}</style>"
@@ -0,0 +1,91 @@
+"""Batched scenario solving for Problem 13.8-5.
+
+A scenario table holds one row per scenario with the objective coefficients,
+both constraint rows, the RHS values and the four upper bounds. Every row is
+solved with HiGHS, optionally behind the presolve layer (see ``presolve``),
+then usage, slack, utilization and profit contributions are computed for the
+whole batch at once.
+"""
+import numpy as np
+import pandas as pd
+
+from lp_model import model_size
+from presolve import solve_presolved
+from solver import P1_DEFAULTS, DEFAULT_METHOD, build_13_8_5, default_bounds, solve_model, postprocess_13_8_5
+
+N_VARS_13_8_5 = 4
+OBJ_COLUMNS_13_8_5 = [f"c{j+1}" for j in range(N_VARS_13_8_5)]
+A_COLUMNS_13_8_5 = [[f"a{i+1}_{j+1}" for j in range(N_VARS_13_8_5)] for i in range(2)]
+RHS_COLUMNS_13_8_5 = ["b1", "b2"]
+BOUND_COLUMNS_13_8_5 = [f"u{j+1}" for j in range(N_VARS_13_8_5)]
+SCENARIO_COLUMNS_13_8_5 = (
+    OBJ_COLUMNS_13_8_5 + A_COLUMNS_13_8_5[0] + A_COLUMNS_13_8_5[1] + RHS_COLUMNS_13_8_5 + BOUND_COLUMNS_13_8_5
+)
+
+
+def scenario_row_13_8_5(obj_coeffs, A_ub, b_ub, upper_bounds):
+    """Flattens one set of model inputs into a scenario table row."""
+    values = list(obj_coeffs) + list(A_ub[0]) + list(A_ub[1]) + list(b_ub) + list(upper_bounds)
+    return dict(zip(SCENARIO_COLUMNS_13_8_5, values))
+
+def default_scenarios_13_8_5():
+    return pd.DataFrame([scenario_row_13_8_5(**P1_DEFAULTS)], columns=SCENARIO_COLUMNS_13_8_5)
+
+def scenarios_to_arrays_13_8_5(scenarios):
+    """Splits a scenario table into stacked arrays (c, A_ub, b_ub, upper_bounds)."""
+    missing = [col for col in SCENARIO_COLUMNS_13_8_5 if col not in scenarios.columns]
+    if missing:
+        raise ValueError(f"Scenario table is missing columns: {', '.join(missing)}")
+    c = scenarios[OBJ_COLUMNS_13_8_5].to_numpy(dtype=float)
+    A_ub = np.stack([scenarios[cols].to_numpy(dtype=float) for cols in A_COLUMNS_13_8_5], axis=1)
+    b_ub = scenarios[RHS_COLUMNS_13_8_5].to_numpy(dtype=float)
+    upper_bounds = scenarios[BOUND_COLUMNS_13_8_5].to_numpy(dtype=float)
+    return c, A_ub, b_ub, upper_bounds
+
+def solve_batch_13_8_5(scenarios, method=DEFAULT_METHOD, presolve=False):
+    """Solves every scenario row and returns one result row per scenario.
+
+    Failed scenarios keep their status and message; their numeric columns are NaN.
+    With ``presolve`` the result also has per-scenario columns with the
+    variables and rows presolve removed and the presolve/solve times; the
+    removals are NaN for scenarios presolve proves infeasible.
+    """
+    c, A_ub, b_ub, upper_bounds = scenarios_to_arrays_13_8_5(scenarios)
+    n = len(c)
+    x = np.full((n, N_VARS_13_8_5), np.nan)
+    status = np.zeros(n, dtype=int)
+    messages = []
+    reductions = np.zeros((n, 4))
+    for k in range(n):
+        model = build_13_8_5(c[k], A_ub[k], b_ub[k], default_bounds(upper_bounds[k]))
+        if presolve:
+            result = solve_presolved(model, method)
+            stats = result.presolve
+            after = stats["after"]
+            # Presolve membuktikan infeasible: tidak ada model tereduksi, jadi tidak ada yang "dihapus"
+            removed = (np.nan, np.nan) if after is None else (model_size(model)["n_vars"] - after["n_vars"],
+                                                               model_size(model)["n_ub"] - after["n_ub"])
+            reductions[k] = (*removed, stats["presolve_s"] * 1000, stats["solve_s"] * 1000)
+        else:
+            result = solve_model(model, method)
+        status[k] = result.status
+        messages.append(result.message)
+        if result.success:
+            x[k] = result.x
+
+    post = postprocess_13_8_5(x, c, A_ub, b_ub)
+    columns = {"success": status == 0, "status": status, "message": messages}
+    for j in range(N_VARS_13_8_5):
+        columns[f"x{j+1}"] = x[:, j]
+    columns["profit"] = post["profit"]
+    columns["total_production"] = post["total_production"]
+    for i in range(2):
+        columns[f"usage_{i+1}"] = post["usage"][:, i]
+        columns[f"slack_{i+1}"] = post["slack"][:, i]
+        columns[f"utilization_{i+1}"] = post["utilization"][:, i]
+    for j in range(N_VARS_13_8_5):
+        columns[f"contribution_{j+1}"] = post["contributions"][:, j]
+    if presolve:
+        for j, name in enumerate(("presolve_removed_vars", "presolve_removed_rows", "presolve_ms", "solve_ms")):
+            columns[name] = reductions[:, j]
+    return pd.DataFrame(columns, index=scenarios.index)
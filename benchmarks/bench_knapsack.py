@@ -0,0 +1,96 @@
+"""Cross-check and throughput of the closed-form knapsack solver.
+
+Draws random single-row LPs (budget rows like 13.8-9 plus instances with
+mixed-sign coefficients and negative bounds), compares objective, row dual
+and reduced costs with ``linprog`` (HiGHS) and times the batch solver on
+perturbed 13.8-9 instances.
+
+    python benchmarks/bench_knapsack.py --check 5000 --batch 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.optimize import linprog
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knapsack import solve_knapsack, solve_knapsack_batch  # noqa: E402
+from lp_model import make_model  # noqa: E402
+from solver import P2_DEFAULTS  # noqa: E402
+
+
+def random_instance(rng):
+    n = int(rng.integers(1, 9))
+    if rng.random() < 0.5:
+        # Seperti 13.8-9: biaya positif, output positif, batas [0, ub]
+        c = -rng.uniform(0.5, 2.0, n)
+        a = rng.uniform(5, 30, n)
+        lower = np.zeros(n)
+        upper = rng.uniform(100, 3000, n)
+        b = rng.uniform(0.1, 1.2) * (a * upper).sum()
+    else:
+        c = rng.normal(size=n) * (rng.random(n) > 0.1)
+        a = rng.normal(size=n) * (rng.random(n) > 0.1)
+        lower = rng.uniform(-3, 1, n)
+        upper = lower + rng.uniform(0, 4, n)
+        b = 2 * rng.normal()
+    return c, a, b, lower, upper
+
+def cross_check(count, seed=0, tol=1e-7):
+    """Returns ``(checked, mismatches)`` for ``count`` random instances against HiGHS."""
+    rng = np.random.default_rng(seed)
+    mismatches = []
+    for k in range(count):
+        c, a, b, lower, upper = random_instance(rng)
+        bounds = np.column_stack([lower, upper])
+        reference = linprog(c, A_ub=[a], b_ub=[b], bounds=bounds)
+        result = solve_knapsack(make_model(c, [a], [b], bounds, sense="min"))
+        if reference.status != result.status:
+            mismatches.append((k, "status", reference.status, result.status))
+            continue
+        if reference.status != 0:
+            continue
+        scale = max(1.0, abs(reference.fun))
+        if abs(reference.fun - result.fun) > tol * scale:
+            mismatches.append((k, "objective", reference.fun, result.fun))
+        if np.any(result.x < lower - tol) or np.any(result.x > upper + tol) or a @ result.x > b + tol * max(1.0, abs(b)):
+            mismatches.append((k, "feasibility", None, None))
+        # Dual hanya unik jika solusinya tidak degenerate; cek kelayakan dual dan strong duality
+        y = result.ineqlin.marginals[0]
+        d = result.lower.marginals + result.upper.marginals
+        dual_objective = y * b + (result.lower.marginals * lower).sum() + (result.upper.marginals * upper).sum()
+        if y > tol or not np.allclose(c - a * y, d, atol=1e-6) or abs(dual_objective - result.fun) > 1e-6 * scale:
+            mismatches.append((k, "duals", reference.ineqlin.marginals[0], y))
+    return count, mismatches
+
+def throughput(size, seed=0):
+    """Instances per second of ``solve_knapsack_batch`` on perturbed 13.8-9 models."""
+    rng = np.random.default_rng(seed)
+    shape = (size, len(P2_DEFAULTS["obj_coeffs"]))
+    c = np.broadcast_to(-np.asarray(P2_DEFAULTS["obj_coeffs"], dtype=float), shape)
+    a = np.asarray(P2_DEFAULTS["cost_coeffs"], dtype=float) * rng.uniform(0.8, 1.2, shape)
+    b = rng.uniform(10_000, 80_000, size)
+    upper = np.broadcast_to(np.asarray(P2_DEFAULTS["upper_bounds"], dtype=float), shape)
+    start = time.perf_counter()
+    solve_knapsack_batch(c, a, b, np.zeros(shape), upper)
+    return size / (time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", type=int, default=2000, help="random instances compared with linprog")
+    parser.add_argument("--batch", type=int, default=1_000_000, help="instances in the throughput run")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    checked, mismatches = cross_check(args.check, args.seed)
+    for mismatch in mismatches[:20]:
+        print("MISMATCH", mismatch, file=sys.stderr)
+    print(f"cross-check: {checked} instances, {len(mismatches)} mismatches")
+    print(f"throughput: {throughput(args.batch, args.seed):,.0f} instances/s")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Solver benchmark suite with scaling curves.
+
+Generates scaled variants of the 13.8-5 and 13.8-9 models, times ``linprog``
+for each HiGHS method with dense and sparse constraint matrices, records peak
+memory and writes the results as JSON. Every case runs in a fresh process, so
+its memory figures do not inherit the peaks of earlier cases: ``rss_delta_mb``
+is the growth of the peak RSS during the case (native HiGHS memory included),
+``peak_python_mb`` the Python allocations from the dense conversion on. A
+previous JSON file can be passed with ``--compare`` to flag time and memory
+regressions.
+
+    python benchmarks/bench_solver.py --sizes 10 50 200 --output bench.json
+    python benchmarks/bench_solver.py --sizes 10 50 200 --compare bench.json
+"""
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import scipy
+import scipy.sparse as sp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lp_model import make_model, model_size  # noqa: E402
+from solver import P1_DEFAULTS, P2_DEFAULTS, solve_model  # noqa: E402
+
+METHODS = ("highs-ds", "highs-ipm")
+MATRIX_KINDS = ("sparse", "dense")
+# Dense runs above this many matrix cells are skipped
+MAX_DENSE_CELLS = 25_000_000
+# Kenaikan memori di bawah ini dianggap noise pada --compare
+MEMORY_NOISE_MB = 2.0
+
+
+# ==============================================================================
+# GENERATOR MODEL TERSKALA
+# ==============================================================================
+def scaled_13_8_5(scale, periods=1, seed=0):
+    """Production planning with ``scale`` products on ``scale`` machines over ``periods`` periods.
+
+    Every (product, machine, period) has a regular and an overtime variable,
+    like x₁₁…x₂₂ in the original model. Each machine has a capacity row per
+    period and each product a production-capacity row per period. Capacities
+    are the same fraction of the row activity at the upper bounds as in the
+    original model, so the rows bind as they do there.
+    """
+    rng = np.random.default_rng(seed)
+    products, machines = scale, scale
+    base_profit = np.array(P1_DEFAULTS["obj_coeffs"], dtype=float)
+    n_per = products * machines * 2
+    n = n_per * periods
+
+    idx = np.arange(n)
+    period, rest = np.divmod(idx, n_per)
+    product, rest = np.divmod(rest, machines * 2)
+    machine, mode = np.divmod(rest, 2)
+
+    profit = base_profit[mode + 2 * (machine % 2)] * rng.uniform(0.8, 1.2, n)
+    machine_rows = period * machines + machine
+    product_rows = periods * machines + period * products + product
+    rows = np.concatenate([machine_rows, product_rows])
+    cols = np.concatenate([idx, idx])
+    vals = np.concatenate([np.ones(n), np.where(mode == 0, 2.0, 1.0) * rng.uniform(0.9, 1.1, n)])
+    m = periods * (machines + products)
+    A = sp.csr_matrix((vals, (rows, cols)), shape=(m, n))
+
+    upper = np.array(P1_DEFAULTS["upper_bounds"], dtype=float)[mode + 2 * (machine % 2)] / 2
+    # Rasio kapasitas / aktivitas maksimum baris seperti pada model asli (≈ 0.77 dan 0.83)
+    original = np.asarray(P1_DEFAULTS["b_ub"], dtype=float) / (np.asarray(P1_DEFAULTS["A_ub"], dtype=float) @ P1_DEFAULTS["upper_bounds"])
+    b = np.repeat(original, [periods * machines, periods * products]) * (A @ upper)
+    return make_model(profit, A, b, np.column_stack([np.zeros(n), upper]), sense="max")
+
+def scaled_13_8_9(scale, periods=1, seed=0):
+    """Resource allocation with ``scale`` products over ``periods`` periods.
+
+    One budget row per period plus one overall budget row linking the periods.
+    """
+    rng = np.random.default_rng(seed)
+    n_per = scale * 2
+    n = n_per * periods
+    base_cost = np.array(P2_DEFAULTS["cost_coeffs"], dtype=float)
+    base_upper = np.array(P2_DEFAULTS["upper_bounds"], dtype=float)
+    kind = np.arange(n) % 4
+    cost = base_cost[kind] * rng.uniform(0.8, 1.2, n)
+    period = np.arange(n) // n_per
+
+    rows = np.concatenate([period, np.full(n, periods)])
+    cols = np.concatenate([np.arange(n), np.arange(n)])
+    A = sp.csr_matrix((np.concatenate([cost, cost]), (rows, cols)), shape=(periods + 1, n))
+    per_period_budget = P2_DEFAULTS["cost_limit"] * scale / 2
+    b = np.concatenate([np.full(periods, per_period_budget), [0.8 * per_period_budget * periods]])
+    return make_model(np.ones(n), A, b, np.column_stack([np.zeros(n), base_upper[kind]]), sense="max")
+
+GENERATORS = {"13_8_5": scaled_13_8_5, "13_8_9": scaled_13_8_9}
+
+
+# ==============================================================================
+# PENGUKURAN
+# ==============================================================================
+def _max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+def run_case(name, scale, periods, method, matrix, repeats):
+    """Times one (model, method, matrix kind) combination and returns a result record.
+
+    Meant to run in a fresh process (see :func:`run_isolated`); the model is
+    generated there so the memory figures belong to this case alone. One
+    untimed warm-up solve comes first and the repeats run without tracing;
+    the Python peak comes from a separate traced pass (conversion included).
+    """
+    generated = GENERATORS[name](scale, periods)
+
+    def prepared():
+        return dict(generated, A_ub=generated["A_ub"].toarray()) if matrix == "dense" else generated
+
+    rss_before = _max_rss_mb()
+    model = prepared()
+    solve_model(model, method)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = solve_model(model, method)
+        times.append(time.perf_counter() - start)
+    rss_after = _max_rss_mb()
+    del model
+
+    tracemalloc.start()
+    solve_model(prepared(), method)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    active = 0
+    if result.success:
+        b = generated["b_ub"]
+        active = int(np.sum(result.slack <= 1e-7 * np.maximum(1.0, np.abs(b))))
+    return {
+        "status": int(result.status),
+        "objective": float(-result.fun) if result.success else None,
+        "active_rows": active,
+        "time_min_s": min(times),
+        "time_median_s": statistics.median(times),
+        "peak_python_mb": peak / 1024 / 1024,
+        "max_rss_mb": rss_after,
+        "rss_delta_mb": rss_after - rss_before,
+    }
+
+def run_isolated(*case):
+    """Runs :func:`run_case` in a new spawned process and returns its record."""
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_case, *case).result()
+
+def run_suite(models, sizes, periods, methods, matrices, repeats):
+    results = []
+    for name in models:
+        for scale in sizes:
+            model = GENERATORS[name](scale, periods)
+            size = model_size(model)
+            for matrix in matrices:
+                if matrix == "dense" and size["n_vars"] * (size["n_ub"] + size["n_eq"]) > MAX_DENSE_CELLS:
+                    continue
+                for method in methods:
+                    record = {"model": name, "scale": scale, "periods": periods, "method": method, "matrix": matrix, **size}
+                    record.update(run_isolated(name, scale, periods, method, matrix, repeats))
+                    # Semua baris redundan berarti benchmark hanya mengukur LP batas variabel
+                    assert record["active_rows"] > 0, f"No binding rows in {case_key(record)}"
+                    results.append(record)
+                    print(f"{name:7s} scale={scale:<6d} n={size['n_vars']:<9d} {matrix:6s} {method:9s} "
+                          f"{record['time_median_s'] * 1000:10.2f} ms  peak={record['peak_python_mb']:8.1f} MB  "
+                          f"rss+={record['rss_delta_mb']:8.1f} MB", file=sys.stderr)
+    return results
+
+def case_key(record):
+    return (record["model"], record["scale"], record["periods"], record["method"], record["matrix"])
+
+def compare(results, baseline, threshold, memory_threshold):
+    """Returns the records whose median time or memory grew by more than the thresholds.
+
+    Time is compared as a ratio to ``threshold``. Memory (``rss_delta_mb``
+    and ``peak_python_mb``) is compared to ``memory_threshold`` and must also
+    grow by more than ``MEMORY_NOISE_MB``. Baselines without a field are
+    skipped for it. Each regression has ``metric``, ``baseline`` and ``ratio``.
+    """
+    previous = {case_key(r): r for r in baseline["results"]}
+    regressions = []
+    for record in results:
+        old = previous.get(case_key(record))
+        if not old:
+            continue
+        if record["time_median_s"] > threshold * old["time_median_s"]:
+            regressions.append({**record, "metric": "time_median_s", "baseline": old["time_median_s"],
+                                "ratio": record["time_median_s"] / old["time_median_s"]})
+        for metric in ("rss_delta_mb", "peak_python_mb"):
+            if old.get(metric) is None:
+                continue
+            growth = record[metric] - old[metric]
+            if growth > MEMORY_NOISE_MB and record[metric] > memory_threshold * old[metric]:
+                regressions.append({**record, "metric": metric, "baseline": old[metric],
+                                    "ratio": record[metric] / max(old[metric], 1e-9)})
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[2, 10, 50, 200])
+    parser.add_argument("--periods", type=int, default=1)
+    parser.add_argument("--methods", nargs="+", default=list(METHODS))
+    parser.add_argument("--matrices", nargs="+", default=list(MATRIX_KINDS), choices=list(MATRIX_KINDS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON to this file (default: stdout)")
+    parser.add_argument("--compare", help="baseline JSON file from a previous run")
+    parser.add_argument("--threshold", type=float, default=1.25, help="time regression ratio for --compare")
+    parser.add_argument("--memory-threshold", type=float, default=1.5, help="memory regression ratio for --compare")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scipy": scipy.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": run_suite(args.models, args.sizes, args.periods, args.methods, args.matrices, args.repeats),
+    }
+    exit_code = 0
+    if args.compare:
+        with open(args.compare) as f:
+            report["regressions"] = compare(report["results"], json.load(f), args.threshold, args.memory_threshold)
+        for r in report["regressions"]:
+            print(f"REGRESSION {case_key(r)}: {r['metric']} {r['ratio']:.2f}x baseline", file=sys.stderr)
+        exit_code = 1 if report["regressions"] else 0
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Lightweight Plotly charts for solution vectors of any size.
+
+Small vectors are drawn as they are. Large vectors are aggregated first: bar
+and pie charts keep the top N entries and fold the rest into one "other"
+entry, and histograms are binned with NumPy, so the figure JSON stays small no
+matter how many variables the model has. Figures are built with
+``plotly.graph_objects`` and can be kept in a per-session dict: on the next
+rerun only the trace data of the stored figure is replaced.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+DEFAULT_MAX_BARS = 25
+DEFAULT_MAX_SLICES = 8
+DEFAULT_BINS = 40
+
+
+def top_n_with_other(labels, values, n, other_label="Other"):
+    """Keeps the ``n`` entries with the largest magnitude and sums the rest into ``other_label``."""
+    values = np.asarray(values, dtype=float)
+    labels = np.asarray(labels, dtype=object)
+    if len(values) <= n + 1:
+        return labels.tolist(), values
+    idx = np.argpartition(-np.abs(values), n - 1)[:n]
+    idx = idx[np.argsort(-np.abs(values[idx]), kind="stable")]
+    rest = values.sum() - values[idx].sum()
+    return labels[idx].tolist() + [other_label], np.append(values[idx], rest)
+
+def histogram_data(values, bins=DEFAULT_BINS):
+    """Returns bin centers, widths and counts of the finite entries of ``values``."""
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, np.diff(edges), counts
+
+def bar_chart(figures, key, labels, values, title, x_title, y_title, colorscale="Viridis",
+              max_bars=DEFAULT_MAX_BARS, other_label="Other"):
+    """Bar chart of the top ``max_bars`` values, reusing ``figures[key]`` when present."""
+    labels, values = top_n_with_other(labels, values, max_bars, other_label)
+    fig = figures.get(key)
+    if fig is None:
+        fig = go.Figure(go.Bar(x=labels, y=values, marker=dict(color=values, colorscale=colorscale, showscale=True)))
+        fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+        figures[key] = fig
+    else:
+        fig.data[0].update(x=labels, y=values, marker=dict(color=values))
+    return fig
+
+def pie_chart(figures, key, labels, values, title, max_slices=DEFAULT_MAX_SLICES, other_label="Other"):
+    """Pie chart of the top ``max_slices`` values, reusing ``figures[key]`` when present."""
+    labels, values = top_n_with_other(labels, values, max_slices, other_label)
+    fig = figures.get(key)
+    if fig is None:
+        fig = go.Figure(go.Pie(labels=labels, values=values))
+        fig.update_layout(title=title)
+        figures[key] = fig
+    else:
+        fig.data[0].update(labels=labels, values=values)
+    return fig
+
+def histogram_chart(figures, key, values, title, x_title, y_title, bins=DEFAULT_BINS):
+    """Histogram of ``values`` binned with NumPy, reusing ``figures[key]`` when present."""
+    centers, widths, counts = histogram_data(values, bins)
+    fig = figures.get(key)
+    if fig is None:
+        fig = go.Figure(go.Bar(x=centers, y=counts, width=widths))
+        fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, bargap=0)
+        figures[key] = fig
+    else:
+        fig.data[0].update(x=centers, y=counts, width=widths)
+    return fig
@@ -0,0 +1,155 @@
+"""Typed export of solutions and batch results to CSV, Parquet or Arrow.
+
+Values are written as numeric columns (never pre-formatted strings). Batch
+and sweep exports stream: each chunk of scenarios is written to the output
+file as soon as it is solved, so memory does not grow with the number of
+scenarios.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from batch import solve_batch_13_8_5
+from lp_model import objective_value
+from sweep import iter_sweep_13_8_9
+
+EXPORT_FORMATS = ("csv", "parquet", "arrow")
+DEFAULT_EXPORT_CHUNK = 1000
+
+
+def format_of(sink, fmt=None):
+    """Returns the export format given explicitly or implied by the file extension."""
+    if fmt:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        return fmt
+    name = str(sink) if isinstance(sink, (str, os.PathLike)) else getattr(sink, "name", "")
+    if name.lower().endswith((".parquet", ".pq")):
+        return "parquet"
+    if name.lower().endswith((".arrow", ".feather", ".ipc")):
+        return "arrow"
+    return "csv"
+
+
+class TableWriter:
+    """Appends DataFrame batches to a single CSV, Parquet or Arrow IPC file.
+
+    ``sink`` is a path or a binary file object. The column types of the first
+    batch define the schema of the whole file.
+    """
+
+    def __init__(self, sink, fmt=None):
+        self.fmt = format_of(sink, fmt)
+        self._owns_file = isinstance(sink, (str, os.PathLike))
+        self._file = open(sink, "wb") if self._owns_file else sink
+        self._writer = None
+        self._schema = None
+        self.rows_written = 0
+
+    def write(self, df):
+        if self.fmt == "csv":
+            self._file.write(df.to_csv(index=False, header=self.rows_written == 0).encode("utf-8"))
+        else:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Parquet/Arrow export requires pyarrow (pip install pyarrow)") from e
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            if self._writer is None:
+                self._schema = table.schema
+                if self.fmt == "parquet":
+                    self._writer = pq.ParquetWriter(self._file, self._schema)
+                else:
+                    self._writer = pa.ipc.new_file(self._file, self._schema)
+            self._writer.write_table(table)
+        self.rows_written += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_table(df, sink, fmt=None):
+    """Writes one DataFrame in a single call."""
+    with TableWriter(sink, fmt) as writer:
+        writer.write(df)
+
+def solution_tables(model, result):
+    """Returns ``(variables_df, constraints_df)`` with typed solution, slack and dual columns."""
+    sign = -1.0 if model.get("sense") == "max" else 1.0
+    bounds = np.asarray(model["bounds"], dtype=float)
+    n_eq = 0 if model.get("b_eq") is None else len(model["b_eq"])
+    # MILP results carry no duals; their reduced costs and duals are NaN
+    has_duals = hasattr(result, "ineqlin")
+    reduced_cost = result.lower.marginals + result.upper.marginals if has_duals else np.full(len(result.x), np.nan)
+    duals = (np.concatenate([result.ineqlin.marginals, result.eqlin.marginals if n_eq else []]) if has_duals
+             else np.full(len(model["b_ub"]) + n_eq, np.nan))
+    variables_df = pd.DataFrame({
+        "variable": model["variables"],
+        "value": result.x,
+        "objective": sign * np.asarray(model["c"], dtype=float),
+        "reduced_cost": sign * reduced_cost,
+        "lower": bounds[:, 0],
+        "upper": bounds[:, 1],
+    })
+    rhs = np.concatenate([model["b_ub"], model["b_eq"] if n_eq else []])
+    slack = np.concatenate([result.slack, np.zeros(n_eq)])
+    constraints_df = pd.DataFrame({
+        "constraint": list(model["constraints"]) + [f"E{i+1}" for i in range(n_eq)],
+        "type": ["<="] * len(model["b_ub"]) + ["="] * n_eq,
+        "usage": rhs - slack,
+        "rhs": rhs,
+        "slack": slack,
+        "dual": sign * duals,
+    })
+    return variables_df, constraints_df
+
+def export_solution(model, result, variables_sink, constraints_sink=None, fmt=None):
+    """Writes the variable table (and optionally the constraint table) of a solved model."""
+    variables_df, constraints_df = solution_tables(model, result)
+    write_table(variables_df, variables_sink, fmt)
+    if constraints_sink is not None:
+        write_table(constraints_df, constraints_sink, fmt)
+    return objective_value(model, result)
+
+def stream_batch_13_8_5(scenarios, sink, fmt=None, chunk_size=DEFAULT_EXPORT_CHUNK):
+    """Solves a scenario table chunk by chunk, writing each chunk's results as it completes.
+
+    Each output row holds the scenario inputs followed by its results.
+    Returns the number of rows written.
+    """
+    with TableWriter(sink, fmt) as writer:
+        for start in range(0, len(scenarios), chunk_size):
+            chunk = scenarios.iloc[start:start + chunk_size]
+            writer.write(pd.concat([chunk, solve_batch_13_8_5(chunk)], axis=1))
+        return writer.rows_written
+
+def stream_sweep_13_8_9(costs, budgets, sink, fmt=None, **kwargs):
+    """Runs a 13.8-9 sweep and writes every chunk to ``sink`` as it is collected.
+
+    Keyword arguments are passed to ``sweep.iter_sweep_13_8_9``. Returns the
+    number of rows written.
+    """
+    costs = np.atleast_2d(np.asarray(costs, dtype=float))
+    budgets = np.asarray(budgets, dtype=float).ravel()
+    with TableWriter(sink, fmt) as writer:
+        for start, x, output, status in iter_sweep_13_8_9(costs, budgets, **kwargs):
+            stop = start + len(output)
+            columns = {f"cost{j+1}": costs[start:stop, j] for j in range(costs.shape[1])}
+            columns["budget"] = budgets[start:stop]
+            columns["status"] = status
+            columns["output"] = output
+            columns.update({f"x{j+1}": x[:, j] for j in range(x.shape[1])})
+            writer.write(pd.DataFrame(columns))
+        return writer.rows_written
@@ -0,0 +1,192 @@
+"""Incremental re-solve for interactive tweaking of small LP models.
+
+After a solve, the optimal basis is recovered from the solution (see
+``sensitivity``) and kept together with the model. When the next model has
+the same shape, the old basis is re-evaluated for the new coefficients: one
+basis solve gives the new basic values and one gives the new duals. If the
+basis is still primal and dual feasible it is provably optimal, and the
+result is built from it without calling the solver. Otherwise the model is
+solved normally and its basis replaces the old one.
+
+``linprog`` has no warm-start interface, so a basis that is no longer
+optimal cannot be handed to HiGHS; that case is a regular solve. Models
+with more than ``MAX_RANGING_SIZE`` rows plus columns always take a regular
+solve; their size is checked before any dense matrix is built.
+"""
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import OptimizeResult
+
+from lp_model import is_mip
+from sensitivity import MAX_RANGING_SIZE, _find_basis
+from solver import DEFAULT_METHOD, solve_cached
+
+FEASIBILITY_TOL = 1e-7
+
+
+def _too_large(model):
+    """True when the dense standard form would exceed ``MAX_RANGING_SIZE``; checked before anything dense is built."""
+    A_eq = model.get("A_eq")
+    m_eq = 0 if A_eq is None else A_eq.shape[0]
+    return len(model["c"]) + model["A_ub"].shape[0] + m_eq > MAX_RANGING_SIZE
+
+def _standard_form(model):
+    """Returns ``(M, b, cost, lower, upper, n, m_ub)`` of ``[A_ub I; A_eq 0] [x; s] = b``."""
+    A_ub = sp.csr_matrix(model["A_ub"])
+    m_ub, n = A_ub.shape
+    A_eq = model.get("A_eq")
+    A_eq = sp.csr_matrix((0, n)) if A_eq is None else sp.csr_matrix(A_eq)
+    b_eq = np.zeros(0) if model.get("b_eq") is None else np.asarray(model["b_eq"], dtype=float)
+    M = np.zeros((m_ub + len(b_eq), n + m_ub))
+    M[:m_ub, :n] = A_ub.toarray()
+    M[:m_ub, n:] = np.eye(m_ub)
+    M[m_ub:, :n] = A_eq.toarray()
+    b = np.concatenate([np.asarray(model["b_ub"], dtype=float), b_eq])
+    cost = np.concatenate([np.asarray(model["c"], dtype=float), np.zeros(m_ub)])
+    bounds = np.asarray(model["bounds"], dtype=float)
+    lower = np.concatenate([bounds[:, 0], np.zeros(m_ub)])
+    upper = np.concatenate([bounds[:, 1], np.full(m_ub, np.inf)])
+    return M, b, cost, lower, upper, n, m_ub
+
+def optimal_basis(model, result):
+    """Returns ``{"basic", "at_upper"}`` for a solved LP, or None when no basis can be recovered."""
+    if is_mip(model) or not result.success or _too_large(model):
+        return None
+    M, b, cost, lower, upper, n, m_ub = _standard_form(model)
+    z = np.concatenate([result.x, result.slack])
+    d = np.concatenate([result.lower.marginals + result.upper.marginals, -result.ineqlin.marginals])
+    basic = _find_basis(M, z, lower, upper, d, FEASIBILITY_TOL)
+    if basic is None:
+        return None
+    at_upper = np.abs(z - upper) < np.abs(z - lower)
+    at_upper[basic] = False
+    return {"basic": np.array(basic), "at_upper": at_upper}
+
+def resolve_from_basis(model, basis, tol=FEASIBILITY_TOL, form=None):
+    """Evaluates a previous optimal basis on ``model``.
+
+    Returns an ``OptimizeResult`` shaped like the ``linprog`` result (with
+    marginals) if the basis is still optimal, otherwise None. ``form`` is the
+    model's standard form when the caller already built it.
+    """
+    M, b, cost, lower, upper, n, m_ub = form or _standard_form(model)
+    basic = basis["basic"]
+    if len(basic) != M.shape[0] or len(basis["at_upper"]) != M.shape[1]:
+        return None
+    nonbasic = np.ones(M.shape[1], dtype=bool)
+    nonbasic[basic] = False
+    z = np.where(basis["at_upper"], upper, lower)
+    z[basic] = 0.0
+    if not np.isfinite(z[nonbasic]).all():
+        return None
+    B = M[:, basic]
+    try:
+        z[basic] = np.linalg.solve(B, b - M[:, nonbasic] @ z[nonbasic])
+        y = np.linalg.solve(B.T, cost[basic])
+    except np.linalg.LinAlgError:
+        return None
+
+    scale = np.maximum(1.0, np.abs(z))
+    if np.any(z[basic] < lower[basic] - tol * scale[basic]) or np.any(z[basic] > upper[basic] + tol * scale[basic]):
+        return None
+    d = cost - M.T @ y
+    d[basic] = 0.0
+    d_tol = tol * np.maximum(1.0, np.abs(cost))
+    free_to_move = nonbasic & (lower < upper)
+    if np.any(free_to_move & ~basis["at_upper"] & (d < -d_tol)) or np.any(free_to_move & basis["at_upper"] & (d > d_tol)):
+        return None
+
+    x = z[:n]
+    d_x = d[:n]
+    return OptimizeResult(
+        x=x,
+        fun=float(model["c"] @ x),
+        slack=z[n:],
+        con=np.zeros(M.shape[0] - m_ub),
+        success=True,
+        status=0,
+        message="Optimal (previous basis is still optimal, solver not called)",
+        nit=0,
+        ineqlin=OptimizeResult(marginals=y[:m_ub], residual=z[n:]),
+        eqlin=OptimizeResult(marginals=y[m_ub:], residual=np.zeros(M.shape[0] - m_ub)),
+        lower=OptimizeResult(marginals=np.where(basis["at_upper"][:n], 0.0, d_x), residual=x - lower[:n]),
+        upper=OptimizeResult(marginals=np.where(basis["at_upper"][:n], d_x, 0.0), residual=upper[:n] - x),
+    )
+
+def changed_inputs(old, new):
+    """Lists the model entries that differ, e.g. ``["c[2]", "b_ub[0]", "upper[3]"]``."""
+    changes = []
+    for name in ("c", "b_ub", "b_eq"):
+        a, b = old.get(name), new.get(name)
+        if a is None or b is None or len(a) != len(b):
+            continue
+        changes += [f"{name}[{i}]" for i in np.flatnonzero(np.asarray(a) != np.asarray(b))]
+    for side, label in enumerate(("lower", "upper")):
+        a, b = old["bounds"][:, side], new["bounds"][:, side]
+        if len(a) == len(b):
+            changes += [f"{label}[{j}]" for j in np.flatnonzero(a != b)]
+    for name in ("A_ub", "A_eq"):
+        a, b = old.get(name), new.get(name)
+        if a is not None and b is not None and a.shape == b.shape:
+            a, b = sp.csr_matrix(a), sp.csr_matrix(b)
+            if (np.array_equal(a.indptr, b.indptr) and np.array_equal(a.indices, b.indices)
+                    and np.array_equal(a.data, b.data)):
+                continue
+            rows, cols = (a != b).nonzero()
+            changes += [f"{name}[{i},{j}]" for i, j in zip(rows, cols)]
+    return changes
+
+
+class IncrementalSolver:
+    """Keeps the last model and its optimal basis and re-uses it while it stays optimal.
+
+    With ``max_bases > 1`` the most recently optimal bases are all kept and
+    tried in turn, which suits sampling around one model where the optimum
+    moves between a few bases.
+    """
+
+    def __init__(self, max_bases=1):
+        self.max_bases = max_bases
+        self.model = None
+        self.bases = []
+        self.reused = 0
+        self.solved = 0
+        self.last_changes = []
+
+    @property
+    def basis(self):
+        return self.bases[0] if self.bases else None
+
+    def reuse(self, model):
+        """Returns a result built from a stored basis, or None if a solve is needed."""
+        if not self.bases or is_mip(model) or _too_large(model):
+            return None
+        self.last_changes = changed_inputs(self.model, model)
+        form = _standard_form(model)
+        for k, basis in enumerate(self.bases):
+            result = resolve_from_basis(model, basis, form=form)
+            if result is not None:
+                self.bases.insert(0, self.bases.pop(k))
+                self.reused += 1
+                self.model = model
+                return result
+        return None
+
+    def update(self, model, result):
+        """Stores ``model`` and the basis of its solved ``result``."""
+        self.solved += 1
+        self.model = model
+        if _too_large(model):
+            # Model besar: basis lama tidak berlaku lagi dan bentuk dense tidak dibangun
+            self.bases = []
+            return
+        basis = optimal_basis(model, result)
+        if basis is not None:
+            self.bases = [basis] + self.bases[:self.max_bases - 1]
+
+    def solve(self, model, method=DEFAULT_METHOD, cache=None):
+        result = self.reuse(model)
+        if result is None:
+            result = solve_cached(model, method, cache)
+            self.update(model, result)
+        return result
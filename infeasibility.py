@@ -0,0 +1,136 @@
+"""Infeasibility diagnosis: irreducible infeasible subsets (IIS) of LP models.
+
+An IIS is a set of constraints and variable bounds that cannot hold
+together, while every proper subset can. It points the user at the few
+inputs that conflict instead of just reporting "infeasible".
+
+Every candidate set is checked with one elastic (phase-1) LP: each row and
+bound gets a non-negative violation variable and the total violation is
+minimized. If the minimum is positive the set is infeasible, and the rows
+and bounds with a nonzero dual in that solve form an infeasible subset by
+themselves (a Farkas certificate), usually a small one. The first elastic
+solve therefore cuts a model of thousands of rows down to the rows of one
+conflict. A deletion filter then makes the subset irreducible. It removes
+blocks of candidates at a time and halves the block on failure; whenever a
+removal keeps the set infeasible, the candidates shrink to the new
+certificate at once. The number of solves grows with the size of the
+conflict rather than with the number of rows.
+
+MILP models are diagnosed through their LP relaxation.
+"""
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from lp_model import as_sparse, make_model
+from solver import DEFAULT_METHOD, solve_model
+
+INFEASIBILITY_TOL = 1e-7
+ROW = "row"
+EQUALITY = "equality"
+LOWER = "lower"
+UPPER = "upper"
+
+
+def _system(model):
+    """Stacks rows and finite bounds as ``G x <= h`` and ``E x = f``; returns them with one (kind, index) label per row."""
+    n = len(model["c"])
+    A_ub = as_sparse(model["A_ub"], n)
+    lower, upper = model["bounds"][:, 0], model["bounds"][:, 1]
+    has_lower, has_upper = np.flatnonzero(np.isfinite(lower)), np.flatnonzero(np.isfinite(upper))
+    eye = sp.identity(n, format="csr")
+    G = sp.vstack([A_ub, -eye[has_lower], eye[has_upper]], format="csr")
+    h = np.concatenate([model["b_ub"], -lower[has_lower], upper[has_upper]])
+    E = as_sparse(model.get("A_eq"), n)
+    f = np.zeros(0) if model.get("b_eq") is None else np.asarray(model["b_eq"], dtype=float)
+    labels = ([(ROW, i) for i in range(A_ub.shape[0])] + [(LOWER, j) for j in has_lower]
+              + [(UPPER, j) for j in has_upper] + [(EQUALITY, i) for i in range(E.shape[0])])
+    return G, h, E, f, labels
+
+def elastic_solve(G, h, E, f, subset, method=DEFAULT_METHOD, tol=INFEASIBILITY_TOL):
+    """Minimizes the total violation of the rows ``subset`` (indices into G rows, then E rows).
+
+    Returns ``(violation, certificate, elastic)``: the minimum total
+    violation, the rows of ``subset`` with a nonzero dual (an infeasible
+    subset whenever ``violation > 0``) and the violation of each row.
+    """
+    subset = np.asarray(subset, dtype=int)
+    m_G = G.shape[0]
+    g_rows, e_rows = subset[subset < m_G], subset[subset >= m_G] - m_G
+    G_s, E_s = G[g_rows], E[e_rows]
+    # Hanya kolom yang muncul di subset; kolom lain bebas dan tidak berpengaruh
+    cols = np.unique(np.concatenate([G_s.indices, E_s.indices]))
+    G_s, E_s = G_s[:, cols], E_s[:, cols]
+    n, k, q = len(cols), len(g_rows), len(e_rows)
+    c = np.concatenate([np.zeros(n), np.ones(k + 2 * q)])
+    A_ub = sp.hstack([G_s, -sp.identity(k), sp.csr_matrix((k, 2 * q))], format="csr")
+    A_eq = sp.hstack([E_s, sp.csr_matrix((q, k)), sp.identity(q), -sp.identity(q)], format="csr") if q else None
+    bounds = np.column_stack([np.concatenate([np.full(n, -np.inf), np.zeros(k + 2 * q)]), np.full(n + k + 2 * q, np.inf)])
+    model = make_model(c, A_ub, h[g_rows], bounds, sense="min", A_eq=A_eq, b_eq=f[e_rows] if q else None)
+    result = solve_model(model, method)
+    if not result.success:
+        raise ValueError(f"Elastic model cannot be solved: {result.message}")
+    duals = np.concatenate([result.ineqlin.marginals, result.eqlin.marginals if q else np.zeros(0)])
+    elastic = np.concatenate([result.x[n:n + k], result.x[n + k:n + k + q] + result.x[n + k + q:]])
+    ordered = np.concatenate([g_rows, e_rows + m_G])
+    return float(result.fun), ordered[np.abs(duals) > tol], elastic
+
+def find_iis(model, method=DEFAULT_METHOD, tol=INFEASIBILITY_TOL):
+    """Returns an irreducible infeasible subset of ``model``, or None if the model is feasible.
+
+    The result is a dict with ``items``, a list of ``(kind, index, name)``
+    where ``kind`` is ``"row"``, ``"equality"``, ``"lower"`` or ``"upper"``
+    (a variable bound), ``violation``, the minimum total violation of the
+    whole model, ``relaxation``, the violation per item in that minimum
+    (how far each row or bound must move to restore feasibility),
+    ``n_solves``, ``candidates`` (the size of the first certificate) and
+    ``seconds``.
+    """
+    start = time.perf_counter()
+    G, h, E, f, labels = _system(model)
+    m = len(labels)
+    scale = tol * max(1.0, np.abs(np.concatenate([h, f])).max(initial=0.0))
+    violation, candidates, elastic = elastic_solve(G, h, E, f, np.arange(m), method, tol)
+    n_solves = 1
+    if violation <= scale:
+        return None
+    relaxation = {labels[i]: float(v) for i, v in zip(range(m), elastic) if v > tol}
+    first_size = len(candidates)
+
+    members = set(candidates.tolist())
+    untested = sorted(members)
+    block = max(1, len(untested) // 2)
+    while untested:
+        removed = untested[:block]
+        rest = sorted(members.difference(removed))
+        value, certificate, _ = elastic_solve(G, h, E, f, rest, method, tol) if rest else (0.0, np.zeros(0, dtype=int), None)
+        n_solves += 1
+        if value > scale:
+            # Masih infeasible tanpa blok ini: kandidat menyusut ke sertifikat baru
+            members = set(certificate.tolist())
+            untested = [i for i in untested if i in members]
+            block = max(1, min(2 * block, len(untested)))
+        elif block > 1:
+            block = max(1, block // 2)
+        else:
+            # Item ini diperlukan untuk konflik
+            untested.pop(0)
+
+    names = model.get("variables") or [f"x{j + 1}" for j in range(len(model["c"]))]
+    row_names = model.get("constraints") or [f"C{i + 1}" for i in range(model["A_ub"].shape[0])]
+    def name(kind, index):
+        if kind == ROW:
+            return row_names[index]
+        if kind == EQUALITY:
+            return f"EQ{index + 1}"
+        return names[index]
+    items = [(kind, int(index), name(kind, index)) for kind, index in (labels[i] for i in sorted(members))]
+    return {
+        "items": items,
+        "violation": violation,
+        "relaxation": {(kind, int(index), name(kind, index)): v for (kind, index), v in relaxation.items()},
+        "n_solves": n_solves,
+        "candidates": first_size,
+        "seconds": time.perf_counter() - start,
+    }
@@ -0,0 +1,234 @@
+"""Background solve jobs with job IDs, progress polling, time limits and cancellation.
+
+A ``JobManager`` runs solves on a shared thread pool so the caller (a
+Streamlit rerun, a script) only submits a model and polls the job by ID.
+HiGHS does not report progress while it runs, so progress is the elapsed
+fraction of the job's time limit. The time limit is passed to HiGHS itself.
+Cancelling a queued job removes it from the pool. A job that is already
+running is marked cancelled right away and its result is discarded when the
+solver returns, at the time limit at the latest.
+
+Longer analyses (e.g. Monte Carlo) run on the same pool as tasks: they
+report their own progress and stop early once they see the cancel flag.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from solver import DEFAULT_METHOD, solve_model
+from solve_cache import model_key
+
+DEFAULT_JOB_WORKERS = 4
+DEFAULT_MAX_JOBS = 1000
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIME_LIMIT = "time_limit"
+FINISHED_STATES = (DONE, FAILED, CANCELLED, TIME_LIMIT)
+
+# linprog status when HiGHS stops at an iteration or time limit
+_LIMIT_STATUS = 1
+
+
+class SolveJob:
+    """State of one submitted solve. Read it through ``JobManager.poll``."""
+
+    def __init__(self, model, method, time_limit, options=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.model = model
+        self.method = method
+        self.time_limit = time_limit
+        self.options = dict(options or {})
+        if time_limit:
+            self.options["time_limit"] = float(time_limit)
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        self.cancel_requested = False
+        # Fraksi selesai yang dilaporkan sendiri oleh task; None untuk solve biasa
+        self.fraction = None
+        self._done = threading.Event()
+
+    def done(self):
+        return self.status in FINISHED_STATES
+
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def progress(self):
+        """Fraction in [0, 1]: 1 once finished, the fraction a task reported, otherwise elapsed / time limit (0 without a limit)."""
+        if self.done():
+            return 1.0
+        if self.fraction is not None:
+            return min(self.fraction, 0.99)
+        if self.started is None or not self.time_limit:
+            return 0.0
+        return min(self.elapsed() / self.time_limit, 0.99)
+
+    def snapshot(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "method": self.method,
+            "time_limit_s": self.time_limit,
+            "elapsed_s": self.elapsed(),
+            "progress": self.progress(),
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """Thread-safe registry of solve jobs running on a shared executor.
+
+    Finished jobs are kept (most recent ``max_jobs``) so their results can
+    still be fetched after the UI polls them.
+    """
+
+    def __init__(self, max_workers=DEFAULT_JOB_WORKERS, max_jobs=DEFAULT_MAX_JOBS):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="solve-job")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, model, method=DEFAULT_METHOD, time_limit=None, cache=None, options=None):
+        """Queues ``model`` for solving and returns the job ID.
+
+        ``options`` are further HiGHS options (e.g. ``mip_rel_gap``,
+        ``node_limit`` for MILP models). When ``cache`` (a ``SolveCache``) is
+        given, a cached result finishes the job immediately and optimal
+        results are stored in it.
+        """
+        job = SolveJob(model, method, time_limit, options)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._executor.submit(self._run, job, cache)
+        return job.id
+
+    def submit_task(self, task, *args, **kwargs):
+        """Queues ``task(*args, progress=..., cancelled=..., **kwargs)`` and returns the job ID.
+
+        The task reports the fraction done through ``progress(fraction)`` and
+        should return early once ``cancelled()`` is True. Its return value
+        becomes the job result.
+        """
+        job = SolveJob(None, None, None)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._executor.submit(self._run_task, job, task, args, kwargs)
+        return job.id
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.done()]
+        while len(self._jobs) > self.max_jobs and finished:
+            del self._jobs[finished.pop(0)]
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished = time.time()
+        job.model = None
+        job._done.set()
+
+    def _run(self, job, cache):
+        with self._lock:
+            if job.cancel_requested:
+                return
+            model = job.model
+            job.status = RUNNING
+            job.started = time.time()
+        try:
+            key = model_key(model, job.method, job.options) if cache is not None else None
+            result = cache.get(key) if cache is not None else None
+            if result is None:
+                start = time.perf_counter()
+                result = solve_model(model, job.method, job.options or None)
+                if cache is not None and result.status == 0:
+                    cache.put(key, result, time.perf_counter() - start)
+        except Exception as e:
+            with self._lock:
+                if not job.cancel_requested:
+                    job.error = str(e)
+                    self._finish(job, FAILED)
+            return
+        with self._lock:
+            if job.cancel_requested:
+                return
+            job.result = result
+            self._finish(job, TIME_LIMIT if job.time_limit and result.status == _LIMIT_STATUS else DONE)
+
+    def _run_task(self, job, task, args, kwargs):
+        with self._lock:
+            if job.cancel_requested:
+                return
+            job.status = RUNNING
+            job.started = time.time()
+
+        def progress(fraction):
+            job.fraction = fraction
+
+        try:
+            result = task(*args, progress=progress, cancelled=lambda: job.cancel_requested, **kwargs)
+        except Exception as e:
+            with self._lock:
+                if not job.cancel_requested:
+                    job.error = str(e)
+                    self._finish(job, FAILED)
+            return
+        with self._lock:
+            if job.cancel_requested:
+                return
+            job.result = result
+            self._finish(job, DONE)
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def poll(self, job_id):
+        """Returns the job snapshot, or None for an unknown job ID."""
+        job = self.get(job_id)
+        return None if job is None else job.snapshot()
+
+    def result(self, job_id):
+        job = self.get(job_id)
+        return None if job is None else job.result
+
+    def wait(self, job_id, timeout=None):
+        """Blocks until the job finishes or ``timeout`` seconds pass; returns True if it finished."""
+        job = self.get(job_id)
+        return job is not None and job._done.wait(timeout)
+
+    def cancel(self, job_id):
+        """Marks the job cancelled; returns False if the job is unknown or already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.done():
+                return False
+            job.cancel_requested = True
+            if job.future is not None:
+                job.future.cancel()
+            self._finish(job, CANCELLED)
+        return True
+
+    def jobs(self):
+        with self._lock:
+            return [job.snapshot() for job in self._jobs.values()]
+
+    def active_count(self):
+        with self._lock:
+            return sum(not job.done() for job in self._jobs.values())
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
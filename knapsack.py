@@ -0,0 +1,119 @@
+"""Closed-form solver for LPs with a single inequality row and finite bounds.
+
+    minimize c @ x  subject to  a @ x <= b,  lower <= x <= upper
+
+Problem 13.8-9 (one budget row plus box bounds) is such a continuous
+knapsack. Every variable starts at its cheaper bound; if that uses more of
+the row than ``b`` allows, variables are moved towards their other bound in
+order of cost increase per unit of the row freed until the row fits. The
+variable that is only partly moved is the basic one and its ratio is the
+dual of the row. This is an O(n log n) sort instead of a simplex run, and
+:func:`solve_knapsack_batch` does it for many instances at once with numpy.
+
+``solver.solve_model`` routes matching models here (see :func:`is_knapsack`);
+everything else still goes to ``linprog``.
+"""
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+from lp_model import is_mip
+
+FEASIBILITY_TOL = 1e-9
+
+
+def is_knapsack(model):
+    """True for a pure LP with exactly one inequality row, no equality rows and finite bounds."""
+    if is_mip(model) or model["A_ub"].shape[0] != 1:
+        return False
+    A_eq = model.get("A_eq")
+    if A_eq is not None and A_eq.shape[0] > 0:
+        return False
+    return bool(np.isfinite(model["bounds"]).all())
+
+def solve_knapsack_batch(c, a, b, lower, upper, tol=FEASIBILITY_TOL):
+    """Solves a batch of single-row LPs in minimization form.
+
+    ``c``, ``a``, ``lower`` and ``upper`` have shape (N, n) and ``b`` shape
+    (N,); inputs without the batch axis are treated as one instance. Returns
+    a dict of ``x`` (N, n), ``fun`` (N,), ``dual`` (N,) — the row marginal in
+    ``linprog``'s convention (<= 0) — ``basic`` (N,) — the index of the
+    partly moved variable or -1 — and ``status`` (N,), 0 for optimal, 2
+    for infeasible and 4 for instances with NaN or infinite ``c``, ``a`` or
+    ``b``. Instances that are not optimal get NaN ``x`` and ``fun``.
+    """
+    c, a, lower, upper = (np.atleast_2d(np.asarray(v, dtype=float)) for v in (c, a, lower, upper))
+    b = np.atleast_1d(np.asarray(b, dtype=float))
+    rows = np.arange(len(b))
+    invalid = ~(np.isfinite(c).all(axis=1) & np.isfinite(a).all(axis=1) & np.isfinite(b))
+
+    # Titik awal: batas termurah; jika biaya nol, batas yang memakai baris paling sedikit
+    at_upper = (c < 0) | ((c == 0) & (a < 0))
+    z = np.where(at_upper, upper, lower)
+    deficit = (a * z).sum(axis=1) - b
+
+    # Kapasitas baris yang dibebaskan jika variabel dipindah ke batas lainnya, dan biayanya per unit
+    abs_a = np.abs(a)
+    capacity = abs_a * np.where(a > 0, z - lower, upper - z)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(capacity > 0, np.abs(c) / abs_a, np.inf)
+    order = np.argsort(ratio, axis=1, kind="stable")
+    cap_sorted = np.take_along_axis(capacity, order, axis=1)
+    freed_before = np.cumsum(cap_sorted, axis=1) - cap_sorted
+    need = np.maximum(deficit, 0.0)[:, None]
+    freed = np.clip(need - freed_before, 0.0, cap_sorted)
+
+    move = np.zeros_like(z)
+    np.put_along_axis(move, order, freed, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = z - np.where(abs_a > 0, np.sign(a) * move / abs_a, 0.0)
+
+    partial = (freed > 0) & (freed < cap_sorted)
+    last = np.where(freed > 0, np.arange(freed.shape[1]), -1).max(axis=1)
+    critical = np.where(partial.any(axis=1), np.argmax(partial, axis=1), last)
+    binding = deficit > -tol * np.maximum(1.0, np.abs(b))
+    dual = np.where(binding & (critical >= 0), -np.take_along_axis(ratio, order, axis=1)[rows, np.maximum(critical, 0)], 0.0)
+    basic = np.where(partial.any(axis=1), order[rows, critical], -1)
+
+    infeasible = (deficit - cap_sorted.sum(axis=1) > tol * np.maximum(1.0, np.abs(b))) | (lower > upper).any(axis=1)
+    failed = infeasible | invalid
+    x[failed] = np.nan
+    fun = np.where(failed, np.nan, (c * x).sum(axis=1))
+    return {"x": x, "fun": fun, "dual": np.where(failed, 0.0, dual), "basic": np.where(failed, -1, basic),
+            "status": np.where(invalid, 4, np.where(infeasible, 2, 0))}
+
+def solve_knapsack(model):
+    """Solves a model accepted by :func:`is_knapsack` and returns a ``linprog``-shaped ``OptimizeResult``.
+
+    Raises ``ValueError`` for NaN or infinite coefficients, as ``linprog`` does.
+    """
+    bounds = model["bounds"]
+    a = model["A_ub"].toarray()[0]
+    for name, value in (("c", model["c"]), ("A_ub", a), ("b_ub", model["b_ub"])):
+        if not np.isfinite(value).all():
+            raise ValueError(f"Invalid input for the knapsack solver: {name} must not contain values inf, nan, or None")
+    out = solve_knapsack_batch(model["c"], a, model["b_ub"], bounds[:, 0], bounds[:, 1])
+    if out["status"][0] != 0:
+        return OptimizeResult(x=None, fun=None, success=False, status=2, nit=0,
+                              message="The problem is infeasible (closed-form knapsack solver)")
+    x = out["x"][0]
+    y = out["dual"][0]
+    d = model["c"] - a * y
+    basic = out["basic"][0]
+    if basic >= 0:
+        d[basic] = 0.0
+    at_upper = np.abs(x - bounds[:, 1]) < np.abs(x - bounds[:, 0])
+    slack = model["b_ub"] - a @ x
+    return OptimizeResult(
+        x=x,
+        fun=float(out["fun"][0]),
+        slack=slack,
+        con=np.zeros(0),
+        success=True,
+        status=0,
+        message="Optimal (closed-form knapsack solver, linprog not called)",
+        nit=0,
+        ineqlin=OptimizeResult(marginals=np.array([y]), residual=slack),
+        eqlin=OptimizeResult(marginals=np.zeros(0), residual=np.zeros(0)),
+        lower=OptimizeResult(marginals=np.where(at_upper, 0.0, d), residual=x - bounds[:, 0]),
+        upper=OptimizeResult(marginals=np.where(at_upper, d, 0.0), residual=bounds[:, 1] - x),
+    )
@@ -1,9 +1,36 @@
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import streamlit as st
 import numpy as np
 import pandas as pd
-from scipy.optimize import linprog
 import plotly.graph_objects as go
-import plotly.express as px
+from solver import (
+    P1_VARIABLES, P1_DEFAULTS, P2_VARIABLES, P2_DEFAULTS, DEFAULT_METHOD,
+    postprocess_13_8_5, build_13_8_5, build_13_8_9, has_incumbent, mip_limit,
+)
+from batch import default_scenarios_13_8_5, solve_batch_13_8_5
+from solve_cache import SolveCache, model_key
+from parametric import parametric_rhs_13_8_5
+from pareto import pareto_13_8_5, pareto_13_8_9
+from infeasibility import find_iis
+from sensitivity import sensitivity_report
+from model_io import read_model
+from lp_model import model_size, objective_value, is_mip
+from export import EXPORT_FORMATS, solution_tables, write_table
+from profiling import PhaseProfiler
+from texts import text_bundle
+from assets import style_tag
+from charts import bar_chart, pie_chart, histogram_chart
+from multiperiod import DEFAULT_PERIODS, N_PERIOD_VARS, period_inputs, seasonal_demand, solve_multi_period_13_8_5
+from incremental import IncrementalSolver
+from montecarlo import DISTRIBUTIONS, monte_carlo
+from service import MODEL_BUILDERS
+from solution_store import SolutionStore
+from jobs import JobManager, DONE, CANCELLED, TIME_LIMIT, FINISHED_STATES
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -13,786 +40,82 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# ==============================================================================
-# KAMUS TEKS UNTUK MULTI-BAHASA (INDONESIA & INGGRIS)
-# ==============================================================================
-TEXTS = {
-    # Teks Umum & Sidebar
-    "lang_select_label": "Pilih Bahasa / Select Language",
-    "main_header_title": {
-        "id": "📊 Pemecah Studi Kasus Riset Operasi",
-        "en": "📊 Operations Research Case Study Solver"
-    },
-    "main_header_subtitle": {
-        "id": "Solusi Optimal untuk Perencanaan Produksi & Alokasi Sumber Daya",
-        "en": "Optimal Solutions for Production Planning & Resource Allocation"
-    },
-    "sidebar_problem_select_header": {
-        "id": "🎯 Pilih Masalah",
-        "en": "🎯 Select Problem"
-    },
-    "sidebar_problem_select_help": {
-        "id": "Pilih masalah yang ingin diselesaikan",
-        "en": "Choose the problem you want to solve"
-    },
-    "sidebar_info_header": {
-        "id": "ℹ️ Informasi",
-        "en": "ℹ️ Information"
-    },
-    "sidebar_method_header": {
-        "id": "📚 Metode",
-        "en": "📚 Methods"
-    },
-    "p1_guide_header": {
-        "id": "📖 Panduan Penggunaan - Perencanaan Produksi",
-        "en": "📖 User Guide - Production Planning"
-    },
-    "p2_guide_header": {
-        "id": "📖 Panduan Penggunaan - Alokasi Sumber Daya",
-        "en": "📖 User Guide - Resource Allocation"
-    },
-
-    "p1_guide_content": {
-        "id": """
-    Panduan ini membantu Anda memahami cara menggunakan solver untuk masalah perencanaan produksi.
-
-    #### **1. Pahami Tujuan & Variabel**
-    - **Tujuan**: Memaksimalkan total profit dari semua unit yang diproduksi.
-    - **Variabel Keputusan**:
-        - `x₁₁ (Gergaji Reg)`: Jumlah unit yang diproduksi mesin gergaji pada waktu reguler.
-        - `x₁₂ (Gergaji OT)`: Jumlah unit yang diproduksi mesin gergaji pada waktu lembur.
-        - `x₂₁ (Bor Reg)`: Jumlah unit yang diproduksi mesin bor pada waktu reguler.
-        - `x₂₂ (Bor OT)`: Jumlah unit yang diproduksi mesin bor pada waktu lembur.
-
-    #### **2. Atur Parameter Input**
-    - **Fungsi Tujuan**: Masukkan nilai profit yang didapat dari setiap unit produk.
-    - **Batasan**: Definisikan batasan sumber daya yang tersedia.
-    - **Batasan Variabel**: Masukkan kapasitas produksi maksimal untuk setiap jenis proses.
-
-    #### **3. Selesaikan dan Analisis**
-    1. Setelah semua parameter sesuai, klik tombol **Selesaikan Masalah Produksi**.
-    2. Hasilnya akan muncul di bawah, menunjukkan alokasi produksi optimal untuk profit maksimal.
-    """,
-        "en": """
-    This guide helps you understand how to use the solver for the production planning problem.
-
-    #### **1. Understand the Goal & Variables**
-    - **Goal**: To maximize the total profit from all units produced.
-    - **Decision Variables**:
-        - `x₁₁ (Gergaji Reg)`: Number of units produced by the saw during regular time.
-        - `x₁₂ (Gergaji OT)`: Number of units produced by the saw during overtime.
-        - `x₂₁ (Bor Reg)`: Number of units produced by the drill during regular time.
-        - `x₂₂ (Bor OT)`: Number of units produced by the drill during overtime.
-
-    #### **2. Set the Input Parameters**
-    - **Objective Function**: Enter the profit value gained from each product unit.
-    - **Constraints**: Define the resource limitations.
-    - **Variable Bounds**: Input the maximum capacity for each specific production type.
-
-    #### **3. Solve and Analyze**
-    1. After all parameters are set, click the **Solve Production Problem** button.
-    2. The results will appear below, showing the optimal production plan for maximum profit.
-    """
-    },
-    "p2_guide_content": {
-        "id": """
-    Panduan ini membantu Anda menggunakan solver untuk masalah alokasi sumber daya.
-
-    #### **1. Pahami Tujuan & Variabel**
-    - **Tujuan**: Memaksimalkan total output (jumlah total unit) dari kedua produk.
-    - **Variabel Keputusan**:
-        - `x₁ᴿ (Reguler P1)`: Unit Produk 1 (Waktu Reguler).
-        - `x₁ᴼ (Lembur P1)`: Unit Produk 1 (Lembur).
-        - `x₂ᴿ (Reguler P2)`: Unit Produk 2 (Waktu Reguler).
-        - `x₂ᴼ (Lembur P2)`: Unit Produk 2 (Lembur).
-
-    #### **2. Atur Parameter Input**
-    - **Fungsi Tujuan**: Koefisien `1` berarti setiap unit dihitung sama dalam total output.
-    - **Batasan Anggaran**: Definisikan biaya per unit dan total anggaran yang tersedia.
-    - **Batasan Kapasitas**: Masukkan batas produksi maksimal untuk setiap jenis produk.
-
-    #### **3. Selesaikan dan Analisis**
-    1. Pastikan semua nilai biaya, anggaran, dan kapasitas sudah benar.
-    2. Klik tombol **Selesaikan Masalah Alokasi**.
-    3. Hasilnya akan menunjukkan jumlah unit optimal untuk diproduksi agar total output maksimal sesuai anggaran.
-    """,
-        "en": """
-    This guide helps you use the solver for the resource allocation problem.
-
-    #### **1. Understand the Goal & Variables**
-    - **Goal**: To maximize the total output (total number of units) from both products.
-    - **Decision Variables**:
-        - `x₁ᴿ (Reguler P1)`: Units of Product 1 (Regular time).
-        - `x₁ᴼ (Lembur P1)`: Units of Product 1 (Overtime).
-        - `x₂ᴿ (Reguler P2)`: Units of Product 2 (Regular time).
-        - `x₂ᴼ (Lembur P2)`: Units of Product 2 (Overtime).
-
-    #### **2. Set the Input Parameters**
-    - **Objective Function**: The default coefficient of `1` means every unit contributes equally to the total output.
-    - **Budget Constraint**: Define the cost per unit and the total available budget.
-    - **Capacity Bounds**: Input the maximum production limit for each individual product type.
-
-    #### **3. Solve and Analyze**
-    1. Ensure all cost, budget, and capacity values are correct.
-    2. Click the **Solve Allocation Problem** button.
-    3. The results will show the optimal number of units to produce for maximum output within the budget.
-    """
-    },
-    "input_parameters_header": {
-        "id": "⚙️ Parameter Input",
-        "en": "⚙️ Input Parameters"
-    },
-    "solve_optimization_header": {
-        "id": "🚀 Selesaikan Optimisasi",
-        "en": "🚀 Solve Optimization"
-    },
-
-    # Teks untuk Masalah 1: Perencanaan Produksi
-    "p1_title": {
-        "id": "🏭 Masalah 1: Perencanaan Produksi",
-        "en": "🏭 Problem 1: Production Planning"
-    },
-    "p1_desc": {
-        "id": "Perusahaan memproduksi produk menggunakan mesin gergaji dan bor. Setiap mesin memiliki waktu operasi reguler dan lembur dengan profit yang berbeda.",
-        "en": "A company manufactures products using a saw and a drill. Each machine has regular and overtime operational hours with different profit margins."
-    },
-    "p1_info": {
-        "id": "**Perencanaan Produksi**: Optimalisasi produksi dengan mesin gergaji dan bor, mempertimbangkan waktu reguler dan lembur.",
-        "en": "**Production Planning**: Optimizing production with a saw and a drill, considering regular and overtime hours."
-    },
-    "p1_solve_button": {
-        "id": "Selesaikan Masalah Produksi",
-        "en": "Solve Production Problem"
-    },
-    "p1_obj_func_header": {
-        "id": "💰 Fungsi Tujuan (Maksimalkan Profit)",
-        "en": "💰 Objective Function (Maximize Profit)"
-    },
-    "p1_constraints_header": {
-        "id": "⚖️ Batasan (Constraints)",
-        "en": "⚖️ Constraints"
-    },
-    "p1_constraint1_label": {
-        "id": "**Batasan 1:** Total Kapasitas Mesin",
-        "en": "**Constraint 1:** Total Machine Capacity"
-    },
-    "p1_constraint2_label": {
-        "id": "**Batasan 2:** Kapasitas Produksi",
-        "en": "**Constraint 2:** Production Capacity"
-    },
-    "p1_bounds_header": {
-        "id": "🔢 Batasan Variabel (Bounds)",
-        "en": "🔢 Variable Bounds"
-    },
-    "p1_df_profit_col": {
-        "id": "Profit Unit ($)",
-        "en": "Unit Profit ($)"
-    },
-    "p1_df_totalprofit_col": {
-        "id": "Total Profit ($)",
-        "en": "Total Profit ($)"
-    },
-    "p1_df_constraint_col": {
-        "id": "Batasan",
-        "en": "Constraint"
-    },
-    "p1_df_constraints": {
-        "id": ['Total Kapasitas Mesin', 'Kapasitas Produksi'],
-        "en": ['Total Machine Capacity', 'Production Capacity']
-    },
-    "p1_metric_profit": {
-        "id": "Profit Maksimum",
-        "en": "Maximum Profit"
-    },
-    "p1_metric_production": {
-        "id": "Total Produksi",
-        "en": "Total Production"
-    },
-    "p1_metric_c1": {
-        "id": "Penggunaan Batasan 1",
-        "en": "Constraint 1 Usage"
-    },
-    "p1_metric_c2": {
-        "id": "Penggunaan Batasan 2",
-        "en": "Constraint 2 Usage"
-    },
-    "p1_chart1_title": {
-        "id": "Nilai Produksi Optimal",
-        "en": "Optimal Production Values"
-    },
-    "p1_chart2_title": {
-        "id": "Kontribusi Profit per Variabel",
-        "en": "Profit Contribution by Variable"
-    },
-    "p1_interpretation_title": {
-        "id": "💡 Interpretasi Hasil",
-        "en": "💡 Result Interpretation"
-    },
-    "p1_interpretation_text": {
-        "id": "Untuk mencapai **profit maksimum sebesar ${profit:,.2f}**, rencana produksi yang optimal adalah dengan **fokus memproduksi {val1:.0f} unit menggunakan Gergaji Reguler dan {val3:.0f} unit menggunakan Bor Reguler** hingga kapasitas maksimalnya. Produksi lembur (`Gergaji OT` dan `Bor OT`) tidak digunakan sama sekali, menandakan bahwa opsi ini tidak efisien secara biaya dibandingkan produksi reguler. Rencana ini sepenuhnya memanfaatkan kapasitas produksi yang ada (`Batasan 2` terpakai 100%), menunjukkan alokasi sumber daya yang sangat efisien.",
-        "en": "To achieve the **maximum profit of ${profit:,.2f}**, the optimal production plan is to **focus on producing {val1:.0f} units using the Regular Saw and {val3:.0f} units using the Regular Drill** to their maximum capacities. Overtime production (`Gergaji OT` and `Bor OT`) is not utilized at all, indicating it is not cost-effective compared to regular production. This plan fully utilizes the available production capacity (`Constraint 2` is at 100% usage), demonstrating a highly efficient allocation of resources."
-    },
-
-    # Teks untuk Masalah 2: Alokasi Sumber Daya
-    "p2_title": {
-        "id": "💰 Masalah 2: Alokasi Sumber Daya",
-        "en": "💰 Problem 2: Resource Allocation"
-    },
-    "p2_desc": {
-        "id": "Optimalisasi alokasi sumber daya untuk dua produk dengan waktu reguler dan lembur, dengan batasan anggaran dan kapasitas produksi.",
-        "en": "Optimizing resource allocation for two products with regular and overtime hours, subject to a budget and production capacity constraints."
-    },
-    "p2_info": {
-        "id": "**Alokasi Sumber Daya**: Optimalisasi alokasi sumber daya dengan batasan anggaran dan kapasitas produksi.",
-        "en": "**Resource Allocation**: Optimizing resource allocation with a budget constraint and production capacities."
-    },
-    "p2_solve_button": {
-        "id": "Selesaikan Masalah Alokasi",
-        "en": "Solve Allocation Problem"
-    },
-    "p2_obj_func_header": {
-        "id": "📊 Fungsi Tujuan (Maksimalkan Output)",
-        "en": "📊 Objective Function (Maximize Output)"
-    },
-    "p2_budget_header": {
-        "id": "💸 Batasan Anggaran (Budget Constraint)",
-        "en": "💸 Budget Constraint"
-    },
-    "p2_capacity_header": {
-        "id": "🔢 Batasan Kapasitas",
-        "en": "🔢 Capacity Bounds"
-    },
-    "p2_df_unitcost_col": {
-        "id": "Biaya Unit ($)",
-        "en": "Unit Cost ($)"
-    },
-    "p2_df_totalcost_col": {
-        "id": "Total Biaya ($)",
-        "en": "Total Cost ($)"
-    },
-    "p2_df_cap_usage_col": {
-        "id": "Penggunaan Kapasitas (%)",
-        "en": "Capacity Usage (%)"
-    },
-    "p2_df_budget_item_col": {
-        "id": "Item",
-        "en": "Item"
-    },
-    "p2_df_budget_items": {
-        "id": ['Anggaran Dialokasikan', 'Anggaran Terpakai', 'Sisa Anggaran', 'Utilisasi Anggaran'],
-        "en": ['Budget Allocated', 'Budget Used', 'Budget Remaining', 'Budget Utilization']
-    },
-    "p2_metric_output": {
-        "id": "Output Maksimum",
-        "en": "Maximum Output"
-    },
-    "p2_metric_cost": {
-        "id": "Total Biaya",
-        "en": "Total Cost"
-    },
-    "p2_metric_budget_usage": {
-        "id": "Penggunaan Anggaran",
-        "en": "Budget Usage"
-    },
-    "p2_metric_rem_budget": {
-        "id": "Sisa Anggaran",
-        "en": "Remaining Budget"
-    },
-    "p2_chart1_title": {
-        "id": "Alokasi Sumber Daya Optimal",
-        "en": "Optimal Resource Allocation"
-    },
-    "p2_chart2_title": {
-        "id": "Distribusi Biaya per Variabel",
-        "en": "Cost Distribution by Variable"
-    },
-    "p2_interpretation_title": {
-        "id": "💡 Interpretasi Hasil",
-        "en": "💡 Result Interpretation"
-    },
-    "p2_interpretation_text": {
-        "id": "Untuk memaksimalkan total output, strategi terbaik adalah **memanfaatkan penuh opsi produksi termurah terlebih dahulu**. Dalam kasus ini, produksi `Reguler P1` (biaya $15) dan `Reguler P2` (biaya $16) digunakan hingga kapasitas maksimalnya. Sisa anggaran kemudian dialokasikan untuk memproduksi {val4:.0f} unit `Lembur P2` (biaya $24), karena ini adalah opsi termurah berikutnya yang tersedia. Produksi `Lembur P1` (biaya $25) tidak digunakan sama sekali. Strategi ini berhasil **menghabiskan seluruh anggaran** ({usage:.1f}%) untuk mendapatkan output setinggi mungkin.",
-        "en": "To maximize total output, the best strategy is to **fully utilize the cheapest production options first**. In this case, `Regular P1` (cost $15) and `Regular P2` (cost $16) are used to their maximum capacity. The remaining budget is then allocated to produce {val4:.0f} units of `Overtime P2` (cost $24), as it's the next cheapest available option. `Overtime P1` (cost $25) is not used at all. This strategy successfully **exhausts the entire budget** ({usage:.1f}%) to achieve the highest possible output."
-    },
-
-    # Teks Umum Hasil
-    "results_header": {
-        "id": "📊 Hasil & Analisis",
-        "en": "📊 Results & Analysis"
-    },
-    "success_message": {
-        "id": "✅ Optimisasi Berhasil! Solusi optimal telah ditemukan.",
-        "en": "✅ Optimization Successful! An optimal solution has been found."
-    },
-    "error_message": {
-        "id": "❌ Optimisasi Gagal:",
-        "en": "❌ Optimization Failed:"
-    },
-    "optimal_vars_header": {
-        "id": "📋 Nilai Variabel Optimal",
-        "en": "📋 Optimal Variable Values"
-    },
-    "constraint_analysis_header": {
-        "id": "🔍 Analisis Batasan",
-        "en": "🔍 Constraint Analysis"
-    },
-    "budget_analysis_header": {
-        "id": "💰 Analisis Anggaran",
-        "en": "💰 Budget Analysis"
-    },
-    "df_variable_col": {
-        "id": "Variabel",
-        "en": "Variable"
-    },
-    "df_optimal_val_col": {
-        "id": "Nilai Optimal",
-        "en": "Optimal Value"
-    },
-    "df_usage_col": {
-        "id": "Penggunaan",
-        "en": "Usage"
-    },
-    "df_limit_col": {
-        "id": "Batas",
-        "en": "Limit"
-    },
-    "df_slack_col": {
-        "id": "Sisa (Slack)",
-        "en": "Slack"
-    },
-    "df_utilization_col": {
-        "id": "Utilisasi (%)",
-        "en": "Utilization (%)"
-    },
-    "df_value_col": {
-        "id": "Nilai",
-        "en": "Value"
-    },
-     "chart_vars_label": {
-        "id": "Variabel",
-        "en": "Variables"
-    },
-    "chart_units_label": {
-        "id": "Unit Produksi",
-        "en": "Production Units"
-    },
-    "chart_resources_label": {
-        "id": "Sumber Daya Dialokasikan",
-        "en": "Allocated Resources"
-    },
-    "problem_summary": {
-        "id": "Ringkasan Masalah",
-        "en": "Problem Summary"
-    },
-    "summary_vars": {
-        "id": "Variabel Keputusan",
-        "en": "Decision Variables"
-    },
-    "summary_constraints": {
-        "id": "Batasan Pertidaksamaan",
-        "en": "Inequality Constraints"
-    },
-    "summary_bounds": {
-        "id": "Batasan Kapasitas",
-        "en": "Capacity Limitations"
-    },
-    "summary_objective": {
-        "id": "Tujuan",
-        "en": "Objective"
-    },
-}
+@st.cache_resource
+def get_profiler():
+    """One phase profiler per server process, aggregating the reruns of all sessions."""
+    return PhaseProfiler()
 
-# Enhanced Custom CSS with better typography and layout
-# Enhanced Custom CSS with improved font contrast
-st.markdown("""
-<style>
-    /* Import fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-    
-    /* Root variables for consistent theming */
-    :root {
-        --primary-color: #667eea;
-        --secondary-color: #764ba2;
-        --accent-color: #f093fb;
-        --success-color: #10b981;
-        --warning-color: #f59e0b;
-        --error-color: #ef4444;
-        --text-primary: #ffffff;
-        --text-secondary: #e5e7eb;
-        --text-muted: #9ca3af;
-        --bg-primary: #1f2937;
-        --bg-secondary: #111827;
-        --border-color: #374151;
-        --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.05);
-        --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1);
-        --shadow-lg: 0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1);
-        --border-radius: 12px;
-        --border-radius-sm: 8px;
-        --spacing-xs: 0.25rem;
-        --spacing-sm: 0.5rem;
-        --spacing-md: 1rem;
-        --spacing-lg: 1.5rem;
-        --spacing-xl: 2rem;
-        --spacing-2xl: 3rem;
-    }
-    
-    /* Global typography improvements */
-    html, body, [class*="st-"] {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-size: 16px;
-        line-height: 1.6;
-        color: var(--text-primary);
-    }
-    
-    /* Headers with better hierarchy and improved contrast */
-    h1, h2, h3, h4, h5, h6 {
-        font-weight: 600;
-        line-height: 1.3;
-        margin-bottom: var(--spacing-md);
-        color: var(--text-primary);
-    }
-    
-    h1 { font-size: 2.5rem; font-weight: 700; color: var(--text-primary); }
-    h2 { font-size: 2rem; font-weight: 600; color: var(--text-primary); }
-    h3 { font-size: 1.75rem; font-weight: 600; color: var(--text-primary); }
-    h4 { font-size: 1.5rem; font-weight: 600; color: var(--text-primary); }
-    h5 { font-size: 1.25rem; font-weight: 500; color: var(--text-secondary); }
-    h6 { font-size: 1.125rem; font-weight: 500; color: var(--text-secondary); }
-    
-    /* Enhanced main header */
-    .main-header {
-        background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
-        padding: var(--spacing-2xl);
-        border-radius: var(--border-radius);
-        color: white;
-        text-align: center;
-        margin-bottom: var(--spacing-2xl);
-        box-shadow: var(--shadow-lg);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .main-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(45deg, rgba(255,255,255,0.1) 0%, transparent 100%);
-        pointer-events: none;
-    }
-    
-    .main-header h1 {
-        font-size: 3rem;
-        font-weight: 700;
-        margin-bottom: var(--spacing-sm);
-        text-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        color: #ffffff;
-    }
-    
-    .main-header p {
-        font-size: 1.2rem;
-        font-weight: 400;
-        opacity: 0.95;
-        margin: 0;
-        color: #ffffff;
-    }
-    
-    /* Enhanced problem cards */
-    .problem-card {
-        background: var(--bg-secondary);
-        padding: var(--spacing-xl);
-        border-radius: var(--border-radius);
-        border-left: 6px solid var(--primary-color);
-        box-shadow: var(--shadow-md);
-        margin: var(--spacing-xl) 0;
-        transition: all 0.3s ease;
-        position: relative;
-    }
-    
-    .problem-card:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-lg);
-    }
-    
-    .problem-card h2 {
-        color: var(--text-primary);
-        font-size: 1.75rem;
-        font-weight: 600;
-        margin-bottom: var(--spacing-md);
-    }
-    
-    .problem-card p {
-        color: var(--text-secondary);
-        font-size: 1.1rem;
-        line-height: 1.7;
-        margin: 0;
-    }
-    
-    /* Enhanced info boxes */
-    .info-box {
-        background: linear-gradient(135deg, var(--bg-secondary) 0%, rgba(102, 126, 234, 0.05) 100%);
-        padding: var(--spacing-lg);
-        border-radius: var(--border-radius);
-        border: 2px solid rgba(102, 126, 234, 0.1);
-        margin: var(--spacing-lg) 0;
-        box-shadow: var(--shadow-sm);
-    }
-    
-    .info-box h4 {
-        color: var(--text-primary);
-        font-size: 1.25rem;
-        font-weight: 600;
-        margin-bottom: var(--spacing-md);
-    }
-    
-    .info-box p {
-        color: var(--text-secondary);
-        font-size: 1rem;
-        margin-bottom: var(--spacing-sm);
-        font-weight: 500;
-    }
-    
-    .info-box p:last-child {
-        margin-bottom: 0;
-    }
-    
-    /* Enhanced alerts with better contrast */
-    .success-alert {
-        background: linear-gradient(135deg, rgba(16, 185, 129, 0.15) 0%, rgba(16, 185, 129, 0.08) 100%);
-        border: 2px solid rgba(16, 185, 129, 0.3);
-        color: #ffffff;
-        padding: var(--spacing-lg);
-        border-radius: var(--border-radius);
-        margin: var(--spacing-lg) 0;
-        font-size: 1.1rem;
-        font-weight: 500;
-        box-shadow: var(--shadow-sm);
-    }
-    
-    .error-alert {
-        background: linear-gradient(135deg, rgba(239, 68, 68, 0.15) 0%, rgba(239, 68, 68, 0.08) 100%);
-        border: 2px solid rgba(239, 68, 68, 0.3);
-        color: #ffffff;
-        padding: var(--spacing-lg);
-        border-radius: var(--border-radius);
-        margin: var(--spacing-lg) 0;
-        font-size: 1.1rem;
-        font-weight: 500;
-        box-shadow: var(--shadow-sm);
-    }
-    
-    /* Enhanced buttons */
-    div.stButton {
-        margin-top: 1.5rem;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, var(--primary-color) 0%, var(--secondary-color) 100%);
-        color: white;
-        border: none;
-        border-radius: var(--border-radius);
-        padding: var(--spacing-lg) var(--spacing-2xl);
-        font-size: 1.2rem;
-        font-weight: 600;
-        font-family: 'Inter', sans-serif;
-        transition: all 0.3s ease;
-        width: 100%;
-        box-shadow: var(--shadow-md);
-        text-transform: none;
-        letter-spacing: 0.025em;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-3px);
-        box-shadow: var(--shadow-lg);
-        background: linear-gradient(135deg, #5a6fd8 0%, #6b4190 100%);
-    }
-    
-    .stButton > button:active {
-        transform: translateY(-1px);
-    }
-    
-    /* Enhanced separators */
-    .separator {
-        border: none;
-        height: 3px;
-        background: linear-gradient(90deg, var(--primary-color), var(--secondary-color));
-        margin: var(--spacing-2xl) 0;
-        border-radius: 2px;
-        box-shadow: var(--shadow-sm);
-    }
-    
-    /* Enhanced sidebar */
-    .css-1d391kg {
-        background-color: var(--bg-secondary);
-        border-right: 2px solid var(--border-color);
-    }
-    
-    /* Enhanced input fields */
-    .stNumberInput > div > div > input {
-        border-radius: var(--border-radius-sm);
-        border: 2px solid var(--border-color);
-        padding: var(--spacing-sm) var(--spacing-md);
-        font-size: 1rem;
-        font-weight: 500;
-        transition: all 0.2s ease;
-        background-color: var(--bg-primary);
-        color: var(--text-primary);
-    }
-    
-    .stNumberInput > div > div > input:focus {
-        border-color: var(--primary-color);
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Enhanced dataframes */
-    .stDataFrame {
-        border-radius: var(--border-radius);
-        overflow: hidden;
-        box-shadow: var(--shadow-md);
-        border: none;
-    }
-    
-    .stDataFrame thead th {
-        background-color: var(--primary-color);
-        color: #ffffff;
-        font-weight: 600;
-        font-size: 1rem;
-        padding: var(--spacing-md);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    .stDataFrame tbody tr:nth-child(even) {
-        background-color: var(--bg-secondary);
-    }
+RERUN = get_profiler().start_rerun()
 
-    .stDataFrame tbody tr:hover {
-        background-color: rgba(102, 126, 234, 0.1);
-    }
-    
-    .stDataFrame td {
-        font-size: 0.95rem;
-        font-weight: 500;
-        padding: var(--spacing-sm) var(--spacing-md);
-        border-bottom: 1px solid var(--border-color);
-        color: var(--text-secondary);
-    }
-
-    /* Enhanced metrics */
-    [data-testid="stMetric"] {
-        background: var(--bg-primary);
-        border: 2px solid var(--border-color);
-        padding: var(--spacing-lg);
-        border-radius: var(--border-radius);
-        box-shadow: var(--shadow-sm);
-        transition: all 0.2s ease;
-    }
-    
-    [data-testid="stMetric"]:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-md);
-        border-color: var(--primary-color);
-    }
-    
-    [data-testid="stMetricLabel"] {
-        font-size: 1.1rem !important;
-        font-weight: 600 !important;
-        color: var(--text-secondary) !important;
-    }
-    
-    [data-testid="stMetricValue"] {
-        font-size: 2.25rem !important;
-        font-weight: 700 !important;
-        color: var(--primary-color) !important;
-    }
-    
-    /* Enhanced section headers */
-    .section-header {
-        font-size: 1.75rem;
-        font-weight: 600;
-        color: var(--text-primary);
-        margin-top: var(--spacing-xl);
-        margin-bottom: var(--spacing-lg);
-        padding-bottom: var(--spacing-sm);
-        border-bottom: 3px solid var(--primary-color);
-        display: inline-block;
-    }
-    
-    /* Input sub-headers with better contrast */
-    h5 {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: var(--text-secondary);
-        margin-top: 1.5rem;
-        margin-bottom: 0.75rem;
-    }
-
-    /* Enhanced paragraph and text contrast */
-    p {
-        color: var(--text-secondary);
-    }
-    
-    /* Streamlit specific text improvements */
-    .stMarkdown p {
-        color: var(--text-secondary);
-    }
-    
-    .stMarkdown strong {
-        color: var(--text-primary);
-        font-weight: 600;
-    }
-    
-    /* Enhanced selectbox and other inputs */
-    .stSelectbox > div > div {
-        background-color: var(--bg-primary);
-        color: var(--text-primary);
-        border-color: var(--border-color);
-    }
-    
-    /* Enhanced radio buttons */
-    .stRadio > div {
-        color: var(--text-secondary);
-    }
-    
-    .stRadio label {
-        color: var(--text-secondary) !important;
-    }
-
-    /* Responsive improvements */
-    @media (max-width: 768px) {
-        .main-header h1 {
-            font-size: 2rem;
-        }
-        
-        .main-header p {
-            font-size: 1rem;
-        }
-        
-        .main-header {
-            padding: var(--spacing-lg);
-        }
-        
-        .problem-card {
-            padding: var(--spacing-lg);
-        }
-    }
-    
-    /* Enhanced plotly charts */
-    .js-plotly-plot {
-        border-radius: var(--border-radius);
-        box-shadow: var(--shadow-sm);
-        overflow: hidden;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Stylesheet dan bundel teks dibangun sekali per proses (lihat assets.py & texts.py)
+st.markdown(style_tag(), unsafe_allow_html=True)
+RERUN.mark("css")
 
 # Helper functions
+def current_lang():
+    return st.session_state.get('lang', 'id')
+
 def get_text(key):
-    lang = st.session_state.get('lang', 'id')
-    return TEXTS[key][lang]
+    start = time.perf_counter()
+    text = text_bundle(current_lang())[key]
+    RERUN.add("text_lookup", time.perf_counter() - start)
+    return text
+
+@st.cache_resource
+def get_solve_cache():
+    """One solve cache per server process, shared by all sessions."""
+    return SolveCache()
+
+@st.cache_resource
+def get_solution_store():
+    """One on-disk solution store per server process; it survives restarts."""
+    return SolutionStore()
+
+@st.cache_resource
+def get_job_manager():
+    """One background solve pool per server process, shared by all sessions."""
+    return JobManager()
+
+# Monte Carlo memakai sebagian core saja agar server tetap responsif
+MC_POOL_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+@st.cache_resource
+def get_process_pool():
+    """One spawned worker pool per server process, shared by all Monte Carlo jobs."""
+    return ProcessPoolExecutor(max_workers=MC_POOL_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+# Solve kecil selesai di rerun yang sama; solve panjang dipantau lewat polling
+JOB_FAST_WAIT = 0.5
+JOB_POLL_INTERVAL = 1.0
+# Auto-solve menunggu sampai input tidak berubah selama jeda ini
+AUTO_SOLVE_DEBOUNCE = 0.6
+
+@lru_cache(maxsize=None)
+def main_header_html(lang):
+    texts = text_bundle(lang)
+    return f"""
+    <div class="main-header">
+        <h1>{texts['main_header_title']}</h1>
+        <p>{texts['main_header_subtitle']}</p>
+    </div>
+    """
+
+@lru_cache(maxsize=None)
+def problem_card_html(problem_key, lang):
+    texts = text_bundle(lang)
+    return f"""
+    <div class="problem-card">
+        <h2>{texts[f'{problem_key}_title']}</h2>
+        <p><strong>{texts[f'{problem_key}_desc']}</strong></p>
+    </div>
+    """
+
+def session_figures():
+    """Chart figures of this session, reused across reruns (see charts.py)."""
+    return st.session_state.setdefault('figures', {})
+
+def charts_enabled():
+    return st.session_state.get('show_charts', True)
 
 def format_interpretation(text):
     """Replaces markdown bold with HTML strong tags for safe rendering."""
@@ -806,7 +129,7 @@ def main():
     with st.sidebar:
         lang_map = {"Bahasa Indonesia": "id", "English": "en"}
         lang_choice = st.radio(
-            TEXTS["lang_select_label"],
+            get_text("lang_select_label"),
             lang_map.keys(),
             index=list(lang_map.values()).index(st.session_state.lang),
             key="lang_radio"
@@ -816,7 +139,8 @@ def main():
         st.markdown(f"### {get_text('sidebar_problem_select_header')}")
         problem_options = {
             "p1": get_text("p1_title"),
-            "p2": get_text("p2_title")
+            "p2": get_text("p2_title"),
+            "p3": get_text("p3_title")
         }
         problem_key = st.selectbox(
             "Problem:",
@@ -831,28 +155,40 @@ def main():
         st.markdown(f"### {get_text('sidebar_info_header')}")
         st.info(get_text(f"{problem_key}_info"))
         
+        st.toggle(get_text('sidebar_show_charts'), value=True, key="show_charts", help=get_text('sidebar_show_charts_help'))
+        st.toggle(get_text('sidebar_incremental'), value=True, key="incremental", help=get_text('sidebar_incremental_help'))
+        st.toggle(get_text('sidebar_store'), value=True, key="solution_store", help=get_text('sidebar_store_help'))
+
         st.markdown(f"### {get_text('sidebar_method_header')}")
         st.markdown("- **Algorithm**: Simplex\n- **Solver**: SciPy HiGHS\n- **Type**: Linear Programming")
+        st.number_input(get_text('sidebar_time_limit'), min_value=0.0, value=0.0, step=5.0, key="time_limit", help=get_text('sidebar_time_limit_help'))
+        st.caption(get_text('sidebar_jobs_active').format(active=get_job_manager().active_count()))
+
+        with st.expander(get_text('sidebar_cache_header')):
+            cache_stats = get_solve_cache().stats()
+            st.markdown(get_text('sidebar_cache_stats').format(**cache_stats))
+            if store_enabled():
+                st.markdown(get_text('sidebar_store_stats').format(**get_solution_store().stats()))
+
+        with st.expander(get_text('sidebar_profile_header')):
+            profile = get_profiler().summary()
+            if profile:
+                st.caption(get_text('sidebar_profile_caption').format(reruns=get_profiler().reruns))
+                st.dataframe(pd.DataFrame(profile).T.round(2), use_container_width=True)
+            st.download_button(get_text('sidebar_profile_download'), get_profiler().to_json(), file_name="profile.json", mime="application/json", key="profile_download")
     
-    st.markdown(f"""
-    <div class="main-header">
-        <h1>{get_text('main_header_title')}</h1>
-        <p>{get_text('main_header_subtitle')}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(main_header_html(current_lang()), unsafe_allow_html=True)
     
     if problem_key == "p1":
         problem_13_8_5()
-    else:
+    elif problem_key == "p2":
         problem_13_8_9()
+    else:
+        custom_model()
 
 def problem_13_8_5():
-    st.markdown(f"""
-    <div class="problem-card">
-        <h2>{get_text('p1_title')}</h2>
-        <p><strong>{get_text('p1_desc')}</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
+    widgets_start = time.perf_counter()
+    st.markdown(problem_card_html('p1', current_lang()), unsafe_allow_html=True)
     with st.expander(get_text('p1_guide_header')):
         st.markdown(get_text('p1_guide_content'))    
     st.markdown(f'<h2 class="section-header">{get_text("input_parameters_header")}</h2>', unsafe_allow_html=True)
@@ -861,8 +197,8 @@ def problem_13_8_5():
     
     with col1:
         st.markdown(f"<h5>{get_text('p1_obj_func_header')}</h5>", unsafe_allow_html=True)
-        variables = ['x₁₁ (Gergaji Reg)', 'x₁₂ (Gergaji OT)', 'x₂₁ (Bor Reg)', 'x₂₂ (Bor OT)']
-        obj_defaults = [150, 50, 100, 75]
+        variables = P1_VARIABLES
+        obj_defaults = P1_DEFAULTS["obj_coeffs"]
         
         c_cols = st.columns(4)
         obj_coeffs = []
@@ -873,28 +209,39 @@ def problem_13_8_5():
         st.markdown(f"<h5>{get_text('p1_constraints_header')}</h5>", unsafe_allow_html=True)
         
         st.write(f"**{get_text('p1_constraint1_label')}**")
-        a1_defaults = [1, 1, 1, 1]
+        a1_defaults = P1_DEFAULTS["A_ub"][0]
         constraint1_coeffs = []
         a1_cols = st.columns(5)
         for i, default in enumerate(a1_defaults):
             with a1_cols[i]:
                 constraint1_coeffs.append(st.number_input(f"a₁{i+1}", value=default, key=f"c1_13_8_5_{i}", label_visibility="collapsed"))
         with a1_cols[4]:
-            b1 = st.number_input("**≤ RHS₁**", value=10000, key="b1_13_8_5", label_visibility="collapsed")
+            b1 = st.number_input("**≤ RHS₁**", value=P1_DEFAULTS["b_ub"][0], key="b1_13_8_5", label_visibility="collapsed")
         
         st.write(f"**{get_text('p1_constraint2_label')}**")
-        a2_defaults = [2, 2, 1, 1]
+        a2_defaults = P1_DEFAULTS["A_ub"][1]
         constraint2_coeffs = []
         a2_cols = st.columns(5)
         for i, default in enumerate(a2_defaults):
             with a2_cols[i]:
                 constraint2_coeffs.append(st.number_input(f"a₂{i+1}", value=default, key=f"c2_13_8_5_{i}", label_visibility="collapsed"))
         with a2_cols[4]:
-            b2 = st.number_input("**≤ RHS₂**", value=15000, key="b2_13_8_5", label_visibility="collapsed")
+            b2 = st.number_input("**≤ RHS₂**", value=P1_DEFAULTS["b_ub"][1], key="b2_13_8_5", label_visibility="collapsed")
+
+        st.markdown(f"<h5>{get_text('p1_integer_header')}</h5>", unsafe_allow_html=True)
+        int_cols = st.columns([2, 1, 1])
+        with int_cols[0]:
+            integer_vars = st.multiselect(get_text('p1_integer_label'), range(len(variables)), format_func=lambda j: variables[j], key="integer_13_8_5", help=get_text('p1_integer_help'))
+        with int_cols[1]:
+            mip_gap = st.number_input(get_text('p1_mip_gap_label'), min_value=0.0, max_value=100.0, value=0.01, step=0.1, format="%.2f", key="mip_gap_13_8_5", disabled=not integer_vars)
+        with int_cols[2]:
+            node_limit = st.number_input(get_text('p1_node_limit_label'), min_value=0, value=0, step=1000, key="node_limit_13_8_5", disabled=not integer_vars, help=get_text('p1_node_limit_help'))
+        integrality = np.isin(np.arange(len(variables)), integer_vars).astype(int)
+        mip_options = {"mip_rel_gap": mip_gap / 100, "node_limit": node_limit or None} if integer_vars else None
     
     with col2:
         st.markdown(f"<h5>{get_text('p1_bounds_header')}</h5>", unsafe_allow_html=True)
-        bounds_defaults = [3000, 2000, 5000, 3000]
+        bounds_defaults = P1_DEFAULTS["upper_bounds"]
         bounds = []
         for i, (var, default) in enumerate(zip(variables, bounds_defaults)):
             bounds.append((0, st.number_input(f"**Max {var.split(' ')[0]}**", value=default, key=f"bound_13_8_5_{i}")))
@@ -913,18 +260,257 @@ def problem_13_8_5():
     st.markdown(f'<h2 class="section-header">{get_text("solve_optimization_header")}</h2>', unsafe_allow_html=True)
     
     _, solve_col, _ = st.columns([1, 2, 1])
+    RERUN.add("widgets", time.perf_counter() - widgets_start)
     with solve_col:
-        if st.button(get_text('p1_solve_button'), key="solve_13_8_5"):
-            result = linprog(-np.array(obj_coeffs), A_ub=[constraint1_coeffs, constraint2_coeffs], b_ub=[b1, b2], bounds=bounds, method='highs')
-            display_results_13_8_5(result, variables, obj_coeffs, [constraint1_coeffs, constraint2_coeffs], [b1, b2], bounds)
+        auto = st.toggle(get_text('auto_solve_label'), key="auto_13_8_5", help=get_text('auto_solve_help'))
+        if st.button(get_text('p1_solve_button'), key="solve_13_8_5") or auto:
+            with RERUN.phase("model_build"):
+                model = build_13_8_5(obj_coeffs, [constraint1_coeffs, constraint2_coeffs], [b1, b2], bounds, integrality)
+            solve = auto_solve if auto else submit_solve
+            solve("13_8_5", model, variables, obj_coeffs, [constraint1_coeffs, constraint2_coeffs], [b1, b2], bounds, integrality, options=mip_options)
+        solve_job_panel("13_8_5", display_results_13_8_5)
+
+    parametric_mode_13_8_5(obj_coeffs, [constraint1_coeffs, constraint2_coeffs], [b1, b2], bounds)
+    pareto_mode_13_8_5(variables, obj_coeffs, [constraint1_coeffs, constraint2_coeffs], [b1, b2], bounds)
+    multi_period_mode_13_8_5(obj_coeffs, [constraint1_coeffs, constraint2_coeffs], [b1, b2], bounds)
+    monte_carlo_mode("13_8_5", variables, {"obj_coeffs": obj_coeffs, "A_ub": [constraint1_coeffs, constraint2_coeffs],
+                                           "b_ub": [b1, b2], "upper_bounds": [ub for _, ub in bounds]})
+    stored_runs_panel("13_8_5")
+    batch_mode_13_8_5()
+
+def parametric_mode_13_8_5(obj_coeffs, A_ub, b_ub, bounds):
+    with st.expander(get_text('p1_param_header')):
+        st.markdown(get_text('p1_param_help'))
+        p_cols = st.columns(3)
+        with p_cols[0]:
+            row = st.radio(get_text('p1_param_rhs_label'), [0, 1], format_func=lambda i: f"RHS{'₁₂'[i]}", horizontal=True, key="param_row_13_8_5")
+        with p_cols[1]:
+            lo = st.number_input(get_text('p1_param_lo_label'), value=0, min_value=0, key="param_lo_13_8_5")
+        with p_cols[2]:
+            hi = st.number_input(get_text('p1_param_hi_label'), value=int(max(0, 2 * b_ub[row])), min_value=0, key="param_hi_13_8_5")
+
+        if st.button(get_text('p1_param_button'), key="param_solve_13_8_5"):
+            try:
+                curve = parametric_rhs_13_8_5(obj_coeffs, A_ub, b_ub, bounds, row, lo, hi)
+            except ValueError as e:
+                st.markdown(f"<div class='error-alert'>{get_text('error_message')} {e}</div>", unsafe_allow_html=True)
+                return
+            st.markdown(f"<div class='success-alert'>{get_text('p1_param_summary').format(breakpoints=len(curve['rhs']), solves=curve['n_solves'])}</div>", unsafe_allow_html=True)
+            fig = go.Figure(go.Scatter(x=curve['rhs'], y=curve['profit'], mode="lines+markers"))
+            fig.update_layout(title=get_text('p1_param_chart_title'), xaxis_title=f"RHS{'₁₂'[row]}", yaxis_title=get_text('p1_metric_profit'))
+            st.plotly_chart(fig, use_container_width=True)
+            segments_df = pd.DataFrame({
+                get_text('p1_param_from_col'): curve['rhs'][:-1],
+                get_text('p1_param_to_col'): curve['rhs'][1:],
+                get_text('p1_param_shadow_col'): curve['shadow_price'],
+            })
+            st.dataframe(segments_df, use_container_width=True, hide_index=True)
+
+def pareto_mode_13_8_5(variables, obj_coeffs, A_ub, b_ub, bounds):
+    with st.expander(get_text('p1_pareto_header')):
+        st.markdown(get_text('p1_pareto_help'))
+        if st.button(get_text('pareto_button'), key="pareto_solve_13_8_5"):
+            try:
+                frontier = pareto_13_8_5(obj_coeffs, A_ub, b_ub, bounds)
+            except ValueError as e:
+                st.markdown(f"<div class='error-alert'>{get_text('error_message')} {e}</div>", unsafe_allow_html=True)
+                return
+            show_pareto_frontier(frontier, variables, "p1")
+
+def pareto_mode_13_8_9(variables, obj_coeffs, cost_coeffs, cost_limit, bounds):
+    with st.expander(get_text('p2_pareto_header')):
+        st.markdown(get_text('p2_pareto_help'))
+        max_budget = st.number_input(get_text('p2_pareto_max_budget_label'), value=0, min_value=0, step=5000,
+                                     help=get_text('p2_pareto_max_budget_help'), key="pareto_max_budget_13_8_9")
+        if st.button(get_text('pareto_button'), key="pareto_solve_13_8_9"):
+            try:
+                frontier = pareto_13_8_9(obj_coeffs, cost_coeffs, bounds, max_budget=max_budget or None)
+            except ValueError as e:
+                st.markdown(f"<div class='error-alert'>{get_text('error_message')} {e}</div>", unsafe_allow_html=True)
+                return
+            show_pareto_frontier(frontier, variables, "p2", marker=cost_limit)
+
+def show_pareto_frontier(frontier, variables, prefix, marker=None):
+    """Chart and breakpoint table of a frontier from ``pareto``; ``marker`` marks the current setting."""
+    st.markdown(f"<div class='success-alert'>{get_text('pareto_summary').format(points=len(frontier['epsilon']), solves=frontier['n_solves'], reused=frontier['n_reused'])}</div>", unsafe_allow_html=True)
+    criterion_label, value_label = get_text(f'{prefix}_pareto_criterion_label'), get_text(f'{prefix}_pareto_value_label')
+    fig = go.Figure(go.Scatter(x=frontier['epsilon'], y=frontier['value'], mode="lines+markers"))
+    if marker is not None:
+        fig.add_vline(x=marker, line_dash="dash", annotation_text=get_text('pareto_current_label'))
+    fig.update_layout(title=get_text(f'{prefix}_pareto_chart_title'), xaxis_title=criterion_label, yaxis_title=value_label)
+    st.plotly_chart(fig, use_container_width=True)
+    points_df = pd.DataFrame(frontier['x'], columns=variables)
+    points_df.insert(0, value_label, frontier['value'])
+    points_df.insert(0, criterion_label, frontier['epsilon'])
+    # Trade-off berlaku pada segmen menuju titik berikutnya
+    points_df[get_text('pareto_trade_off_col')] = np.append(frontier['trade_off'], np.nan)
+    st.dataframe(points_df, use_container_width=True, hide_index=True)
+    export_buttons(points_df, f"pareto_{prefix}", get_text('export_download'))
+
+def multi_period_mode_13_8_5(obj_coeffs, A_ub, b_ub, bounds):
+    with st.expander(get_text('p1_multi_header')):
+        st.markdown(get_text('p1_multi_help'))
+        m_cols = st.columns(4)
+        with m_cols[0]:
+            periods = st.number_input(get_text('p1_multi_periods_label'), value=DEFAULT_PERIODS, min_value=1, max_value=10_000, key="multi_periods_13_8_5")
+            demand_base = st.number_input(get_text('p1_multi_demand_label'), value=9000, min_value=0, key="multi_demand_13_8_5")
+        with m_cols[1]:
+            amplitude = st.slider(get_text('p1_multi_season_label'), 0, 100, 30, key="multi_season_13_8_5")
+            holding_cost = st.number_input(get_text('p1_multi_holding_label'), value=5.0, min_value=0.0, key="multi_holding_13_8_5")
+        with m_cols[2]:
+            initial_inventory = st.number_input(get_text('p1_multi_initial_label'), value=0, min_value=0, key="multi_initial_13_8_5")
+            max_inventory = st.number_input(get_text('p1_multi_max_inv_label'), value=20000, min_value=0, key="multi_max_inv_13_8_5")
+        with m_cols[3]:
+            rolling = st.toggle(get_text('p1_multi_rolling_label'), value=False, key="multi_rolling_13_8_5", help=get_text('p1_multi_rolling_help'))
+            horizon = st.number_input(get_text('p1_multi_horizon_label'), value=13, min_value=1, key="multi_horizon_13_8_5", disabled=not rolling)
+
+        if st.button(get_text('p1_multi_button'), key="multi_solve_13_8_5"):
+            inputs = period_inputs(periods, seasonal_demand(periods, demand_base, amplitude / 100), obj_coeffs, A_ub, b_ub,
+                                   [ub for _, ub in bounds], holding_cost, max_inventory)
+            start = time.perf_counter()
+            plan = solve_multi_period_13_8_5(inputs, initial_inventory, horizon=horizon if rolling else None)
+            elapsed = time.perf_counter() - start
+            if not plan['success']:
+                st.markdown(f"<div class='error-alert'>{get_text('error_message')} {plan['message']}</div>", unsafe_allow_html=True)
+                return
+            st.markdown(f"<div class='success-alert'>{get_text('p1_multi_summary').format(periods=periods, vars=periods * N_PERIOD_VARS, solves=plan['n_solves'], seconds=elapsed)}</div>", unsafe_allow_html=True)
+            st.metric(get_text('p1_metric_profit'), f"${plan['profit']:,.2f}")
+
+            labels = [var.split(' ')[0] for var in P1_VARIABLES]
+            plan_df = pd.DataFrame(plan['production'], columns=labels)
+            plan_df.insert(0, get_text('p1_multi_period_col'), np.arange(1, periods + 1))
+            plan_df[get_text('p1_multi_demand_col')] = inputs['demand']
+            plan_df[get_text('p1_multi_sales_col')] = plan['sales']
+            plan_df[get_text('p1_multi_inventory_col')] = plan['inventory']
+            if charts_enabled():
+                fig = go.Figure()
+                for col in (get_text('p1_multi_demand_col'), get_text('p1_multi_sales_col'), get_text('p1_multi_inventory_col')):
+                    fig.add_trace(go.Scatter(x=plan_df[get_text('p1_multi_period_col')], y=plan_df[col], mode="lines", name=col))
+                fig.add_trace(go.Scatter(x=plan_df[get_text('p1_multi_period_col')], y=plan['production'].sum(axis=1), mode="lines", name=get_text('p1_metric_production')))
+                fig.update_layout(title=get_text('p1_multi_chart_title'), xaxis_title=get_text('p1_multi_period_col'), yaxis_title=get_text('chart_units_label'))
+                st.plotly_chart(fig, use_container_width=True)
+            st.dataframe(plan_df, use_container_width=True, hide_index=True)
+            export_buttons(plan_df, "plan_13_8_5", get_text('p1_multi_download'))
+
+def monte_carlo_mode(problem, variables, inputs):
+    """Monte Carlo robustness expander; ``problem`` is "13_8_5" (uncertain profits) or "13_8_9" (uncertain costs)."""
+    prefix = "p1" if problem == "13_8_5" else "p2"
+    with st.expander(get_text('mc_header')):
+        st.markdown(get_text(f'{prefix}_mc_help'))
+        mc_cols = st.columns(4)
+        with mc_cols[0]:
+            n_samples = st.number_input(get_text('mc_samples_label'), value=2000, min_value=10, max_value=1_000_000, step=1000, key=f"mc_samples_{problem}")
+        with mc_cols[1]:
+            spread = st.number_input(get_text('mc_spread_label'), value=10.0, min_value=0.0, max_value=100.0, key=f"mc_spread_{problem}")
+        with mc_cols[2]:
+            dist = st.selectbox(get_text('mc_dist_label'), DISTRIBUTIONS, format_func=lambda d: get_text(f'mc_dist_{d}'), key=f"mc_dist_{problem}")
+        with mc_cols[3]:
+            seed = st.number_input(get_text('mc_seed_label'), value=0, min_value=0, key=f"mc_seed_{problem}")
+
+        if st.button(get_text('mc_button'), key=f"mc_solve_{problem}"):
+            # Berjalan sebagai job di latar belakang; rerun skrip tidak menunggu
+            st.session_state[f"mc_job_{problem}"] = get_job_manager().submit_task(
+                monte_carlo, problem, n_samples, spread / 100, dist, inputs, seed=seed, pool=get_process_pool())
+        monte_carlo_panel(problem, variables)
+
+def monte_carlo_panel(problem, variables):
+    """Progress of the running Monte Carlo job of ``problem``, or its result once finished."""
+    job_id = st.session_state.get(f"mc_job_{problem}")
+    job = get_job_manager().get(job_id) if job_id else None
+    if job is None:
+        return
+    if not job.done():
+        solve_job_progress(f"mc_{problem}", job.id)
+    elif job.status == DONE:
+        show_monte_carlo(problem, variables, job.result, job.elapsed())
+    elif job.status == CANCELLED:
+        st.info(get_text('job_cancelled'))
+    else:
+        st.markdown(f"<div class='error-alert'>{get_text('error_message')} {job.error}</div>", unsafe_allow_html=True)
+
+def show_monte_carlo(problem, variables, summary, seconds):
+    prefix = "p1" if problem == "13_8_5" else "p2"
+    report = summary.report()
+    st.markdown(f"<div class='success-alert'>{get_text('mc_summary').format(n=report['n'], failed=report['n_failed'], reused=report['n_reused'], seconds=seconds)}</div>", unsafe_allow_html=True)
+    q = report['quantiles']
+    value_label = get_text(f'{prefix}_mc_value_label')
+    m_cols = st.columns(4)
+    m_cols[0].metric(get_text('mc_mean_label').format(value=value_label), f"{report['mean']:,.2f}")
+    m_cols[1].metric(get_text('mc_std_label'), f"{report['std']:,.2f}")
+    m_cols[2].metric("P5", f"{q[0.05]:,.2f}")
+    m_cols[3].metric("P95", f"{q[0.95]:,.2f}")
+    if charts_enabled():
+        fig = histogram_chart(session_figures(), f"mc_hist_{problem}_{current_lang()}", summary.sample(), get_text('mc_chart_title').format(value=value_label), value_label, get_text('mc_count_label'))
+        st.plotly_chart(fig, use_container_width=True)
+    frequency_df = pd.DataFrame({
+        get_text('df_variable_col'): variables,
+        get_text('mc_mean_x_col'): report['mean_x'],
+        get_text('mc_basic_col'): report['basic_frequency'] * 100,
+        get_text('mc_positive_col'): report['positive_frequency'] * 100,
+    })
+    st.dataframe(frequency_df, use_container_width=True, hide_index=True)
+    patterns_df = pd.DataFrame(report['basis_patterns'][:10], columns=[get_text('mc_pattern_col'), get_text('mc_count_label')])
+    st.markdown(f"<h5>{get_text('mc_patterns_header')}</h5>", unsafe_allow_html=True)
+    st.dataframe(patterns_df, use_container_width=True, hide_index=True)
+
+def stored_runs_panel(problem):
+    """Range query over the scenarios of ``problem`` in the on-disk solution store."""
+    if not store_enabled():
+        return
+    with st.expander(get_text('store_header')):
+        st.markdown(get_text('store_help'))
+        store = get_solution_store()
+        names = store.param_names(problem)
+        if not names:
+            st.info(get_text('store_empty'))
+            return
+        default = "cost_limit" if "cost_limit" in names else names[0]
+        q_cols = st.columns(3)
+        with q_cols[0]:
+            name = st.selectbox(get_text('store_param_label'), names, index=names.index(default), key=f"store_param_{problem}")
+        with q_cols[1]:
+            low = st.number_input(get_text('store_low_label'), value=0.0, key=f"store_low_{problem}")
+        with q_cols[2]:
+            high = st.number_input(get_text('store_high_label'), value=1e9, key=f"store_high_{problem}")
+        if st.button(get_text('store_query_button'), key=f"store_query_{problem}"):
+            runs = store.query(problem, {name: (low, high)})
+            st.caption(get_text('store_found').format(count=len(runs)))
+            if runs:
+                runs_df = pd.DataFrame([{
+                    get_text('store_col_created'): pd.Timestamp(run['created'], unit='s'),
+                    get_text('store_col_objective'): run['objective'],
+                    get_text('store_col_solve_s'): run['solve_s'],
+                    **run['params'],
+                } for run in runs])
+                st.dataframe(runs_df, use_container_width=True, hide_index=True)
+                export_buttons(runs_df, f"stored_runs_{problem}", get_text('export_download'))
+
+def batch_mode_13_8_5():
+    with st.expander(get_text('p1_batch_header')):
+        st.markdown(get_text('p1_batch_help'))
+        uploaded = st.file_uploader(get_text('p1_batch_upload_label'), type="csv", key="batch_upload_13_8_5")
+        scenarios = pd.read_csv(uploaded) if uploaded is not None else default_scenarios_13_8_5()
+        scenarios = st.data_editor(scenarios, num_rows="dynamic", use_container_width=True, key="batch_editor_13_8_5")
+        use_presolve = st.checkbox(get_text('p1_batch_presolve_label'), value=False, help=get_text('p1_batch_presolve_help'), key="batch_presolve_13_8_5")
+
+        if st.button(get_text('p1_batch_solve_button'), key="batch_solve_13_8_5"):
+            try:
+                batch_results = solve_batch_13_8_5(scenarios, presolve=use_presolve)
+            except ValueError as e:
+                st.markdown(f"<div class='error-alert'>{get_text('error_message')} {e}</div>", unsafe_allow_html=True)
+                return
+            n_ok = int(batch_results["success"].sum())
+            st.markdown(f"<div class='success-alert'>{get_text('p1_batch_summary').format(solved=n_ok, total=len(batch_results))}</div>", unsafe_allow_html=True)
+            if use_presolve:
+                st.caption(get_text('p1_batch_presolve_summary').format(
+                    vars=int(batch_results["presolve_removed_vars"].sum()), rows=int(batch_results["presolve_removed_rows"].sum()),
+                    presolve_ms=batch_results["presolve_ms"].sum(), solve_ms=batch_results["solve_ms"].sum()))
+            st.dataframe(batch_results, use_container_width=True)
+            export_buttons(pd.concat([scenarios, batch_results], axis=1), "batch_13_8_5", get_text('p1_batch_download'))
 
 def problem_13_8_9():
-    st.markdown(f"""
-    <div class="problem-card">
-        <h2>{get_text('p2_title')}</h2>
-        <p><strong>{get_text('p2_desc')}</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
+    widgets_start = time.perf_counter()
+    st.markdown(problem_card_html('p2', current_lang()), unsafe_allow_html=True)
     with st.expander(get_text('p2_guide_header')):
         st.markdown(get_text('p2_guide_content'))    
     st.markdown(f'<h2 class="section-header">{get_text("input_parameters_header")}</h2>', unsafe_allow_html=True)
@@ -933,8 +519,8 @@ def problem_13_8_9():
     
     with col1:
         st.markdown(f"<h5>{get_text('p2_obj_func_header')}</h5>", unsafe_allow_html=True)
-        variables = ['x₁ᴿ (Reguler P1)', 'x₁ᴼ (Lembur P1)', 'x₂ᴿ (Reguler P2)', 'x₂ᴼ (Lembur P2)']
-        obj_defaults = [1, 1, 1, 1]
+        variables = P2_VARIABLES
+        obj_defaults = P2_DEFAULTS["obj_coeffs"]
         c_cols = st.columns(4)
         obj_coeffs = []
         for i, (var, default) in enumerate(zip(variables, obj_defaults)):
@@ -942,18 +528,18 @@ def problem_13_8_9():
                 obj_coeffs.append(st.number_input(f"**{var}**", value=default, key=f"obj_13_8_9_{i}"))
         
         st.markdown(f"<h5>{get_text('p2_budget_header')}</h5>", unsafe_allow_html=True)
-        cost_defaults = [15, 25, 16, 24]
+        cost_defaults = P2_DEFAULTS["cost_coeffs"]
         cost_coeffs = []
         cost_cols = st.columns(5)
         for i, default in enumerate(cost_defaults):
             with cost_cols[i]:
                 cost_coeffs.append(st.number_input(f"**Cost {i+1}**", value=default, key=f"cost_13_8_9_{i}", label_visibility="collapsed"))
         with cost_cols[4]:
-            cost_limit = st.number_input("**≤ Budget**", value=60000, key="cost_limit_13_8_9", label_visibility="collapsed")
+            cost_limit = st.number_input("**≤ Budget**", value=P2_DEFAULTS["cost_limit"], key="cost_limit_13_8_9", label_visibility="collapsed")
     
     with col2:
         st.markdown(f"<h5>{get_text('p2_capacity_header')}</h5>", unsafe_allow_html=True)
-        bounds_defaults = [2000, 1000, 1000, 500]
+        bounds_defaults = P2_DEFAULTS["upper_bounds"]
         bounds = []
         for i, (var, default) in enumerate(zip(variables, bounds_defaults)):
             bounds.append((0, st.number_input(f"**Max {var.split(' ')[0]}**", value=default, key=f"bound_13_8_9_{i}")))
@@ -972,29 +558,260 @@ def problem_13_8_9():
     st.markdown(f'<h2 class="section-header">{get_text("solve_optimization_header")}</h2>', unsafe_allow_html=True)
     
     _, solve_col, _ = st.columns([1, 2, 1])
+    RERUN.add("widgets", time.perf_counter() - widgets_start)
     with solve_col:
-        if st.button(get_text('p2_solve_button'), key="solve_13_8_9"):
-            result = linprog(-np.array(obj_coeffs), A_ub=[cost_coeffs], b_ub=[cost_limit], bounds=bounds, method='highs')
-            display_results_13_8_9(result, variables, obj_coeffs, cost_coeffs, cost_limit, bounds)
+        auto = st.toggle(get_text('auto_solve_label'), key="auto_13_8_9", help=get_text('auto_solve_help'))
+        if st.button(get_text('p2_solve_button'), key="solve_13_8_9") or auto:
+            with RERUN.phase("model_build"):
+                model = build_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds)
+            solve = auto_solve if auto else submit_solve
+            solve("13_8_9", model, variables, obj_coeffs, cost_coeffs, cost_limit, bounds)
+        solve_job_panel("13_8_9", display_results_13_8_9)
+
+    pareto_mode_13_8_9(variables, obj_coeffs, cost_coeffs, cost_limit, bounds)
+    monte_carlo_mode("13_8_9", variables, {"obj_coeffs": obj_coeffs, "cost_coeffs": cost_coeffs,
+                                           "cost_limit": cost_limit, "upper_bounds": [ub for _, ub in bounds]})
+    stored_runs_panel("13_8_9")
+
+def custom_model():
+    st.markdown(problem_card_html('p3', current_lang()), unsafe_allow_html=True)
+    with st.expander(get_text('p3_guide_header')):
+        st.markdown(get_text('p3_guide_content'))
+    st.markdown(f'<h2 class="section-header">{get_text("input_parameters_header")}</h2>', unsafe_allow_html=True)
+
+    file_types = ["csv", "parquet"]
+    up_cols = st.columns(3)
+    with up_cols[0]:
+        variables_file = st.file_uploader(get_text('p3_variables_upload'), type=file_types, key="upload_vars_custom")
+    with up_cols[1]:
+        constraints_file = st.file_uploader(get_text('p3_constraints_upload'), type=file_types, key="upload_cons_custom")
+    with up_cols[2]:
+        matrix_file = st.file_uploader(get_text('p3_matrix_upload'), type=file_types, key="upload_matrix_custom")
+    sense = st.radio(get_text('p3_sense_label'), ["max", "min"], format_func=lambda k: get_text(f'p3_sense_{k}'), horizontal=True, key="sense_custom")
+
+    st.markdown('<div class="separator"></div>', unsafe_allow_html=True)
+    st.markdown(f'<h2 class="section-header">{get_text("solve_optimization_header")}</h2>', unsafe_allow_html=True)
 
-def display_results_13_8_5(result, variables, obj_coeffs, A_ub, b_ub, bounds):
+    _, solve_col, _ = st.columns([1, 2, 1])
+    with solve_col:
+        ready = variables_file is not None and constraints_file is not None and matrix_file is not None
+        if st.button(get_text('p3_solve_button'), key="solve_custom", disabled=not ready):
+            try:
+                with RERUN.phase("model_build"):
+                    model = read_model(variables_file, constraints_file, matrix_file, sense=sense)
+            except (ValueError, KeyError, ImportError) as e:
+                st.markdown(f"<div class='error-alert'>{get_text('p3_import_error')} {e}</div>", unsafe_allow_html=True)
+                return
+            submit_solve("custom", model, model)
+        solve_job_panel("custom", display_results_custom)
+
+def incremental_enabled():
+    return st.session_state.get('incremental', True)
+
+def store_enabled():
+    return st.session_state.get('solution_store', True)
+
+def session_incremental(key_suffix):
+    """Last model and optimal basis of this problem in this session (see incremental.py)."""
+    return st.session_state.setdefault(f"incremental_{key_suffix}", IncrementalSolver())
+
+def submit_solve(key_suffix, model, *display_args, options=None):
+    """Submits a background solve, replacing (and cancelling) the previous job of this problem.
+
+    ``display_args`` are stored with the job ID and passed to the display
+    function once the job has finished. ``options`` are extra HiGHS options.
+    The on-disk solution store is checked first. In incremental mode the
+    previous optimal basis (or, in a new session, the basis of the nearest
+    stored scenario) is checked next and the job is skipped when it is still
+    optimal.
+    """
+    manager = get_job_manager()
+    previous = st.session_state.get(f"job_{key_suffix}")
+    if previous is not None and 'id' in previous:
+        manager.cancel(previous['id'])
+    store = get_solution_store() if store_enabled() else None
+    if store is not None:
+        with RERUN.phase("solve"):
+            result = store.get(model_key(model, DEFAULT_METHOD, options))
+        if result is not None:
+            st.session_state[f"job_{key_suffix}"] = {"result": result, "args": display_args, "stored": True}
+            return
+    if incremental_enabled():
+        incremental = session_incremental(key_suffix)
+        with RERUN.phase("solve"):
+            if store is not None and key_suffix in MODEL_BUILDERS:
+                store.seed_incremental(incremental, key_suffix, model, MODEL_BUILDERS[key_suffix])
+            result = incremental.reuse(model)
+        if result is not None:
+            if store is not None:
+                store.put(model_key(model, DEFAULT_METHOD, options), key_suffix, model, result, 0.0)
+            st.session_state[f"job_{key_suffix}"] = {"result": result, "args": display_args, "changes": incremental.last_changes}
+            return
+    job_id = manager.submit(model, time_limit=st.session_state.get('time_limit') or None, cache=get_solve_cache(), options=options)
+    st.session_state[f"job_{key_suffix}"] = {"id": job_id, "args": display_args, "model": model, "options": options}
+    with RERUN.phase("solve"):
+        manager.wait(job_id, JOB_FAST_WAIT)
+
+def auto_solve(key_suffix, model, *display_args, options=None):
+    """Debounced, deduplicated auto-solve: a model is submitted once its inputs stop changing.
+
+    Every rerun with new inputs restarts the debounce timer; inputs that were
+    already solved are not submitted again.
+    """
+    key = model_key(model, DEFAULT_METHOD, options)
+    state = st.session_state.setdefault(f"autosolve_{key_suffix}", {"solved_key": None, "pending": None})
+    if key == state['solved_key']:
+        state['pending'] = None
+        return
+    if state['pending'] is None or state['pending']['key'] != key:
+        state['pending'] = {"key": key, "since": time.time(), "model": model, "args": display_args, "options": options}
+    auto_solve_timer(key_suffix)
+
+@st.fragment(run_every=AUTO_SOLVE_DEBOUNCE / 2)
+def auto_solve_timer(key_suffix):
+    state = st.session_state.get(f"autosolve_{key_suffix}")
+    pending = state and state['pending']
+    if not pending:
+        return
+    if time.time() - pending['since'] < AUTO_SOLVE_DEBOUNCE:
+        st.caption(get_text('auto_solve_waiting'))
+        return
+    state['pending'] = None
+    state['solved_key'] = pending['key']
+    shown = st.session_state.get(f"shown_{key_suffix}")
+    submit_solve(key_suffix, pending['model'], *pending['args'], options=pending['options'])
+    result = finished_result(st.session_state[f"job_{key_suffix}"])
+    # Hasil tampil ulang hanya jika optimumnya berubah
+    if result is not None and shown is not None and same_optimum(result, shown):
+        st.caption(get_text('auto_solve_unchanged'))
+        return
+    st.rerun()
+
+def finished_result(entry):
+    """The result of a panel entry if it is already available, otherwise None."""
+    if 'result' in entry:
+        return entry['result']
+    job = get_job_manager().get(entry['id'])
+    return job.result if job is not None and job.done() else None
+
+def same_optimum(result, shown, tol=1e-9):
+    x, fun = shown
+    return (result.x is not None and x is not None and np.allclose(result.x, x, rtol=tol, atol=tol)
+            and np.isclose(result.fun, fun, rtol=tol, atol=tol))
+
+def solve_job_panel(key_suffix, display):
+    """Shows the result of this problem's last job, or its progress while it still runs."""
+    entry = st.session_state.get(f"job_{key_suffix}")
+    if entry is None:
+        return
+    if 'result' in entry:
+        if entry.get('stored'):
+            st.caption(get_text('store_reused'))
+        else:
+            st.caption(get_text('incremental_reused').format(changes=", ".join(entry['changes']) or "-"))
+        st.session_state[f"shown_{key_suffix}"] = (entry['result'].x, entry['result'].fun)
+        display(entry['result'], *entry['args'])
+        return
+    job = get_job_manager().get(entry['id'])
+    if job is None:
+        del st.session_state[f"job_{key_suffix}"]
+        return
+    if not job.done():
+        solve_job_progress(key_suffix, job.id)
+    elif job.status in (DONE, TIME_LIMIT):
+        model = entry.pop('model', None)
+        if model is not None:
+            if incremental_enabled():
+                session_incremental(key_suffix).update(model, job.result)
+            if store_enabled():
+                get_solution_store().put(model_key(model, DEFAULT_METHOD, entry.get('options')), key_suffix, model, job.result, job.elapsed())
+        st.session_state[f"shown_{key_suffix}"] = (job.result.x, job.result.fun)
+        display(job.result, *entry['args'])
+    elif job.status == CANCELLED:
+        st.info(get_text('job_cancelled'))
+    else:
+        st.markdown(f"<div class='error-alert'>{get_text('error_message')} {job.error}</div>", unsafe_allow_html=True)
+
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def solve_job_progress(key_suffix, job_id):
+    status = get_job_manager().poll(job_id)
+    if status is None or status['status'] in FINISHED_STATES:
+        st.rerun()
+    st.progress(status['progress'], text=get_text('job_running').format(id=job_id, elapsed=status['elapsed_s']))
+    if st.button(get_text('job_cancel_button'), key=f"cancel_{key_suffix}"):
+        get_job_manager().cancel(job_id)
+        st.rerun()
+
+def display_results_custom(result, model):
     st.markdown('<div class="separator"></div>', unsafe_allow_html=True)
     st.markdown(f'<h2 class="section-header">{get_text("results_header")}</h2>', unsafe_allow_html=True)
-    
+
     if result.success:
         st.markdown(f"<div class='success-alert'>{get_text('success_message')}</div>", unsafe_allow_html=True)
+        size = model_size(model)
+        m_cols = st.columns(4)
+        with m_cols[0]:
+            st.metric(get_text('p3_metric_objective'), f"{objective_value(model, result):,.2f}")
+        with m_cols[1]:
+            st.metric(get_text('summary_vars'), f"{size['n_vars']:,}")
+        with m_cols[2]:
+            st.metric(get_text('p3_metric_constraints'), f"{size['n_ub'] + size['n_eq']:,}")
+        with m_cols[3]:
+            st.metric(get_text('p3_metric_nnz'), f"{size['nnz']:,}")
+
+        st.markdown(f"<h5>{get_text('optimal_vars_header')}</h5>", unsafe_allow_html=True)
+        results_df = pd.DataFrame({
+            get_text('df_variable_col'): model['variables'],
+            get_text('df_optimal_val_col'): result.x,
+        })
+        st.dataframe(results_df, use_container_width=True, hide_index=True)
+
+        if charts_enabled():
+            chart_cols = st.columns(2)
+            with RERUN.phase("chart_build"):
+                fig1 = bar_chart(session_figures(), f"p3_bar_{current_lang()}", model['variables'], result.x, get_text('p3_chart1_title'), get_text('chart_vars_label'), get_text('df_optimal_val_col'), other_label=get_text('chart_other_label'))
+                fig2 = histogram_chart(session_figures(), f"p3_hist_{current_lang()}", result.x, get_text('p3_chart2_title'), get_text('df_optimal_val_col'), get_text('chart_count_label'))
+            with RERUN.phase("render"):
+                with chart_cols[0]:
+                    st.plotly_chart(fig1, use_container_width=True)
+                with chart_cols[1]:
+                    st.plotly_chart(fig2, use_container_width=True)
+        display_export(model, result, "custom")
+    else:
+        st.markdown(f"<div class='error-alert'>{get_text('error_message')} {result.message}</div>", unsafe_allow_html=True)
+        if result.status == 2:
+            infeasibility_panel(model)
+
+def display_results_13_8_5(result, variables, obj_coeffs, A_ub, b_ub, bounds, integrality=None):
+    st.markdown('<div class="separator"></div>', unsafe_allow_html=True)
+    st.markdown(f'<h2 class="section-header">{get_text("results_header")}</h2>', unsafe_allow_html=True)
+    
+    model = build_13_8_5(obj_coeffs, A_ub, b_ub, bounds, integrality)
+    if result.success or has_incumbent(result):
+        if result.success:
+            st.markdown(f"<div class='success-alert'>{get_text('success_message')}</div>", unsafe_allow_html=True)
+        else:
+            reason = get_text(f"p1_mip_{mip_limit(result)}_limit")
+            st.markdown(f"<div class='warning-alert'>{get_text('p1_mip_incumbent').format(reason=reason, gap=result.mip_gap * 100)}</div>", unsafe_allow_html=True)
+        if is_mip(model):
+            st.caption(get_text('p1_mip_stats').format(gap=result.mip_gap * 100, nodes=result.mip_node_count, bound=-result.mip_dual_bound))
         
         row1_col1, row1_col2 = st.columns(2)
         row2_col1, row2_col2 = st.columns(2)
         with row1_col1:
             st.metric(get_text('p1_metric_profit'), f"${-result.fun:,.2f}")
+        with RERUN.phase("post_processing"):
+            post = postprocess_13_8_5(result.x, obj_coeffs, A_ub, b_ub)
+            utilization = post['utilization']
+            # Nilai dual tidak terdefinisi untuk model integer
+            if not is_mip(model):
+                variables_sens, constraints_sens = sensitivity_report(model, result, variables, get_text('p1_df_constraints'))
         with row1_col2:
-            st.metric(get_text('p1_metric_production'), f"{sum(result.x):,.0f} units")
-        constraint_usage = np.dot(A_ub, result.x)
+            st.metric(get_text('p1_metric_production'), f"{post['total_production']:,.0f} units")
         with row2_col1:
-            st.metric(get_text('p1_metric_c1'), f"{(constraint_usage[0] / b_ub[0]) * 100:.1f}%")
+            st.metric(get_text('p1_metric_c1'), f"{utilization[0]:.1f}%")
         with row2_col2:
-            st.metric(get_text('p1_metric_c2'), f"{(constraint_usage[1] / b_ub[1]) * 100:.1f}%")
+            st.metric(get_text('p1_metric_c2'), f"{utilization[1]:.1f}%")
         
         st.markdown("---")
         col1, col2 = st.columns(2)
@@ -1004,35 +821,46 @@ def display_results_13_8_5(result, variables, obj_coeffs, A_ub, b_ub, bounds):
                 get_text('df_variable_col'): variables,
                 get_text('df_optimal_val_col'): [f"{x:.2f}" for x in result.x],
                 get_text('p1_df_profit_col'): obj_coeffs,
-                get_text('p1_df_totalprofit_col'): [f"{x * c:.2f}" for x, c in zip(result.x, obj_coeffs)]
+                get_text('p1_df_totalprofit_col'): [f"{v:.2f}" for v in post['contributions']]
             })
             st.dataframe(results_df, use_container_width=True, hide_index=True)
             
             st.markdown(f"<h5>{get_text('constraint_analysis_header')}</h5>", unsafe_allow_html=True)
             constraint_df = pd.DataFrame({
                 get_text('p1_df_constraint_col'): get_text('p1_df_constraints'),
-                get_text('df_usage_col'): [f"{u:.2f}" for u in constraint_usage],
+                get_text('df_usage_col'): [f"{u:.2f}" for u in post['usage']],
                 get_text('df_limit_col'): b_ub,
-                get_text('df_slack_col'): [f"{b - u:.2f}" for b, u in zip(b_ub, constraint_usage)],
-                get_text('df_utilization_col'): [f"{(u/b)*100:.1f}%" for u, b in zip(constraint_usage, b_ub)]
+                get_text('df_slack_col'): [f"{v:.2f}" for v in post['slack']],
+                get_text('df_utilization_col'): [f"{v:.1f}%" for v in utilization]
             })
             st.dataframe(constraint_df, use_container_width=True, hide_index=True)
         
         with col2:
-            fig1 = px.bar(x=[var.split(' ')[0] for var in variables], y=result.x, title=get_text('p1_chart1_title'), labels={'x': get_text('chart_vars_label'), 'y': get_text('chart_units_label')}, color=result.x, color_continuous_scale="viridis")
-            st.plotly_chart(fig1, use_container_width=True)
-            
-            profit_contrib = result.x * np.array(obj_coeffs)
-            fig2 = px.pie(values=profit_contrib, names=[var.split(' ')[0] for var in variables], title=get_text('p1_chart2_title'))
-            st.plotly_chart(fig2, use_container_width=True)
+            if charts_enabled():
+                labels = [var.split(' ')[0] for var in variables]
+                with RERUN.phase("chart_build"):
+                    fig1 = bar_chart(session_figures(), f"p1_bar_{current_lang()}", labels, result.x, get_text('p1_chart1_title'), get_text('chart_vars_label'), get_text('chart_units_label'), colorscale="Viridis", other_label=get_text('chart_other_label'))
+                    fig2 = pie_chart(session_figures(), f"p1_pie_{current_lang()}", labels, post['contributions'], get_text('p1_chart2_title'), other_label=get_text('chart_other_label'))
+                with RERUN.phase("render"):
+                    st.plotly_chart(fig1, use_container_width=True)
+                    st.plotly_chart(fig2, use_container_width=True)
 
         st.markdown(f'<h3 class="section-header" style="border-bottom: none; margin-bottom: 0;">{get_text("p1_interpretation_title")}</h3>', unsafe_allow_html=True)
         raw_text = get_text('p1_interpretation_text').format(profit=-result.fun, val1=result.x[0], val3=result.x[2])
         formatted_text = format_interpretation(raw_text)
         st.markdown(f"<div class='success-alert'>{formatted_text}</div>", unsafe_allow_html=True)
+
+        if not is_mip(model):
+            display_sensitivity(variables_sens, constraints_sens)
+        display_export(model, result, "13_8_5")
         
+    elif mip_limit(result):
+        reason = get_text(f"p1_mip_{mip_limit(result)}_limit")
+        st.markdown(f"<div class='error-alert'>{get_text('p1_mip_no_incumbent').format(reason=reason)}</div>", unsafe_allow_html=True)
     else:
         st.markdown(f"<div class='error-alert'>{get_text('error_message')} {result.message}</div>", unsafe_allow_html=True)
+        if result.status == 2:
+            infeasibility_panel(model)
 
 def display_results_13_8_9(result, variables, obj_coeffs, cost_coeffs, cost_limit, bounds):
     st.markdown('<div class="separator"></div>', unsafe_allow_html=True)
@@ -1041,9 +869,11 @@ def display_results_13_8_9(result, variables, obj_coeffs, cost_coeffs, cost_limi
     if result.success:
         st.markdown(f"<div class='success-alert'>{get_text('success_message')}</div>", unsafe_allow_html=True)
         
-        total_cost = np.dot(result.x, cost_coeffs)
-        budget_utilization = (total_cost / cost_limit) * 100 if cost_limit > 0 else 0
-        remaining_budget = cost_limit - total_cost
+        with RERUN.phase("post_processing"):
+            variables_sens, constraints_sens = sensitivity_report(build_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds), result, variables, get_text('p2_df_budget_items')[:1])
+            total_cost = constraints_sens['usage'].iloc[0]
+            budget_utilization = (total_cost / cost_limit) * 100 if cost_limit > 0 else 0
+            remaining_budget = cost_limit - total_cost
 
         row1_col1, row1_col2 = st.columns(2)
         row2_col1, row2_col2 = st.columns(2)
@@ -1077,20 +907,105 @@ def display_results_13_8_9(result, variables, obj_coeffs, cost_coeffs, cost_limi
             st.dataframe(budget_df, use_container_width=True, hide_index=True)
 
         with col2:
-            fig1 = px.bar(x=[var.split(' ')[0] for var in variables], y=result.x, title=get_text('p2_chart1_title'), labels={'x': get_text('chart_vars_label'), 'y': get_text('chart_resources_label')}, color=result.x, color_continuous_scale="plasma")
-            st.plotly_chart(fig1, use_container_width=True)
-            
-            cost_values = [x * c for x, c in zip(result.x, cost_coeffs)]
-            fig2 = px.pie(values=cost_values, names=[var.split(' ')[0] for var in variables], title=get_text('p2_chart2_title'))
-            st.plotly_chart(fig2, use_container_width=True)
+            if charts_enabled():
+                labels = [var.split(' ')[0] for var in variables]
+                with RERUN.phase("chart_build"):
+                    fig1 = bar_chart(session_figures(), f"p2_bar_{current_lang()}", labels, result.x, get_text('p2_chart1_title'), get_text('chart_vars_label'), get_text('chart_resources_label'), colorscale="Plasma", other_label=get_text('chart_other_label'))
+                    cost_values = result.x * np.asarray(cost_coeffs, dtype=float)
+                    fig2 = pie_chart(session_figures(), f"p2_pie_{current_lang()}", labels, cost_values, get_text('p2_chart2_title'), other_label=get_text('chart_other_label'))
+                with RERUN.phase("render"):
+                    st.plotly_chart(fig1, use_container_width=True)
+                    st.plotly_chart(fig2, use_container_width=True)
 
         st.markdown(f'<h3 class="section-header" style="border-bottom: none; margin-bottom: 0;">{get_text("p2_interpretation_title")}</h3>', unsafe_allow_html=True)
         raw_text = get_text('p2_interpretation_text').format(val4=result.x[3], usage=budget_utilization)
         formatted_text = format_interpretation(raw_text)
         st.markdown(f"<div class='success-alert'>{formatted_text}</div>", unsafe_allow_html=True)
+
+        display_sensitivity(variables_sens, constraints_sens)
+        display_export(build_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds), result, "13_8_9")
         
     else:
         st.markdown(f"<div class='error-alert'>{get_text('error_message')} {result.message}</div>", unsafe_allow_html=True)
+        if result.status == 2:
+            infeasibility_panel(build_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds))
+
+def infeasibility_panel(model):
+    """Irreducible set of conflicting constraints and bounds of an infeasible ``model``."""
+    with st.expander(get_text('iis_header'), expanded=True):
+        st.markdown(get_text('iis_help'))
+        # IIS butuh beberapa solve elastis; simpan per model agar rerun tidak mengulanginya
+        key = model_key(model, DEFAULT_METHOD)
+        cached = st.session_state.get('iis')
+        if cached is None or cached['key'] != key:
+            try:
+                cached = {"key": key, "iis": find_iis(model), "error": None}
+            except ValueError as e:
+                cached = {"key": key, "iis": None, "error": str(e)}
+            st.session_state['iis'] = cached
+        if cached['error'] is not None:
+            st.markdown(f"<div class='error-alert'>{get_text('error_message')} {cached['error']}</div>", unsafe_allow_html=True)
+            return
+        iis = cached['iis']
+        if iis is None:
+            st.info(get_text('iis_feasible'))
+            return
+        st.caption(get_text('iis_summary').format(count=len(iis['items']), solves=iis['n_solves'], seconds=iis['seconds']))
+        kinds = get_text('iis_kinds')
+        iis_df = pd.DataFrame({
+            get_text('iis_col_kind'): [kinds[kind] for kind, _, _ in iis['items']],
+            get_text('iis_col_name'): [name for _, _, name in iis['items']],
+            get_text('iis_col_relaxation'): [iis['relaxation'].get(item, 0.0) for item in iis['items']],
+        })
+        st.dataframe(iis_df, use_container_width=True, hide_index=True)
+
+def display_sensitivity(variables_sens, constraints_sens):
+    with st.expander(get_text('sensitivity_header')):
+        st.markdown(get_text('sensitivity_help'))
+        st.markdown(f"<h5>{get_text('sensitivity_vars_header')}</h5>", unsafe_allow_html=True)
+        st.dataframe(variables_sens.rename(columns=get_text('sensitivity_var_cols')), use_container_width=True)
+        st.markdown(f"<h5>{get_text('sensitivity_cons_header')}</h5>", unsafe_allow_html=True)
+        st.dataframe(constraints_sens.rename(columns=get_text('sensitivity_cons_cols')), use_container_width=True)
+
+EXPORT_MIME_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+def export_files(df):
+    """Bytes of a typed DataFrame in every export format, keyed by format."""
+    files = {}
+    for fmt in EXPORT_FORMATS:
+        buffer = io.BytesIO()
+        write_table(df, buffer, fmt)
+        files[fmt] = buffer.getvalue()
+    return files
+
+def export_buttons(df, name, label, files=None):
+    """One download button per export format for a typed DataFrame (or its ready ``files``)."""
+    files = files or export_files(df)
+    cols = st.columns(len(EXPORT_FORMATS))
+    for col, fmt in zip(cols, EXPORT_FORMATS):
+        with col:
+            st.download_button(f"{label} ({fmt.upper()})", files[fmt], file_name=f"{name}.{fmt}", mime=EXPORT_MIME_TYPES[fmt], key=f"download_{name}_{fmt}")
+
+def display_export(model, result, key_suffix):
+    with st.expander(get_text('export_header')):
+        # Serialisasi CSV/Parquet/Arrow mahal untuk model besar; simpan per solusi agar rerun tidak mengulanginya
+        key = (model_key(model, DEFAULT_METHOD), result.status, hash(np.asarray(result.x).tobytes()))
+        cached = st.session_state.get(f"export_{key_suffix}")
+        if cached is None or cached['key'] != key:
+            variables_df, constraints_df = solution_tables(model, result)
+            cached = {"key": key, "solution": export_files(variables_df), "constraints": export_files(constraints_df)}
+            st.session_state[f"export_{key_suffix}"] = cached
+        st.markdown(f"<h5>{get_text('sensitivity_vars_header')}</h5>", unsafe_allow_html=True)
+        export_buttons(None, f"solution_{key_suffix}", get_text('export_download'), cached['solution'])
+        st.markdown(f"<h5>{get_text('sensitivity_cons_header')}</h5>", unsafe_allow_html=True)
+        export_buttons(None, f"constraints_{key_suffix}", get_text('export_download'), cached['constraints'])
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        RERUN.finish()
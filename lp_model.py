@@ -0,0 +1,125 @@
+"""Generic LP model format shared by every solver entry point.
+
+A model is a plain dict with the keys
+
+    c            objective in minimization form (negated when ``sense == "max"``)
+    A_ub, b_ub   inequality rows ``A_ub @ x <= b_ub``, ``A_ub`` as ``scipy.sparse.csr_matrix``
+    A_eq, b_eq   equality rows in the same format, or None when the model has none
+    bounds       (n, 2) float array of lower/upper bounds, ``±inf`` when unbounded
+    sense        ``"max"`` or ``"min"``
+    variables    variable names
+    constraints  names of the inequality rows
+    integrality  per-variable 0 (continuous) / 1 (integer) array, or None for a pure LP
+
+Constraint matrices stay sparse all the way into ``linprog``, so large models
+never get materialized as dense arrays.
+"""
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import Bounds, LinearConstraint
+
+
+def as_sparse(A, n):
+    """Returns ``A`` as a CSR matrix with ``n`` columns (an empty 0 x n matrix for None)."""
+    if A is None:
+        return sp.csr_matrix((0, n))
+    if sp.issparse(A):
+        return sp.csr_matrix(A)
+    return sp.csr_matrix(np.atleast_2d(np.asarray(A, dtype=float)).reshape(-1, n))
+
+def as_bounds(bounds, n):
+    """Normalizes bounds to an (n, 2) float array.
+
+    Accepts None (x >= 0), a single (lo, hi) pair for every variable, a list of
+    pairs with None for unbounded sides, or an (n, 2) array.
+    """
+    if isinstance(bounds, np.ndarray) and bounds.ndim == 2:
+        arr = bounds.astype(float)
+    else:
+        if bounds is None:
+            bounds = (0, None)
+        if len(bounds) == 2 and not np.iterable(bounds[0]):
+            bounds = [bounds] * n
+        arr = np.array([[-np.inf if lo is None else lo, np.inf if hi is None else hi] for lo, hi in bounds], dtype=float)
+    if arr.shape != (n, 2):
+        raise ValueError(f"Expected bounds for {n} variables, got {len(arr)}")
+    return arr
+
+def make_model(objective, A_ub=None, b_ub=None, bounds=None, sense="max",
+               variables=None, constraints=None, A_eq=None, b_eq=None, integrality=None):
+    """Builds a model dict from objective coefficients, constraint rows and bounds.
+
+    ``integrality`` marks integer variables (see ``scipy.optimize.milp``); a
+    model without any integer variable is stored as a pure LP.
+    """
+    if sense not in ("max", "min"):
+        raise ValueError("sense must be 'max' or 'min'")
+    objective = np.asarray(objective, dtype=float).ravel()
+    n = len(objective)
+    A_ub = as_sparse(A_ub, n)
+    b_ub = np.asarray([] if b_ub is None else b_ub, dtype=float).ravel()
+    if A_ub.shape[0] != len(b_ub):
+        raise ValueError("A_ub and b_ub must have the same number of rows")
+    if A_eq is not None:
+        A_eq = as_sparse(A_eq, n)
+        b_eq = np.asarray(b_eq, dtype=float).ravel()
+        if A_eq.shape[0] != len(b_eq):
+            raise ValueError("A_eq and b_eq must have the same number of rows")
+    if integrality is not None:
+        integrality = np.broadcast_to(np.asarray(integrality, dtype=np.uint8), (n,)).copy()
+        if not integrality.any():
+            integrality = None
+    return {
+        "c": -objective if sense == "max" else objective,
+        "A_ub": A_ub,
+        "b_ub": b_ub,
+        "A_eq": A_eq,
+        "b_eq": b_eq if A_eq is not None else None,
+        "bounds": as_bounds(bounds, n),
+        "sense": sense,
+        "variables": list(variables) if variables is not None else [f"x{j+1}" for j in range(n)],
+        "constraints": list(constraints) if constraints is not None else [f"C{i+1}" for i in range(len(b_ub))],
+        "integrality": integrality,
+    }
+
+def is_mip(model):
+    return model.get("integrality") is not None
+
+def linprog_args(model):
+    """Returns the keyword arguments that pass ``model`` to ``scipy.optimize.linprog``."""
+    has_ub = model["A_ub"].shape[0] > 0
+    return {
+        "c": model["c"],
+        "A_ub": model["A_ub"] if has_ub else None,
+        "b_ub": model["b_ub"] if has_ub else None,
+        "A_eq": model.get("A_eq"),
+        "b_eq": model.get("b_eq"),
+        "bounds": model["bounds"],
+    }
+
+def milp_args(model):
+    """Returns the keyword arguments that pass ``model`` to ``scipy.optimize.milp``."""
+    constraints = []
+    if model["A_ub"].shape[0] > 0:
+        constraints.append(LinearConstraint(model["A_ub"], -np.inf, model["b_ub"]))
+    if model.get("A_eq") is not None:
+        constraints.append(LinearConstraint(model["A_eq"], model["b_eq"], model["b_eq"]))
+    return {
+        "c": model["c"],
+        "constraints": constraints,
+        "integrality": model.get("integrality"),
+        "bounds": Bounds(model["bounds"][:, 0], model["bounds"][:, 1]),
+    }
+
+def objective_value(model, result):
+    """Objective value of a solved model in its own sense (profit for ``"max"`` models)."""
+    return -result.fun if model.get("sense", "min") == "max" else result.fun
+
+def model_size(model):
+    A_eq = model.get("A_eq")
+    return {
+        "n_vars": len(model["c"]),
+        "n_ub": model["A_ub"].shape[0],
+        "n_eq": 0 if A_eq is None else A_eq.shape[0],
+        "nnz": model["A_ub"].nnz + (0 if A_eq is None else A_eq.nnz),
+    }
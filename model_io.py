@@ -0,0 +1,119 @@
+"""Bulk import of model data from CSV or Parquet files.
+
+A model is described by three tables:
+
+    variables    name, objective, lower, upper          (one row per variable)
+    constraints  name, rhs[, sense]                      (sense is "<=", ">=" or "=", default "<=")
+    matrix       row, col, value                         (nonzero coefficients)
+
+``row``/``col`` in the matrix table refer to constraint/variable names, or to
+0-based positions when the columns are integers. Missing lower bounds
+default to 0 and missing upper bounds to +inf. The tables are read in
+chunks (``pandas.read_csv(chunksize=...)`` for CSV, Parquet row batches via
+pyarrow) and only the numeric coordinate arrays are kept, so large instance
+files load with memory proportional to the number of nonzeros.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from lp_model import make_model
+
+DEFAULT_CHUNK_ROWS = 200_000
+
+
+def _format_of(source, fmt):
+    if fmt:
+        return fmt
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    return "parquet" if str(name).lower().endswith((".parquet", ".pq")) else "csv"
+
+def iter_table_chunks(source, columns=None, chunk_size=DEFAULT_CHUNK_ROWS, fmt=None):
+    """Yields DataFrames of at most ``chunk_size`` rows from a CSV or Parquet path or file object."""
+    if _format_of(source, fmt) == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet files requires pyarrow (pip install pyarrow)") from e
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunk_size)
+
+def _read_table(source, columns, optional=(), chunk_size=DEFAULT_CHUNK_ROWS, fmt=None):
+    chunks = list(iter_table_chunks(source, chunk_size=chunk_size, fmt=fmt))
+    table = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+    missing = [col for col in columns if col not in table.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return table[[col for col in columns + list(optional) if col in table.columns]]
+
+def _names(table, label):
+    names = pd.Index(table["name"].astype(str))
+    # get_indexer butuh nama unik; tanpa cek ini pandas melempar InvalidIndexError
+    duplicated = names[names.duplicated()].unique()
+    if len(duplicated):
+        shown = ", ".join(duplicated[:10]) + (", ..." if len(duplicated) > 10 else "")
+        raise ValueError(f"Duplicate {label} names: {shown}")
+    return names
+
+def _positions(keys, names, label):
+    if pd.api.types.is_integer_dtype(keys):
+        pos = keys.to_numpy(dtype=np.int64)
+        bad = (pos < 0) | (pos >= len(names))
+    else:
+        pos = names.get_indexer(keys.astype(str))
+        bad = pos < 0
+    if bad.any():
+        raise ValueError(f"Unknown {label} in matrix file: {keys[bad].iloc[0]}")
+    return pos
+
+def read_model(variables, constraints, matrix, sense="max", chunk_size=DEFAULT_CHUNK_ROWS, fmt=None):
+    """Reads the three model tables and returns a generic model dict (see ``lp_model``).
+
+    ``variables``, ``constraints`` and ``matrix`` are paths or file objects;
+    the format is taken from ``fmt`` or the file extension. Variable and
+    constraint names must be unique; duplicates raise ``ValueError``.
+    """
+    var_table = _read_table(variables, ["name", "objective"], ("lower", "upper"), chunk_size, fmt)
+    con_table = _read_table(constraints, ["name", "rhs"], ("sense",), chunk_size, fmt)
+    var_names = _names(var_table, "variable")
+    con_names = _names(con_table, "constraint")
+    n, m = len(var_names), len(con_names)
+
+    rows, cols, vals = [], [], []
+    for chunk in iter_table_chunks(matrix, columns=["row", "col", "value"], chunk_size=chunk_size, fmt=fmt):
+        rows.append(_positions(chunk["row"], con_names, "constraint").astype(np.int32))
+        cols.append(_positions(chunk["col"], var_names, "variable").astype(np.int32))
+        vals.append(chunk["value"].to_numpy(dtype=float))
+    if rows:
+        A = sp.csr_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))), shape=(m, n))
+    else:
+        A = sp.csr_matrix((m, n))
+
+    lower = var_table["lower"].to_numpy(dtype=float) if "lower" in var_table else np.zeros(n)
+    upper = var_table["upper"].to_numpy(dtype=float) if "upper" in var_table else np.full(n, np.inf)
+    bounds = np.column_stack([np.nan_to_num(lower, nan=0.0), np.nan_to_num(upper, nan=np.inf)])
+
+    senses = con_table["sense"].fillna("<=").astype(str).str.strip() if "sense" in con_table else pd.Series(["<="] * m)
+    unknown = ~senses.isin(["<=", ">=", "="])
+    if unknown.any():
+        raise ValueError(f"Unknown constraint sense: {senses[unknown].iloc[0]}")
+    rhs = con_table["rhs"].to_numpy(dtype=float)
+    ub_rows = np.flatnonzero(senses.to_numpy() != "=")
+    eq_rows = np.flatnonzero(senses.to_numpy() == "=")
+    # ">=" rows are stored as "<=" rows with both sides negated
+    sign = np.where(senses.to_numpy()[ub_rows] == ">=", -1.0, 1.0)
+    return make_model(
+        var_table["objective"].to_numpy(dtype=float),
+        A_ub=sp.diags(sign) @ A[ub_rows] if len(ub_rows) else None,
+        b_ub=sign * rhs[ub_rows],
+        bounds=bounds,
+        sense=sense,
+        variables=var_names,
+        constraints=con_names[ub_rows],
+        A_eq=A[eq_rows] if len(eq_rows) else None,
+        b_eq=rhs[eq_rows] if len(eq_rows) else None,
+    )
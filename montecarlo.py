@@ -0,0 +1,252 @@
+"""Monte Carlo robustness analysis under uncertain coefficients.
+
+The uncertain coefficients (profit coefficients of Problem 13.8-5, unit costs
+of Problem 13.8-9) are sampled around their forecast values, every sample is
+solved, and the results are folded into a running summary: mean, standard
+deviation and extremes of the optimal value, quantiles from a fixed-size
+reservoir sample, and for every variable how often it is basic (strictly
+between its bounds) or positive. Memory therefore stays flat no matter how
+many samples are drawn.
+
+Samples are generated inside the workers from per-chunk seeds, so chunks can
+be solved in a process pool (same bounded-queue scheme as ``sweep``) and the
+result does not depend on the number of workers. Single-row problems
+(13.8-9) are solved a whole chunk at a time with the vectorized knapsack
+solver (see ``knapsack``). For general LPs the previous optimal bases are
+re-checked first within a chunk (see ``incremental``), so most samples need
+no ``linprog`` call at all.
+"""
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from incremental import IncrementalSolver
+from knapsack import is_knapsack, solve_knapsack_batch
+from solver import P1_DEFAULTS, P2_DEFAULTS, build_13_8_5, build_13_8_9, default_bounds
+
+DISTRIBUTIONS = ("normal", "uniform", "triangular", "lognormal")
+DEFAULT_MC_CHUNK = 500
+DEFAULT_RESERVOIR = 10_000
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+# Optimal bases kept per chunk; samples usually fall into a handful of them
+MAX_BASES = 8
+
+
+def sample_coefficients(rng, mean, spread, dist, size):
+    """Draws ``size`` coefficient vectors around ``mean``.
+
+    ``spread`` is relative to the mean (scalar or per coefficient): the
+    coefficient of variation for ``normal``/``lognormal`` and the half-width
+    for ``uniform``/``triangular``.
+    """
+    mean = np.asarray(mean, dtype=float)
+    spread = np.broadcast_to(np.asarray(spread, dtype=float), mean.shape)
+    shape = (size,) + mean.shape
+    if dist == "normal":
+        return mean * (1 + spread * rng.standard_normal(shape))
+    if dist == "uniform":
+        return mean * (1 + spread * rng.uniform(-1, 1, shape))
+    if dist == "triangular":
+        return mean * (1 + spread * rng.triangular(-1, 0, 1, shape))
+    if dist == "lognormal":
+        sigma = np.sqrt(np.log1p(spread ** 2))
+        return mean * np.exp(sigma * rng.standard_normal(shape) - sigma ** 2 / 2)
+    raise ValueError(f"Unknown distribution: {dist}")
+
+
+# ==============================================================================
+# MODEL PER PROBLEM
+# ==============================================================================
+def _model_13_8_5(sample, inputs):
+    return build_13_8_5(sample, inputs["A_ub"], inputs["b_ub"], default_bounds(inputs["upper_bounds"]))
+
+def _model_13_8_9(sample, inputs):
+    return build_13_8_9(inputs["obj_coeffs"], sample, inputs["cost_limit"], default_bounds(inputs["upper_bounds"]))
+
+def _knapsack_13_8_9(samples, inputs):
+    """``(c, a, b, lower, upper)`` of all samples for ``solve_knapsack_batch`` (minimization form)."""
+    bounds = np.asarray(default_bounds(inputs["upper_bounds"]), dtype=float)
+    shape = samples.shape
+    return (np.broadcast_to(-np.asarray(inputs["obj_coeffs"], dtype=float), shape), samples,
+            np.full(shape[0], float(inputs["cost_limit"])),
+            np.broadcast_to(bounds[:, 0], shape), np.broadcast_to(bounds[:, 1], shape))
+
+# problem -> (model builder, uncertain input, defaults, knapsack arrays or None)
+PROBLEMS = {
+    "13_8_5": (_model_13_8_5, "obj_coeffs", P1_DEFAULTS, None),
+    "13_8_9": (_model_13_8_9, "cost_coeffs", P2_DEFAULTS, _knapsack_13_8_9),
+}
+
+
+def _solve_chunk(problem, inputs, spread, dist, size, seed, chunk_index):
+    build, uncertain, _, knapsack_arrays = PROBLEMS[problem]
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk_index,)))
+    samples = sample_coefficients(rng, inputs[uncertain], spread, dist, size)
+    n_vars = samples.shape[1]
+    n_reused = 0
+    if knapsack_arrays is not None and is_knapsack(build(samples[0], inputs)):
+        # Satu panggilan vektor untuk seluruh chunk
+        out = solve_knapsack_batch(*knapsack_arrays(samples, inputs))
+        status = out["status"]
+        objective = np.where(status == 0, -out["fun"], np.nan)
+        x = out["x"]
+    else:
+        incremental = IncrementalSolver(max_bases=MAX_BASES)
+        objective = np.full(size, np.nan)
+        x = np.full((size, n_vars), np.nan)
+        status = np.zeros(size, dtype=int)
+        for k in range(size):
+            model = build(samples[k], inputs)
+            result = incremental.solve(model)
+            status[k] = result.status
+            if result.success:
+                objective[k] = -result.fun
+                x[k] = result.x
+        n_reused = incremental.reused
+    bounds = np.asarray(default_bounds(inputs["upper_bounds"]), dtype=float)
+    tol = 1e-7 * np.maximum(1.0, np.abs(bounds))
+    basic = (x > bounds[:, 0] + tol[:, 0]) & (x < bounds[:, 1] - tol[:, 1])
+    return {"objective": objective, "x": x, "basic": basic, "status": status, "n_reused": n_reused}
+
+
+# ==============================================================================
+# AGREGASI STREAMING
+# ==============================================================================
+class RobustnessSummary:
+    """Running aggregate of Monte Carlo chunks with constant memory."""
+
+    def __init__(self, n_vars, reservoir=DEFAULT_RESERVOIR, seed=0):
+        self.n = 0
+        self.n_failed = 0
+        self.n_reused = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.x_sum = np.zeros(n_vars)
+        self.basic_count = np.zeros(n_vars, dtype=int)
+        self.positive_count = np.zeros(n_vars, dtype=int)
+        self.patterns = Counter()
+        self._reservoir = np.empty(reservoir)
+        self._filled = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, chunk):
+        ok = chunk["status"] == 0
+        values = chunk["objective"][ok]
+        self.n_failed += int((~ok).sum())
+        self.n_reused += chunk["n_reused"]
+        if not len(values):
+            return
+        # Gabungan mean/varians per chunk (Chan et al.)
+        n_a, n_b = self.n, len(values)
+        mean_b = values.mean()
+        delta = mean_b - self.mean
+        self.n = n_a + n_b
+        self.mean += delta * n_b / self.n
+        self._m2 += ((values - mean_b) ** 2).sum() + delta ** 2 * n_a * n_b / self.n
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        x, basic = chunk["x"][ok], chunk["basic"][ok]
+        self.x_sum += x.sum(axis=0)
+        self.basic_count += basic.sum(axis=0)
+        self.positive_count += (x > 1e-9).sum(axis=0)
+        self.patterns.update("".join("B" if b else "-" for b in row) for row in basic)
+        self._sample(values, n_a)
+
+    def _sample(self, values, seen_before):
+        size = len(self._reservoir)
+        take = min(size - self._filled, len(values))
+        self._reservoir[self._filled:self._filled + take] = values[:take]
+        self._filled += take
+        rest = values[take:]
+        if len(rest):
+            # Algorithm R: the i-th value overall replaces a random slot with probability size / i
+            seen = seen_before + take + np.arange(1, len(rest) + 1)
+            slots = (self._rng.random(len(rest)) * seen).astype(np.int64)
+            keep = slots < size
+            self._reservoir[slots[keep]] = rest[keep]
+
+    @property
+    def std(self):
+        return float(np.sqrt(self._m2 / (self.n - 1))) if self.n > 1 else 0.0
+
+    def sample(self):
+        """The reservoir: a uniform random sample of at most ``reservoir`` optimal values."""
+        return self._reservoir[:self._filled].copy()
+
+    def report(self):
+        n = max(self.n, 1)
+        quantiles = np.quantile(self.sample(), QUANTILES) if self._filled else np.full(len(QUANTILES), np.nan)
+        return {
+            "n": self.n,
+            "n_failed": self.n_failed,
+            "n_reused": self.n_reused,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": dict(zip(QUANTILES, quantiles)),
+            "mean_x": self.x_sum / n,
+            "basic_frequency": self.basic_count / n,
+            "positive_frequency": self.positive_count / n,
+            "basis_patterns": self.patterns.most_common(),
+        }
+
+
+def monte_carlo(problem, n_samples, spread, dist="normal", inputs=None, seed=0, workers=None,
+                chunk_size=DEFAULT_MC_CHUNK, max_pending=None, reservoir=DEFAULT_RESERVOIR,
+                pool=None, progress=None, cancelled=None):
+    """Runs a Monte Carlo analysis of ``problem`` ("13_8_5" or "13_8_9") and returns a ``RobustnessSummary``.
+
+    ``inputs`` overrides the model inputs of the problem's defaults (same
+    keys as ``P1_DEFAULTS``/``P2_DEFAULTS``); the uncertain input is sampled
+    around its value there. ``workers=1`` solves in the calling process;
+    ``pool`` is an existing executor to use instead of a new one (``workers``
+    then only sets how many chunks are queued). ``progress(fraction)`` is
+    called after every chunk, and when ``cancelled()`` returns True no
+    further chunks are started and the partial summary is returned.
+    """
+    if dist not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {dist}")
+    _, uncertain, defaults, _ = PROBLEMS[problem]
+    inputs = {**defaults, **(inputs or {})}
+    summary = RobustnessSummary(len(inputs[uncertain]), reservoir, seed)
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    workers = workers or getattr(pool, "_max_workers", None) or os.cpu_count() or 1
+
+    def add(chunk):
+        summary.update(chunk)
+        if progress is not None:
+            progress((summary.n + summary.n_failed) / n_samples)
+
+    if workers == 1 and pool is None:
+        for k, size in enumerate(sizes):
+            if cancelled is not None and cancelled():
+                break
+            add(_solve_chunk(problem, inputs, spread, dist, size, seed, k))
+        return summary
+
+    max_pending = max_pending or 2 * workers
+    executor = pool or ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for k, size in enumerate(sizes):
+            if cancelled is not None and cancelled():
+                break
+            pending.append(executor.submit(_solve_chunk, problem, inputs, spread, dist, size, seed, k))
+            if len(pending) >= max_pending:
+                add(pending.popleft().result())
+        while pending:
+            future = pending.popleft()
+            if cancelled is not None and cancelled():
+                future.cancel()
+                continue
+            add(future.result())
+    finally:
+        if pool is None:
+            executor.shutdown(cancel_futures=True)
+    return summary
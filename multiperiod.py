@@ -0,0 +1,153 @@
+"""Multi-period production planning for Problem 13.8-5.
+
+Every period t has its own copy of the four production variables
+(x₁₁, x₁₂, x₂₁, x₂₂), a sales variable s_t and an end-of-period inventory
+I_t. Per period, the two capacity rows of the one-period model apply and
+sales are bounded by demand. Periods are linked only by the inventory
+balance
+
+    x₁₁ + x₁₂ + x₂₁ + x₂₂ + I_{t-1} - I_t - s_t = 0
+
+so the constraint matrix is block diagonal plus one band of linking
+entries. It is generated directly in sparse form. The objective is the
+production profit minus a holding cost on inventory. Inventory at the end
+of the horizon may not exceed the initial inventory, so everything produced
+is sold within the horizon and unsold stock earns no profit.
+
+Long horizons can be solved as one sparse LP or with a rolling horizon: a
+window of periods is solved, the first ``step`` periods of it are fixed, and
+the window moves on with the resulting inventory. Every window ends at or
+below the initial inventory of the whole plan, so no window stockpiles
+at its end.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from lp_model import make_model
+from solver import P1_DEFAULTS, P1_VARIABLES, DEFAULT_METHOD, solve_model
+
+N_PRODUCTION = 4
+# per period: four production variables, sales, inventory
+N_PERIOD_VARS = N_PRODUCTION + 2
+DEFAULT_PERIODS = 52
+
+
+def seasonal_demand(periods, base, amplitude=0.0, cycle=DEFAULT_PERIODS):
+    """Demand per period: ``base`` with a sinusoidal swing of ``amplitude`` (a fraction of ``base``)."""
+    t = np.arange(periods)
+    return base * (1 + amplitude * np.sin(2 * np.pi * t / cycle))
+
+def period_inputs(periods, demand, obj_coeffs=None, A_ub=None, b_ub=None, upper_bounds=None,
+                  holding_cost=0.0, max_inventory=np.inf):
+    """Broadcasts one-period or per-period inputs to arrays with a leading period axis.
+
+    Every input can be given once for all periods (the shape of the
+    one-period model) or per period (with an extra leading axis of length
+    ``periods``). Missing inputs fall back to ``P1_DEFAULTS``.
+    """
+    def per_period(value, default, shape):
+        value = np.asarray(default if value is None else value, dtype=float)
+        return np.broadcast_to(value, (periods,) + shape).copy()
+
+    return {
+        "obj_coeffs": per_period(obj_coeffs, P1_DEFAULTS["obj_coeffs"], (N_PRODUCTION,)),
+        "A_ub": per_period(A_ub, P1_DEFAULTS["A_ub"], (2, N_PRODUCTION)),
+        "b_ub": per_period(b_ub, P1_DEFAULTS["b_ub"], (2,)),
+        "upper_bounds": per_period(upper_bounds, P1_DEFAULTS["upper_bounds"], (N_PRODUCTION,)),
+        "demand": per_period(demand, None, ()),
+        "holding_cost": per_period(holding_cost, None, ()),
+        "max_inventory": per_period(max_inventory, None, ()),
+    }
+
+def build_multi_period_13_8_5(inputs, initial_inventory=0.0, start=0, stop=None, terminal_inventory=None):
+    """Builds the sparse multi-period model for periods ``start`` .. ``stop - 1`` of ``inputs``.
+
+    ``inputs`` comes from :func:`period_inputs`. Variables are ordered period
+    by period as (x₁₁, x₁₂, x₂₁, x₂₂, s, I). The last inventory is capped at
+    ``terminal_inventory`` (default: ``initial_inventory``).
+    """
+    stop = len(inputs["demand"]) if stop is None else stop
+    p = {key: value[start:stop] for key, value in inputs.items()}
+    T = stop - start
+    n = T * N_PERIOD_VARS
+    base = np.arange(T) * N_PERIOD_VARS
+    x_cols = base[:, None] + np.arange(N_PRODUCTION)
+    s_cols = base + N_PRODUCTION
+    i_cols = base + N_PRODUCTION + 1
+
+    objective = np.zeros(n)
+    objective[x_cols] = p["obj_coeffs"]
+    objective[i_cols] = -p["holding_cost"]
+
+    # Kapasitas per periode: blok diagonal 2 x 4
+    ub_rows = np.repeat(2 * np.arange(T)[:, None] + np.arange(2), N_PRODUCTION, axis=1).ravel()
+    ub_cols = np.tile(x_cols, (1, 2)).ravel()
+    A_ub = sp.csr_matrix((p["A_ub"].ravel(), (ub_rows, ub_cols)), shape=(2 * T, n))
+
+    # Neraca persediaan: produksi + I_{t-1} - I_t - s_t = 0
+    periods = np.arange(T)
+    eq_rows = np.concatenate([np.repeat(periods, N_PRODUCTION), periods, periods, periods[1:]])
+    eq_cols = np.concatenate([x_cols.ravel(), s_cols, i_cols, i_cols[:-1]])
+    eq_vals = np.concatenate([np.ones(T * N_PRODUCTION), -np.ones(T), -np.ones(T), np.ones(T - 1)])
+    A_eq = sp.csr_matrix((eq_vals, (eq_rows, eq_cols)), shape=(T, n))
+    b_eq = np.zeros(T)
+    b_eq[0] = -initial_inventory
+
+    bounds = np.zeros((n, 2))
+    bounds[x_cols, 1] = p["upper_bounds"]
+    bounds[s_cols, 1] = p["demand"]
+    bounds[i_cols, 1] = p["max_inventory"]
+    # Persediaan akhir <= awal: produksi kumulatif dibatasi oleh penjualan
+    terminal_inventory = initial_inventory if terminal_inventory is None else terminal_inventory
+    bounds[i_cols[-1], 1] = min(bounds[i_cols[-1], 1], terminal_inventory)
+
+    labels = [var.split(' ')[0] for var in P1_VARIABLES] + ["s", "I"]
+    variables = [f"{label} t{start + t + 1}" for t in range(T) for label in labels]
+    constraints = [f"{name} t{start + t + 1}" for t in range(T) for name in ("Total Machine Capacity", "Production Capacity")]
+    return make_model(objective, A_ub, p["b_ub"].ravel(), bounds, sense="max", variables=variables,
+                      constraints=constraints, A_eq=A_eq, b_eq=b_eq)
+
+def _split_solution(x, T):
+    x = x.reshape(T, N_PERIOD_VARS)
+    return x[:, :N_PRODUCTION], x[:, N_PRODUCTION], x[:, N_PRODUCTION + 1]
+
+def solve_multi_period_13_8_5(inputs, initial_inventory=0.0, horizon=None, step=None, method=DEFAULT_METHOD):
+    """Solves the multi-period plan, as one LP or with a rolling horizon.
+
+    With ``horizon`` set below the number of periods, windows of ``horizon``
+    periods are solved and the first ``step`` (default ``horizon // 2``)
+    periods of each are kept. This is a heuristic: it can miss inventory
+    builds that only pay off beyond the window. Every window ends at or
+    below ``initial_inventory``; the window after it covers the same
+    periods, so it can always follow that path and stays feasible.
+
+    Returns a dict with ``production`` (T, 4), ``sales``, ``inventory``,
+    ``profit``, ``success``, ``message`` and ``n_solves``.
+    """
+    T = len(inputs["demand"])
+    horizon = T if horizon is None else min(int(horizon), T)
+    step = max(1, min(step or horizon // 2 or 1, horizon))
+    production = np.full((T, N_PRODUCTION), np.nan)
+    sales = np.full(T, np.nan)
+    inventory = np.full(T, np.nan)
+    inventory_in = initial_inventory
+    n_solves = 0
+    start = 0
+    while start < T:
+        stop = min(start + horizon, T)
+        keep = stop - start if stop == T else step
+        result = solve_model(build_multi_period_13_8_5(inputs, inventory_in, start, stop, initial_inventory), method)
+        n_solves += 1
+        if not result.success:
+            return {"production": production, "sales": sales, "inventory": inventory, "profit": np.nan,
+                    "success": False, "message": f"Periods {start + 1}-{stop}: {result.message}", "n_solves": n_solves}
+        x, s, inv = _split_solution(result.x, stop - start)
+        production[start:start + keep] = x[:keep]
+        sales[start:start + keep] = s[:keep]
+        inventory[start:start + keep] = inv[:keep]
+        inventory_in = inv[keep - 1]
+        start += keep
+
+    profit = float((production * inputs["obj_coeffs"]).sum() - (inventory * inputs["holding_cost"]).sum())
+    return {"production": production, "sales": sales, "inventory": inventory, "profit": profit,
+            "success": True, "message": "", "n_solves": n_solves}
@@ -0,0 +1,88 @@
+"""Parametric RHS analysis for maximization models built by ``solver``.
+
+The optimal profit of a maximization LP is a concave, piecewise-linear
+function of one right-hand side. Each solve gives the value and the shadow
+price (a supporting tangent) at that point, so instead of solving on a fine
+grid the curve is traced by solving only where the tangents of two known
+points intersect. A segment is finished as soon as the solve at the
+intersection lands on both tangents, which makes the number of solves grow
+with the number of breakpoints rather than with the grid resolution. The
+tracing itself (:func:`trace_concave`) is shared with ``pareto``.
+"""
+import numpy as np
+
+from solver import DEFAULT_METHOD, build_13_8_5, solve_model
+
+
+def _solve_at(model, row, rhs, method):
+    b_ub = np.array(model["b_ub"], dtype=float)
+    b_ub[row] = rhs
+    result = solve_model(dict(model, b_ub=b_ub), method)
+    if not result.success:
+        raise ValueError(f"Model cannot be solved at RHS{row + 1} = {rhs:g}: {result.message}")
+    # linprog minimizes -profit, so both the value and the marginal change sign
+    return rhs, -result.fun, -result.ineqlin.marginals[row]
+
+def trace_concave(evaluate, lo, hi, tol=1e-7):
+    """Traces a concave piecewise-linear function on ``[lo, hi]`` by tangent intersections.
+
+    ``evaluate`` takes a list of points and returns one ``(t, value, slope,
+    ...)`` tuple per point; each round passes all points of that round at
+    once, so the caller can solve them in parallel. Returns the evaluated
+    tuples sorted by ``t`` and the number of evaluated points.
+    """
+    left, right = evaluate([lo, hi])
+    points = {lo: left, hi: right}
+    scale = max(1.0, abs(left[1]), abs(right[1]))
+    x_tol = tol * max(1.0, abs(lo), abs(hi))
+
+    segments = [(left, right)]
+    while segments:
+        wave = []
+        for a, b in segments:
+            if abs(a[1] + a[2] * (b[0] - a[0]) - b[1]) <= tol * scale or abs(a[2] - b[2]) <= tol:
+                continue
+            t = (b[1] - a[1] + a[2] * a[0] - b[2] * b[0]) / (a[2] - b[2])
+            if a[0] + x_tol < t < b[0] - x_tol:
+                wave.append((a, b, t))
+        segments = []
+        for (a, b, t), mid in zip(wave, evaluate([t for _, _, t in wave]) if wave else []):
+            points[t] = mid
+            if abs(a[1] + a[2] * (t - a[0]) - mid[1]) > tol * scale:
+                segments += [(a, mid), (mid, b)]
+    return [points[t] for t in sorted(points)], len(points)
+
+def breakpoints(t, value, tol=1e-7):
+    """Mask of the points that are real breakpoints (endpoints, or where the slope changes)."""
+    keep = np.ones(len(t), dtype=bool)
+    for k in range(1, len(t) - 1):
+        slope_in = (value[k] - value[k - 1]) / (t[k] - t[k - 1])
+        slope_out = (value[k + 1] - value[k]) / (t[k + 1] - t[k])
+        keep[k] = abs(slope_in - slope_out) > tol * max(1.0, abs(slope_in))
+    return keep
+
+def parametric_rhs(model, row, lo, hi, method=DEFAULT_METHOD, tol=1e-7):
+    """Traces the optimal value of a maximization model as ``b_ub[row]`` moves from ``lo`` to ``hi``.
+
+    Returns a dict with ``rhs`` and ``profit`` at every breakpoint (endpoints
+    included), ``shadow_price`` for each segment between consecutive
+    breakpoints and ``n_solves``, the number of LP solves used.
+    """
+    if not lo < hi:
+        raise ValueError("lo must be smaller than hi")
+    points, n_solves = trace_concave(lambda ts: [_solve_at(model, row, t, method) for t in ts], lo, hi, tol)
+    rhs = np.array([p[0] for p in points])
+    profit = np.array([p[1] for p in points])
+    # Drop interior points that lie on a straight segment (not real breakpoints)
+    keep = breakpoints(rhs, profit, tol)
+    rhs, profit = rhs[keep], profit[keep]
+    return {
+        "rhs": rhs,
+        "profit": profit,
+        "shadow_price": np.diff(profit) / np.diff(rhs),
+        "n_solves": n_solves,
+    }
+
+def parametric_rhs_13_8_5(obj_coeffs, A_ub, b_ub, bounds, row, lo, hi, method=DEFAULT_METHOD):
+    """Profit of the production planning model as a function of RHS₁ (``row=0``) or RHS₂ (``row=1``)."""
+    return parametric_rhs(build_13_8_5(obj_coeffs, A_ub, b_ub, bounds), row, lo, hi, method)
@@ -0,0 +1,132 @@
+"""Pareto frontiers of two objectives by an epsilon-constraint sweep.
+
+The primary objective of a maximization model (profit, output) is traded
+against a secondary linear criterion ``g @ x`` to be kept small (overtime
+production in 13.8-5, money spent in 13.8-9). With the extra row
+``g @ x <= eps`` the best primary value is a concave, piecewise-linear,
+non-decreasing function of ``eps``, so the frontier is traced exactly with
+the tangent-intersection scheme of ``parametric``: points are only solved
+where the frontier bends, and the dual of the epsilon row is the trade-off
+rate on each segment.
+
+The frontier runs from the smallest achievable criterion value to the
+smallest criterion value that still reaches the unconstrained optimum;
+beyond that point extra slack buys nothing, so a flat tail is dropped.
+Sequential solves re-use earlier optimal bases (see ``incremental``); with
+``workers > 1`` the points of each tracing round are solved in a process
+pool instead.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy.sparse as sp
+
+from incremental import IncrementalSolver
+from lp_model import make_model
+from parametric import breakpoints, trace_concave
+from solver import DEFAULT_METHOD, build_13_8_5, build_13_8_9, solve_model
+
+# Basis yang disimpan selama penelusuran; titik berdekatan sering berbagi basis
+PARETO_MAX_BASES = 4
+# x₁₂ dan x₂₂ adalah variabel lembur pada Problem 13.8-5
+OVERTIME_13_8_5 = (0, 1, 0, 1)
+
+
+def with_epsilon_row(model, criterion, eps=np.inf):
+    """Returns ``model`` with the row ``criterion @ x <= eps`` appended as the last inequality."""
+    criterion = np.asarray(criterion, dtype=float).ravel()
+    return dict(model,
+                A_ub=sp.vstack([model["A_ub"], sp.csr_matrix(criterion)], format="csr"),
+                b_ub=np.append(model["b_ub"], eps),
+                constraints=list(model["constraints"]) + ["Epsilon"])
+
+def _solve_epsilon(model, eps, method, solver=None):
+    b_ub = model["b_ub"].copy()
+    b_ub[-1] = eps
+    point = dict(model, b_ub=b_ub)
+    result = solver.solve(point, method) if solver is not None else solve_model(point, method)
+    if not result.success:
+        raise ValueError(f"Model cannot be solved at epsilon = {eps:g}: {result.message}")
+    # linprog meminimalkan -profit, jadi nilai dan marginal berganti tanda
+    return eps, -result.fun, -result.ineqlin.marginals[-1], np.asarray(result.x)
+
+def criterion_range(model, criterion, method=DEFAULT_METHOD):
+    """Returns ``(lo, hi)``: the smallest feasible ``criterion @ x`` and its value at the unconstrained optimum.
+
+    ``hi`` may lie past the end of the frontier when the optimum is not
+    unique; :func:`pareto_frontier` trims the flat part.
+    """
+    criterion = np.asarray(criterion, dtype=float).ravel()
+    lowest = solve_model(make_model(criterion, model["A_ub"], model["b_ub"], model["bounds"], sense="min",
+                                    A_eq=model.get("A_eq"), b_eq=model.get("b_eq")), method)
+    if not lowest.success:
+        raise ValueError(f"Model cannot be solved: {lowest.message}")
+    best = solve_model(model, method)
+    if not best.success:
+        raise ValueError(f"Model cannot be solved: {best.message}")
+    return float(lowest.fun), float(max(criterion @ best.x, lowest.fun))
+
+def pareto_frontier(model, criterion, lo=None, hi=None, method=DEFAULT_METHOD, workers=1, tol=1e-7):
+    """Traces the Pareto frontier of a maximization ``model`` against ``criterion @ x``.
+
+    ``lo``/``hi`` default to :func:`criterion_range`. Returns a dict with
+    ``epsilon`` and ``value`` at every breakpoint (endpoints included), the
+    optimal ``x`` there (one row per breakpoint), ``trade_off`` — the gain in
+    the primary objective per unit of the criterion on each segment —
+    ``n_solves`` and ``n_reused`` (solves answered from a stored basis).
+    """
+    if lo is None or hi is None:
+        default_lo, default_hi = criterion_range(model, criterion, method)
+        lo = default_lo if lo is None else lo
+        hi = default_hi if hi is None else hi
+    augmented = with_epsilon_row(model, criterion)
+    if hi - lo <= tol * max(1.0, abs(lo)):
+        eps, value, _, x = _solve_epsilon(augmented, hi, method)
+        return {"epsilon": np.array([eps]), "value": np.array([value]), "x": x[None, :],
+                "trade_off": np.zeros(0), "n_solves": 1, "n_reused": 0}
+
+    solver = IncrementalSolver(max_bases=PARETO_MAX_BASES)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def evaluate(points):
+        if pool is not None and len(points) > 1:
+            n = len(points)
+            return list(pool.map(_solve_epsilon, [augmented] * n, points, [method] * n))
+        return [_solve_epsilon(augmented, eps, method, solver) for eps in points]
+
+    try:
+        points, n_solves = trace_concave(evaluate, lo, hi, tol)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    epsilon = np.array([p[0] for p in points])
+    value = np.array([p[1] for p in points])
+    keep = breakpoints(epsilon, value, tol)
+    x = np.array([p[3] for p in points])[keep]
+    epsilon, value = epsilon[keep], value[keep]
+    # Segmen datar di ujung kanan didominasi: kriteria naik tanpa perbaikan objektif
+    if len(value) > 1 and value[-1] - value[-2] <= tol * max(1.0, abs(value[-1])):
+        epsilon, value, x = epsilon[:-1], value[:-1], x[:-1]
+    return {
+        "epsilon": epsilon,
+        "value": value,
+        "x": x,
+        "trade_off": np.diff(value) / np.diff(epsilon),
+        "n_solves": n_solves,
+        "n_reused": solver.reused,
+    }
+
+def pareto_13_8_5(obj_coeffs, A_ub, b_ub, bounds, overtime=OVERTIME_13_8_5, method=DEFAULT_METHOD, workers=1):
+    """Profit against overtime production (x₁₂ + x₂₂ by default) for the production planning model."""
+    return pareto_frontier(build_13_8_5(obj_coeffs, A_ub, b_ub, bounds), overtime, method=method, workers=workers)
+
+def pareto_13_8_9(obj_coeffs, cost_coeffs, bounds, max_budget=None, method=DEFAULT_METHOD, workers=1):
+    """Output against budget for the resource allocation model.
+
+    The budget itself is the criterion, so the fixed budget row is left out;
+    ``max_budget`` caps the frontier (default: the cost of the optimum
+    without a budget).
+    """
+    model = build_13_8_9(obj_coeffs, cost_coeffs, np.inf, bounds)
+    model = dict(model, A_ub=model["A_ub"][:0], b_ub=model["b_ub"][:0], constraints=[])
+    return pareto_frontier(model, cost_coeffs, hi=max_budget, method=method, workers=workers)
@@ -0,0 +1,311 @@
+"""Presolve: shrinks an LP model before ``linprog`` and maps the solution back.
+
+Reductions, repeated until none applies:
+
+- fixed variables (lower == upper, e.g. an upper bound of 0) are removed and
+  their contribution moved to the right-hand sides,
+- empty columns (no coefficient left in any row) are set to their cheaper
+  bound and removed,
+- empty rows are dropped (or prove the model infeasible),
+- inequality rows that hold for every ``x`` within the bounds are dropped,
+- duplicate rows (the same row up to a positive factor) are merged into the
+  tightest one.
+
+Rows whose largest coefficient is far from 1 are then scaled by a power of
+two, so scaling adds no rounding error. :func:`postsolve` maps ``x``,
+slacks, row duals and reduced costs back to the original model; removed rows
+get a dual of 0. HiGHS presolves internally as well, but this layer removes
+the rows and columns before the model is handed to scipy at all.
+"""
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import OptimizeResult
+
+from lp_model import as_sparse, is_mip, make_model, model_size
+from solver import DEFAULT_METHOD, solve_model
+
+PRESOLVE_TOL = 1e-9
+# Baris dengan koefisien terbesar di luar [1/SCALE_RANGE, SCALE_RANGE] diskalakan
+SCALE_RANGE = 16.0
+REDUCTIONS = ("fixed_cols", "empty_cols", "empty_rows", "redundant_rows", "duplicate_rows")
+
+
+def _triplets(A, n):
+    """Nonzeros of ``A`` as (row, col, value) arrays, sorted by row and then column."""
+    A = as_sparse(A, n)
+    A.sum_duplicates()
+    A = A.tocoo()
+    keep = A.data != 0
+    return A.row[keep], A.col[keep], A.data[keep]
+
+def _row_sums(row, weights, m):
+    return np.bincount(row, weights=weights, minlength=m)
+
+def _activity(row, val, bound, m):
+    """Row sums of ``val * bound`` for bounds that may be infinite (all infinite terms of a row share one sign)."""
+    finite = np.isfinite(bound)
+    value = _row_sums(row, val * np.where(finite, bound, 0.0), m)
+    infinite = _row_sums(row, np.where(finite, 0.0, np.sign(val * bound)), m)
+    return value + np.where(infinite > 0, np.inf, np.where(infinite < 0, -np.inf, 0.0))
+
+def _duplicates(row, col, val, b, sense):
+    """Returns the rows that duplicate another row, and whether an equality duplicate contradicts it.
+
+    Rows are compared after dividing by their largest absolute coefficient.
+    For ``sense == "ub"`` the row with the smallest normalized rhs is kept.
+    """
+    if len(row) == 0:
+        return np.zeros(0, dtype=int), False
+    starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]])
+    if len(starts) < 2:
+        return np.zeros(0, dtype=int), False
+    norm = np.maximum.reduceat(np.abs(val), starts)
+    scaled = np.round(val / np.repeat(norm, np.diff(np.r_[starts, len(row)])), 12)
+    groups = {}
+    for i, k, cols, values in zip(row[starts], range(len(starts)), np.split(col, starts[1:]), np.split(scaled, starts[1:])):
+        groups.setdefault((cols.tobytes(), values.tobytes()), []).append((b[i] / norm[k], i))
+    drop = []
+    conflict = False
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        group.sort()
+        if sense == "eq" and group[-1][0] - group[0][0] > PRESOLVE_TOL * max(1.0, abs(group[0][0])):
+            conflict = True
+        drop += [i for _, i in group[1:]]
+    return np.array(drop, dtype=int), conflict
+
+def _row_scale(row, val, m):
+    """Power-of-two row factors for rows whose largest coefficient lies outside the scaling range."""
+    largest = np.zeros(m)
+    np.maximum.at(largest, row, np.abs(val))
+    scale = np.ones(m)
+    off = (largest > 0) & ((largest > SCALE_RANGE) | (largest < 1 / SCALE_RANGE))
+    scale[off] = np.exp2(-np.round(np.log2(largest[off])))
+    return scale
+
+def presolve(model, tol=PRESOLVE_TOL):
+    """Returns ``(reduced_model, transform)``.
+
+    ``transform`` holds what :func:`postsolve` needs plus ``stats``: sizes
+    before and after, the count per reduction, ``scaled_rows`` and
+    ``presolve_s``. ``transform["infeasible"]`` is a message when presolve
+    already proved the model infeasible (``reduced_model`` is then None).
+    MILP models are returned unchanged.
+    """
+    start = time.perf_counter()
+    n = len(model["c"])
+    c = np.asarray(model["c"], dtype=float)
+    b_ub = np.asarray(model["b_ub"], dtype=float)
+    b_eq = np.zeros(0) if model.get("b_eq") is None else np.asarray(model["b_eq"], dtype=float)
+    lower, upper = model["bounds"][:, 0], model["bounds"][:, 1]
+
+    cols = np.ones(n, dtype=bool)
+    ub_rows = np.ones(len(b_ub), dtype=bool)
+    eq_rows = np.ones(len(b_eq), dtype=bool)
+    x_fixed = np.zeros(n)
+    counts = dict.fromkeys(REDUCTIONS, 0)
+    transform = {"cols": cols, "ub_rows": ub_rows, "eq_rows": eq_rows, "x_fixed": x_fixed,
+                 "ub_scale": np.ones(len(b_ub)), "eq_scale": np.ones(len(b_eq)), "infeasible": None}
+
+    def infeasible(message):
+        transform["infeasible"] = message
+        transform["stats"] = {"before": model_size(model), "after": None, **counts, "scaled_rows": 0,
+                              "presolve_s": time.perf_counter() - start}
+        return None, transform
+
+    if is_mip(model):
+        transform["stats"] = {"before": model_size(model), "after": model_size(model), **counts,
+                              "scaled_rows": 0, "presolve_s": 0.0}
+        return model, transform
+    if np.any(lower > upper + tol * np.maximum(1.0, np.abs(lower))):
+        return infeasible("A lower bound is above its upper bound")
+
+    # Matriks disimpan sebagai triplet; reduksi hanya mengubah mask baris/kolom aktif
+    blocks = ((_triplets(model["A_ub"], n), b_ub, ub_rows, "ub"), (_triplets(model.get("A_eq"), n), b_eq, eq_rows, "eq"))
+    changed = True
+    while changed:
+        changed = False
+        fixed = cols & np.isfinite(lower) & (upper - lower <= tol * np.maximum(1.0, np.abs(lower)))
+        if fixed.any():
+            x_fixed[fixed] = lower[fixed]
+            cols[fixed] = False
+            counts["fixed_cols"] += int(fixed.sum())
+            changed = True
+
+        col_nnz = np.zeros(n, dtype=int)
+        for (row, col, _), _, active, _ in blocks:
+            col_nnz += np.bincount(col[active[row] & cols[col]], minlength=n)
+        best = np.where(c > 0, lower, np.where(c < 0, upper, np.where(np.isfinite(lower), lower, upper)))
+        # Kolom kosong dengan batas termurah tak hingga tidak dihapus (solver melaporkan unbounded)
+        empty = cols & (col_nnz == 0) & np.isfinite(best)
+        if empty.any():
+            x_fixed[empty] = best[empty]
+            cols[empty] = False
+            counts["empty_cols"] += int(empty.sum())
+            changed = True
+
+        removed = np.where(cols, 0.0, x_fixed)
+        for (row, col, val), b, active, sense in blocks:
+            m = len(b)
+            # Sisi kanan setelah variabel yang sudah dihapus dipindah ke kanan
+            rhs = b - _row_sums(row, val * removed[col], m)
+            scale = np.maximum(1.0, np.abs(rhs))
+            live = active[row] & cols[col]
+            row, col, val = row[live], col[live], val[live]
+            row_nnz = np.bincount(row, minlength=m)
+            empty_rows = active & (row_nnz == 0)
+            if sense == "ub" and np.any(empty_rows & (rhs < -tol * scale)):
+                return infeasible("An inequality row without variables has a negative right-hand side")
+            if sense == "eq" and np.any(empty_rows & (np.abs(rhs) > tol * scale)):
+                return infeasible("An equality row without variables has a nonzero right-hand side")
+            if empty_rows.any():
+                active[empty_rows] = False
+                counts["empty_rows"] += int(empty_rows.sum())
+                changed = True
+            if sense == "ub":
+                # Aktivitas minimum/maksimum baris atas batas variabel
+                max_activity = _activity(row, val, np.where(val > 0, upper[col], lower[col]), m)
+                min_activity = _activity(row, val, np.where(val > 0, lower[col], upper[col]), m)
+                if np.any(active & (min_activity > rhs + tol * scale)):
+                    return infeasible("An inequality row cannot be satisfied within the variable bounds")
+                redundant = active & (max_activity <= rhs + tol * scale)
+                if redundant.any():
+                    active[redundant] = False
+                    counts["redundant_rows"] += int(redundant.sum())
+                    changed = True
+            live = active[row]
+            drop, conflict = _duplicates(row[live], col[live], val[live], rhs, sense)
+            if conflict:
+                return infeasible("Two equality rows are multiples of each other with different right-hand sides")
+            if len(drop):
+                active[drop] = False
+                counts["duplicate_rows"] += len(drop)
+                changed = True
+
+    removed = np.where(cols, 0.0, x_fixed)
+    new_col = np.cumsum(cols) - 1
+    reduced_blocks = []
+    for ((row, col, val), b, active, sense), scale_key in zip(blocks, ("ub_scale", "eq_scale")):
+        rhs = (b - _row_sums(row, val * removed[col], len(b)))[active]
+        live = active[row] & cols[col]
+        new_row = (np.cumsum(active) - 1)[row[live]]
+        scale = _row_scale(new_row, val[live], int(active.sum()))
+        transform[scale_key] = scale
+        A = sp.csr_matrix((val[live] * scale[new_row], (new_row, new_col[col[live]])), shape=(int(active.sum()), int(cols.sum())))
+        reduced_blocks.append((A, rhs * scale))
+    (red_ub, rhs_ub), (red_eq, rhs_eq) = reduced_blocks
+
+    sense = model.get("sense", "min")
+    objective = -c[cols] if sense == "max" else c[cols]
+    constraints = [name for name, keep in zip(model.get("constraints", []), ub_rows) if keep] or None
+    variables = [name for name, keep in zip(model.get("variables", []), cols) if keep] or None
+    has_eq = model.get("A_eq") is not None
+    reduced = make_model(objective, red_ub, rhs_ub, model["bounds"][cols], sense=sense, variables=variables,
+                         constraints=constraints, A_eq=red_eq if has_eq else None, b_eq=rhs_eq if has_eq else None)
+    transform["stats"] = {
+        "before": model_size(model),
+        "after": model_size(reduced),
+        **counts,
+        "scaled_rows": int((transform["ub_scale"] != 1).sum() + (transform["eq_scale"] != 1).sum()),
+        "presolve_s": time.perf_counter() - start,
+    }
+    return reduced, transform
+
+def postsolve(model, transform, result):
+    """Maps a result of the reduced model back to ``model`` (same fields as a ``linprog`` result)."""
+    if not result.success or result.x is None:
+        return OptimizeResult(x=None, fun=None, success=False, status=result.status, message=result.message,
+                              nit=getattr(result, "nit", 0))
+    n = len(model["c"])
+    cols, ub_rows, eq_rows = transform["cols"], transform["ub_rows"], transform["eq_rows"]
+    A_ub = as_sparse(model["A_ub"], n)
+    A_eq = as_sparse(model.get("A_eq"), n)
+    b_ub = np.asarray(model["b_ub"], dtype=float)
+    b_eq = np.zeros(0) if model.get("b_eq") is None else np.asarray(model["b_eq"], dtype=float)
+    lower, upper = model["bounds"][:, 0], model["bounds"][:, 1]
+
+    x = transform["x_fixed"].copy()
+    x[cols] = result.x
+    y_ub = np.zeros(len(b_ub))
+    y_ub[ub_rows] = result.ineqlin.marginals * transform["ub_scale"]
+    y_eq = np.zeros(len(b_eq))
+    if len(b_eq):
+        y_eq[eq_rows] = result.eqlin.marginals * transform["eq_scale"]
+
+    # Reduced cost variabel yang dihapus: c - Aᵀy; variabel yang tersisa memakai nilai dari solver
+    d = np.asarray(model["c"], dtype=float) - A_ub.T @ y_ub - A_eq.T @ y_eq
+    at_upper = np.where(upper - lower <= PRESOLVE_TOL, d < 0, np.abs(x - upper) < np.abs(x - lower))
+    lower_m = np.where(at_upper, 0.0, d)
+    upper_m = np.where(at_upper, d, 0.0)
+    lower_m[cols] = result.lower.marginals
+    upper_m[cols] = result.upper.marginals
+
+    slack = b_ub - A_ub @ x
+    con = b_eq - A_eq @ x
+    return OptimizeResult(
+        x=x,
+        fun=float(model["c"] @ x),
+        slack=slack,
+        con=con,
+        success=True,
+        status=0,
+        message=result.message,
+        nit=getattr(result, "nit", 0),
+        ineqlin=OptimizeResult(marginals=y_ub, residual=slack),
+        eqlin=OptimizeResult(marginals=y_eq, residual=con),
+        lower=OptimizeResult(marginals=lower_m, residual=x - lower),
+        upper=OptimizeResult(marginals=upper_m, residual=upper - x),
+    )
+
+def solve_presolved(model, method=DEFAULT_METHOD, options=None):
+    """Presolves, solves the reduced model and maps the result back.
+
+    The returned result carries ``presolve``: the presolve ``stats`` plus
+    ``solve_s`` and ``postsolve_s``. MILP models are solved unchanged.
+    """
+    reduced, transform = presolve(model)
+    stats = dict(transform["stats"], solve_s=0.0, postsolve_s=0.0)
+    if transform["infeasible"]:
+        result = OptimizeResult(x=None, fun=None, success=False, status=2, nit=0,
+                                message=f"The problem is infeasible (presolve: {transform['infeasible']})")
+    elif is_mip(model):
+        start = time.perf_counter()
+        result = solve_model(model, method, options)
+        stats["solve_s"] = time.perf_counter() - start
+    else:
+        start = time.perf_counter()
+        if len(reduced["c"]):
+            reduced_result = solve_model(reduced, method, options)
+        else:
+            # Semua variabel dihapus; tidak ada yang perlu diselesaikan
+            reduced_result = OptimizeResult(x=np.zeros(0), success=True, status=0, nit=0,
+                                            message="Optimal (all variables removed in presolve)",
+                                            ineqlin=OptimizeResult(marginals=np.zeros(reduced["A_ub"].shape[0])),
+                                            eqlin=OptimizeResult(marginals=np.zeros(len(transform["eq_scale"]))),
+                                            lower=OptimizeResult(marginals=np.zeros(0)),
+                                            upper=OptimizeResult(marginals=np.zeros(0)))
+        stats["solve_s"] = time.perf_counter() - start
+        start = time.perf_counter()
+        result = postsolve(model, transform, reduced_result)
+        stats["postsolve_s"] = time.perf_counter() - start
+    result.presolve = stats
+    return result
+
+def compare_presolve(model, method=DEFAULT_METHOD, repeats=3):
+    """Times ``model`` solved directly and through presolve; returns the stats and ``time_saved_s``.
+
+    Times are the best of ``repeats`` runs and include presolve and postsolve.
+    """
+    direct, presolved = [], []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        solve_model(model, method)
+        direct.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        result = solve_presolved(model, method)
+        presolved.append(time.perf_counter() - start)
+    return {**result.presolve, "time_direct_s": min(direct), "time_presolved_s": min(presolved),
+            "time_saved_s": min(direct) - min(presolved)}
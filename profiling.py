@@ -0,0 +1,104 @@
+"""Per-rerun phase timing with percentile aggregation.
+
+Each Streamlit rerun gets a ``RerunTimer`` that accumulates the time spent in
+named phases (model build, solve, post-processing, chart build, render, ...).
+When the rerun finishes, its phase totals are added to a process-wide
+``PhaseProfiler`` that keeps a bounded window of samples per phase and reports
+count, mean and p50/p90/p99 across all sessions.
+"""
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+DEFAULT_WINDOW = 2000
+
+
+class RerunTimer:
+    """Accumulates phase durations for a single rerun."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.start = time.perf_counter()
+        self.phases = defaultdict(float)
+        self.finished = False
+        self._last_mark = self.start
+
+    def add(self, name, seconds):
+        self.phases[name] += seconds
+
+    def mark(self, name):
+        """Records the time since the previous mark (or the rerun start) as phase ``name``."""
+        now = time.perf_counter()
+        self.phases[name] += now - self._last_mark
+        self._last_mark = now
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def finish(self):
+        if self.finished:
+            return
+        self.finished = True
+        self.phases["total"] = time.perf_counter() - self.start
+        self.profiler.record(self.phases)
+
+
+class PhaseProfiler:
+    """Thread-safe aggregation of per-rerun phase timings."""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._counts = defaultdict(int)
+        self._lock = threading.Lock()
+        self.reruns = 0
+
+    def start_rerun(self):
+        return RerunTimer(self)
+
+    def record(self, phases):
+        with self._lock:
+            self.reruns += 1
+            for name, seconds in phases.items():
+                self._samples[name].append(seconds)
+                self._counts[name] += 1
+
+    def summary(self):
+        """Returns ``{phase: {count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms}}`` over the sample window."""
+        with self._lock:
+            samples = {name: np.array(values) * 1000 for name, values in self._samples.items()}
+            counts = dict(self._counts)
+        out = {}
+        for name, ms in samples.items():
+            p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+            out[name] = {
+                "count": counts[name],
+                "mean_ms": float(ms.mean()),
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "max_ms": float(ms.max()),
+            }
+        return out
+
+    def to_json(self, indent=2):
+        return json.dumps({"reruns": self.reruns, "window": self.window, "phases": self.summary()}, indent=indent)
+
+    def dump_json(self, path):
+        with open(path, "w") as f:
+            f.write(self.to_json())
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self.reruns = 0
@@ -0,0 +1,140 @@
+"""Sensitivity analysis from a single HiGHS solve.
+
+Shadow prices and reduced costs come straight from the ``linprog`` marginals.
+Objective-coefficient and RHS ranging are derived from the optimal basis,
+which is recovered from the solution itself: variables and slacks strictly
+inside their bounds are basic, and degenerate vertices are completed with
+zero-reduced-cost columns. No extra solves are needed for any of the ranges.
+
+All values are reported in the model's own sense, so for maximization
+models (profit or output) the sign of ``model["c"]`` is flipped back. Ranging
+needs dense basis solves and is skipped for models larger than
+``MAX_RANGING_SIZE`` rows plus columns; duals are always reported.
+"""
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+MAX_RANGING_SIZE = 2000
+
+
+def _find_basis(M, z, lower, upper, reduced_costs, tol):
+    """Returns basis column indices for the vertex ``z`` or None if it is not a vertex."""
+    m = M.shape[0]
+    at_lower = np.abs(z - lower) <= tol * np.maximum(1.0, np.abs(lower))
+    at_upper = np.abs(z - upper) <= tol * np.maximum(1.0, np.abs(np.where(np.isfinite(upper), upper, 0)))
+    basic = list(np.flatnonzero(~(at_lower | at_upper)))
+    if len(basic) > m or np.linalg.matrix_rank(M[:, basic]) < len(basic):
+        return None
+    # Degenerate vertex: complete the basis with columns that keep it non-singular,
+    # preferring the ones whose reduced cost is (nearly) zero.
+    for k in np.argsort(np.abs(reduced_costs), kind="stable"):
+        if len(basic) == m:
+            break
+        if k in basic:
+            continue
+        if np.linalg.matrix_rank(M[:, basic + [k]]) == len(basic) + 1:
+            basic.append(k)
+    return basic if len(basic) == m else None
+
+def _ratio_range(values, directions, lower, upper, tol):
+    """Largest interval [lo, hi] of t with lower <= values + t * directions <= upper."""
+    lo, hi = -np.inf, np.inf
+    for v, d, l, u in zip(values, directions, lower, upper):
+        if d > tol:
+            hi = min(hi, (u - v) / d)
+            lo = max(lo, (l - v) / d)
+        elif d < -tol:
+            hi = min(hi, (l - v) / d)
+            lo = max(lo, (u - v) / d)
+    return lo, hi
+
+def sensitivity_report(model, result, variable_names=None, constraint_names=None, tol=1e-9):
+    """Builds the variable and constraint sensitivity tables of a solved model.
+
+    Returns ``(variables_df, constraints_df)``; equality rows follow the
+    inequality rows in ``constraints_df``. Ranges are the allowable
+    increase/decrease for which the reported basis stays optimal; they are NaN
+    if the solution is not a basic (vertex) solution or the model is too large.
+    """
+    c = np.asarray(model["c"], dtype=float)
+    A_ub = sp.csr_matrix(model["A_ub"])
+    A_eq = sp.csr_matrix((0, len(c))) if model.get("A_eq") is None else sp.csr_matrix(model["A_eq"])
+    m_ub, n = A_ub.shape
+    m = m_ub + A_eq.shape[0]
+    b_eq = np.zeros(0) if model.get("b_eq") is None else np.asarray(model["b_eq"], dtype=float)
+    b = np.concatenate([np.asarray(model["b_ub"], dtype=float), b_eq])
+    x = np.asarray(result.x, dtype=float)
+    slack = np.concatenate([np.asarray(result.slack, dtype=float), np.zeros(len(b_eq))])
+    y = np.concatenate([np.asarray(result.ineqlin.marginals, dtype=float), np.asarray(result.eqlin.marginals, dtype=float)])
+
+    # Standard form [A_ub I; A_eq 0] [x; s] = b, s >= 0, minimizing c'x
+    z = np.concatenate([x, slack[:m_ub]])
+    bounds = np.asarray(model["bounds"], dtype=float)
+    lower = np.concatenate([bounds[:, 0], np.zeros(m_ub)])
+    upper = np.concatenate([bounds[:, 1], np.full(m_ub, np.inf)])
+    d = np.concatenate([result.lower.marginals + result.upper.marginals, -y[:m_ub]])
+
+    obj_inc = np.full(n, np.nan)
+    obj_dec = np.full(n, np.nan)
+    rhs_inc = np.full(m, np.nan)
+    rhs_dec = np.full(m, np.nan)
+
+    basic = None
+    if n + m <= MAX_RANGING_SIZE:
+        M = sp.bmat([[A_ub, sp.eye(m_ub)], [A_eq, None]], format="csr").toarray()
+        basic = _find_basis(M, z, lower, upper, d, 1e-7)
+    if basic is not None:
+        B = M[:, basic]
+        position = {k: p for p, k in enumerate(basic)}
+        nonbasic = [k for k in range(n + m_ub) if k not in position and lower[k] < upper[k]]
+        nb_at_upper = np.array([abs(z[k] - upper[k]) < abs(z[k] - lower[k]) for k in nonbasic], dtype=bool)
+
+        for j in range(n):
+            if j in position:
+                # Basic: the cost change delta moves reduced costs by -delta * alpha_k
+                w = np.linalg.solve(B.T, np.eye(m)[position[j]])
+                alpha = w @ M[:, nonbasic]
+                d_nb = d[nonbasic]
+                signed = np.where(nb_at_upper, -1.0, 1.0)
+                # Keep signed * (d_k - delta * alpha_k) >= 0 for every nonbasic k
+                delta_lo, delta_hi = _ratio_range(signed * d_nb, -signed * alpha, np.zeros(len(nonbasic)), np.full(len(nonbasic), np.inf), tol)
+            elif abs(z[j] - upper[j]) < abs(z[j] - lower[j]):
+                delta_lo, delta_hi = -np.inf, -d[j]
+            else:
+                delta_lo, delta_hi = -d[j], np.inf
+            obj_inc[j], obj_dec[j] = delta_hi, -delta_lo
+
+        z_basic = z[basic]
+        for i in range(m):
+            direction = np.linalg.solve(B, np.eye(m)[i])
+            delta_lo, delta_hi = _ratio_range(z_basic, direction, lower[basic], upper[basic], tol)
+            rhs_inc[i], rhs_dec[i] = delta_hi, -delta_lo
+
+    if model.get("sense") == "max":
+        # Profit coefficient p_j = -c_j: a cost decrease is a profit increase
+        sign = -1.0
+        obj_inc, obj_dec = obj_dec, obj_inc
+    else:
+        sign = 1.0
+
+    variable_names = variable_names or model.get("variables") or [f"x{j+1}" for j in range(n)]
+    if constraint_names is None:
+        constraint_names = list(model.get("constraints") or [f"C{i+1}" for i in range(m_ub)])
+        constraint_names += [f"E{i+1}" for i in range(m - m_ub)]
+    variables_df = pd.DataFrame({
+        "value": x,
+        "reduced_cost": sign * d[:n],
+        "objective": sign * c,
+        "obj_allow_increase": obj_inc,
+        "obj_allow_decrease": obj_dec,
+    }, index=pd.Index(variable_names, name="variable"))
+    constraints_df = pd.DataFrame({
+        "usage": b - slack,
+        "rhs": b,
+        "slack": slack,
+        "shadow_price": sign * y,
+        "rhs_allow_increase": rhs_inc,
+        "rhs_allow_decrease": rhs_dec,
+    }, index=pd.Index(constraint_names, name="constraint"))
+    return variables_df, constraints_df
@@ -0,0 +1,314 @@
+"""Local HTTP/JSON solve service for Problem 13.8-5 and Problem 13.8-9.
+
+    python service.py --port 8765 --workers 4
+
+Endpoints:
+
+- ``POST /solve/13_8_5`` and ``POST /solve/13_8_9`` take one JSON object of
+  model inputs (missing keys fall back to the defaults in ``solver.py``) or a
+  list of them, and return one result object per input.
+- ``GET /health`` returns queue, batch and cache counters.
+
+Requests from all connections go into one bounded queue. A dispatcher thread
+drains it into micro-batches (up to ``max_batch`` models or ``max_wait``
+seconds), drops duplicate models within the batch and sends each batch to a
+process pool as a single task. When the queue is full the service answers
+``503`` with ``Retry-After`` instead of queueing without limit. Connections are
+HTTP/1.1 keep-alive. Results are cached by model hash (see ``solve_cache``).
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from solver import (
+    P1_DEFAULTS, P2_DEFAULTS, DEFAULT_METHOD, build_13_8_5, build_13_8_9, default_bounds, solve_model,
+)
+from solve_cache import SolveCache, model_key
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.002
+DEFAULT_MAX_QUEUE = 10_000
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class Overloaded(Exception):
+    """Raised when the request queue is full."""
+
+
+# ==============================================================================
+# MODEL DARI JSON
+# ==============================================================================
+def _vector(payload, key, defaults, length, allow_inf=False):
+    value = np.asarray(payload.get(key, defaults[key]), dtype=float)
+    if value.shape != (length,):
+        raise ValueError(f"'{key}' must have {length} values")
+    # NaN/inf ditolak di sini (400) sebelum model masuk ke batch solver
+    if np.isnan(value).any() or (not allow_inf and np.isinf(value).any()):
+        raise ValueError(f"'{key}' must contain finite numbers")
+    return value
+
+def model_13_8_5(payload):
+    A_ub = np.asarray(payload.get("A_ub", P1_DEFAULTS["A_ub"]), dtype=float)
+    if A_ub.shape != (2, 4):
+        raise ValueError("'A_ub' must be a 2 x 4 matrix")
+    if not np.isfinite(A_ub).all():
+        raise ValueError("'A_ub' must contain finite numbers")
+    return build_13_8_5(_vector(payload, "obj_coeffs", P1_DEFAULTS, 4), A_ub, _vector(payload, "b_ub", P1_DEFAULTS, 2),
+                        default_bounds(_vector(payload, "upper_bounds", P1_DEFAULTS, 4, allow_inf=True)))
+
+def model_13_8_9(payload):
+    cost_limit = float(payload.get("cost_limit", P2_DEFAULTS["cost_limit"]))
+    if not np.isfinite(cost_limit):
+        raise ValueError("'cost_limit' must be a finite number")
+    return build_13_8_9(_vector(payload, "obj_coeffs", P2_DEFAULTS, 4), _vector(payload, "cost_coeffs", P2_DEFAULTS, 4),
+                        cost_limit, default_bounds(_vector(payload, "upper_bounds", P2_DEFAULTS, 4, allow_inf=True)))
+
+MODEL_BUILDERS = {"13_8_5": model_13_8_5, "13_8_9": model_13_8_9}
+
+
+def result_dict(model, result):
+    """JSON-ready summary of a solve; objective and duals are in the model's own sense."""
+    sign = -1.0 if model.get("sense") == "max" else 1.0
+    out = {"success": bool(result.success), "status": int(result.status), "message": result.message}
+    if result.success:
+        out.update({
+            "objective": sign * float(result.fun),
+            "x": result.x.tolist(),
+            "slack": result.slack.tolist(),
+            "duals": (sign * result.ineqlin.marginals).tolist(),
+        })
+    return out
+
+def solve_models(models, method=DEFAULT_METHOD):
+    """Solves a batch of models in one worker task and returns ``(results, seconds)``."""
+    start = time.perf_counter()
+    results = [result_dict(model, solve_model(model, method)) for model in models]
+    return results, time.perf_counter() - start
+
+
+# ==============================================================================
+# MICRO-BATCHING
+# ==============================================================================
+class MicroBatcher:
+    """Coalesces concurrent solve requests into batches dispatched to a worker pool.
+
+    ``workers=1`` uses a single thread instead of a process pool. At most
+    ``2 * workers`` batches are in flight; beyond that the dispatcher waits,
+    the queue fills up and :meth:`submit` raises :class:`Overloaded`.
+    """
+
+    def __init__(self, workers=None, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT,
+                 max_queue=DEFAULT_MAX_QUEUE, method=DEFAULT_METHOD, cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.method = method
+        self.cache = SolveCache() if cache is None else cache
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._pool = ThreadPoolExecutor(1) if self.workers == 1 else ProcessPoolExecutor(self.workers)
+        self._in_flight = threading.BoundedSemaphore(2 * self.workers)
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched_models = 0
+        self._stopped = threading.Event()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="solve-batcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, model):
+        """Returns a ``Future`` resolving to the result dict of ``model``."""
+        with self._stats_lock:
+            self.requests += 1
+        key = model_key(model, self.method)
+        future = Future()
+        cached = self.cache.get(key)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+        try:
+            self._queue.put_nowait((key, model, future))
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected += 1
+            raise Overloaded("solve queue is full") from None
+        return future
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._stopped.set()
+                break
+            batch.append(item)
+        return batch
+
+    def _dispatch_loop(self):
+        while not self._stopped.is_set():
+            batch = self._collect()
+            if batch is None:
+                break
+            waiting = {}
+            for key, model, future in batch:
+                waiting.setdefault(key, (model, []))[1].append(future)
+            keys = list(waiting)
+            self._in_flight.acquire()
+            try:
+                task = self._pool.submit(solve_models, [waiting[k][0] for k in keys], self.method)
+            except RuntimeError as e:
+                self._in_flight.release()
+                for _, futures in waiting.values():
+                    for future in futures:
+                        future.set_exception(e)
+                break
+            task.add_done_callback(lambda done, keys=keys, waiting=waiting: self._complete(done, keys, waiting))
+            with self._stats_lock:
+                self.batches += 1
+                self.batched_models += len(batch)
+
+    def _complete(self, task, keys, waiting):
+        self._in_flight.release()
+        try:
+            results, seconds = task.result()
+        except Exception as e:
+            for _, futures in waiting.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        for key, result in zip(keys, results):
+            if result["success"]:
+                self.cache.put(key, result, seconds / len(keys))
+            for future in waiting[key][1]:
+                future.set_result(result)
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queue.qsize(),
+                "requests": self.requests,
+                "rejected": self.rejected,
+                "batches": self.batches,
+                "mean_batch_size": self.batched_models / self.batches if self.batches else 0.0,
+                "cache": self.cache.stats(),
+            }
+
+    def close(self):
+        self._stopped.set()
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+
+
+# ==============================================================================
+# HTTP
+# ==============================================================================
+class SolveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    batcher = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, code, body, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", **self.batcher.stats()})
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        # Body yang tidak dibaca akan terbaca sebagai request berikutnya, jadi koneksi ditutup
+        if length < 0:
+            self.close_connection = True
+            self._send_json(400, {"error": "Invalid Content-Length header"})
+            return
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": "Request body too large"})
+            return
+        body = self.rfile.read(length) if length else b""
+        problem = self.path.rstrip("/").rsplit("/", 1)[-1]
+        if not self.path.startswith("/solve/") or problem not in MODEL_BUILDERS:
+            self._send_json(404, {"error": f"Unknown path: {self.path}", "problems": list(MODEL_BUILDERS)})
+            return
+        try:
+            payload = json.loads(body or b"{}")
+            payloads = payload if isinstance(payload, list) else [payload]
+            models = [MODEL_BUILDERS[problem](p) for p in payloads]
+        except (ValueError, TypeError, AttributeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            futures = [self.batcher.submit(model) for model in models]
+        except Overloaded as e:
+            self._send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+            return
+        try:
+            results = [future.result() for future in futures]
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_json(200, results if isinstance(payload, list) else results[0])
+
+
+def make_server(host="127.0.0.1", port=DEFAULT_PORT, batcher=None):
+    """Returns a threading HTTP server whose handlers share ``batcher``."""
+    handler = type("BoundSolveHandler", (SolveHandler,), {"batcher": batcher or MicroBatcher()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON solve service for the 13.8-5 and 13.8-9 models")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="solver processes (default: CPU count)")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000)
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE)
+    args = parser.parse_args(argv)
+
+    batcher = MicroBatcher(args.workers, args.max_batch, args.max_wait_ms / 1000, args.max_queue)
+    server = make_server(args.host, args.port, batcher)
+    print(f"Serving on http://{args.host}:{args.port} with {batcher.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Persistent on-disk store of solved scenarios (SQLite).
+
+``SolveCache`` lives in memory and is gone after a restart; this store keeps
+optimal results on disk so a planning scenario that was solved once is never
+solved again. Every entry is keyed by the model hash (``model_key``) and,
+for Problem 13.8-5 and 13.8-9, also indexed by its input values, e.g.
+``cost_limit`` or ``obj_coeffs[2]``:
+
+- :meth:`SolutionStore.get` looks up an exact model,
+- :meth:`SolutionStore.query` returns all runs whose inputs lie in given
+  ranges ("every run with a budget between X and Y"),
+- :meth:`SolutionStore.nearest` finds the stored scenarios closest to a new
+  one, whose optimal basis can seed an ``IncrementalSolver``
+  (:meth:`SolutionStore.seed_incremental`).
+
+The database runs in WAL mode, so several app or worker processes can share
+one file.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+from lp_model import is_mip
+
+DEFAULT_STORE_PATH = os.environ.get("LP_SOLUTION_STORE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "solutions.sqlite3"))
+DEFAULT_QUERY_LIMIT = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    problem TEXT NOT NULL,
+    mip INTEGER NOT NULL,
+    created REAL NOT NULL,
+    solve_s REAL,
+    objective REAL,
+    params TEXT NOT NULL,
+    vector BLOB,
+    result TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS solutions_problem ON solutions (problem, mip);
+CREATE TABLE IF NOT EXISTS params (
+    key TEXT NOT NULL REFERENCES solutions (key) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS params_name_value ON params (name, value);
+CREATE INDEX IF NOT EXISTS params_key ON params (key);
+"""
+
+_RESULT_ARRAYS = ("x", "slack", "con")
+_MARGINALS = ("ineqlin", "eqlin", "lower", "upper")
+_RESULT_SCALARS = ("fun", "status", "success", "message", "nit", "mip_gap", "mip_node_count", "mip_dual_bound")
+
+
+# ==============================================================================
+# PARAMETER SKENARIO
+# ==============================================================================
+def scenario_params(problem, model):
+    """Recovers the model inputs of a 13.8-5 / 13.8-9 model dict (the payload format of ``service``).
+
+    Returns None for other problems; those are stored by model hash only.
+    """
+    objective = (-model["c"] if model.get("sense") == "max" else model["c"]).tolist()
+    upper_bounds = model["bounds"][:, 1].tolist()
+    if problem == "13_8_5":
+        return {"obj_coeffs": objective, "A_ub": model["A_ub"].toarray().tolist(),
+                "b_ub": model["b_ub"].tolist(), "upper_bounds": upper_bounds}
+    if problem == "13_8_9":
+        return {"obj_coeffs": objective, "cost_coeffs": model["A_ub"].toarray()[0].tolist(),
+                "cost_limit": float(model["b_ub"][0]), "upper_bounds": upper_bounds}
+    return None
+
+def flatten_params(params):
+    """Flattens nested inputs to ``{"cost_limit": ..., "obj_coeffs[0]": ..., "A_ub[1,2]": ...}``."""
+    flat = {}
+    for name, value in params.items():
+        value = np.asarray(value, dtype=float)
+        if value.ndim == 0:
+            flat[name] = float(value)
+        else:
+            for index, v in np.ndenumerate(value):
+                flat[f"{name}[{','.join(map(str, index))}]"] = float(v)
+    return flat
+
+def _result_to_json(result):
+    data = {}
+    for name in _RESULT_ARRAYS:
+        value = getattr(result, name, None)
+        data[name] = None if value is None else np.asarray(value, dtype=float).tolist()
+    for name in _MARGINALS:
+        value = getattr(result, name, None)
+        data[name] = None if value is None else np.asarray(value.marginals, dtype=float).tolist()
+    for name in _RESULT_SCALARS:
+        value = getattr(result, name, None)
+        data[name] = value.item() if isinstance(value, np.generic) else value
+    return json.dumps(data)
+
+def _result_from_json(text):
+    data = json.loads(text)
+    result = OptimizeResult({name: value for name, value in data.items() if value is not None and name in _RESULT_SCALARS})
+    for name in _RESULT_ARRAYS:
+        if data.get(name) is not None:
+            result[name] = np.asarray(data[name], dtype=float)
+    for name in _MARGINALS:
+        if data.get(name) is not None:
+            result[name] = OptimizeResult(marginals=np.asarray(data[name], dtype=float))
+    return result
+
+
+# ==============================================================================
+# STORE
+# ==============================================================================
+class SolutionStore:
+    """Thread-safe SQLite store of optimal results, keyed by model hash and indexed by input values."""
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, key, problem, model, result, seconds=None):
+        """Stores an optimal ``result`` of ``model``; other results and known keys are ignored."""
+        if result.status != 0:
+            return False
+        params = scenario_params(problem, model) or {}
+        flat = flatten_params(params)
+        vector = np.array(list(flat.values()), dtype=float).tobytes() if flat else None
+        objective = -float(result.fun) if model.get("sense") == "max" else float(result.fun)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO solutions (key, problem, mip, created, solve_s, objective, params, vector, result) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, problem, int(is_mip(model)), time.time(), seconds, objective, json.dumps(params), vector,
+                 _result_to_json(result)))
+            if cursor.rowcount:
+                self._conn.executemany("INSERT INTO params (key, name, value) VALUES (?, ?, ?)",
+                                       [(key, name, value) for name, value in flat.items()])
+        return bool(cursor.rowcount)
+
+    def get(self, key):
+        """Returns the stored result for ``key`` as an ``OptimizeResult``, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM solutions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _result_from_json(row[0])
+
+    def query(self, problem, ranges=None, limit=DEFAULT_QUERY_LIMIT):
+        """Returns the runs of ``problem`` whose inputs lie in ``ranges``, newest first.
+
+        ``ranges`` maps flattened input names to ``(low, high)`` (either side
+        may be None), e.g. ``{"cost_limit": (40_000, 60_000)}``. Every record
+        has ``key``, ``created``, ``solve_s``, ``objective``, ``mip`` and the
+        flattened ``params``.
+        """
+        sql = "SELECT s.key, s.created, s.solve_s, s.objective, s.mip, s.params FROM solutions s WHERE s.problem = ?"
+        args = [problem]
+        for name, (low, high) in (ranges or {}).items():
+            sql += " AND s.key IN (SELECT key FROM params WHERE name = ? AND value BETWEEN ? AND ?)"
+            args += [name, -np.inf if low is None else low, np.inf if high is None else high]
+        sql += " ORDER BY s.created DESC LIMIT ?"
+        args.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [{"key": key, "created": created, "solve_s": solve_s, "objective": objective, "mip": bool(mip),
+                 "params": flatten_params(json.loads(params))} for key, created, solve_s, objective, mip, params in rows]
+
+    def param_names(self, problem):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT p.name FROM params p JOIN solutions s ON s.key = p.key WHERE s.problem = ?",
+                (problem,)).fetchall()
+        return sorted(name for (name,) in rows)
+
+    def nearest(self, problem, model, k=1):
+        """Returns up to ``k`` ``(key, params, distance)`` of stored runs closest to ``model``.
+
+        Distance is Euclidean over the flattened inputs, each relative to the
+        query value (at least 1), among runs of the same problem and kind
+        (LP or MILP) with the same number of inputs.
+        """
+        params = scenario_params(problem, model)
+        if not params:
+            return []
+        target = np.array(list(flatten_params(params).values()))
+        with self._lock:
+            rows = self._conn.execute("SELECT key, params, vector FROM solutions WHERE problem = ? AND mip = ? AND vector IS NOT NULL",
+                                      (problem, int(is_mip(model)))).fetchall()
+        rows = [row for row in rows if len(row[2]) == target.nbytes]
+        if not rows:
+            return []
+        vectors = np.frombuffer(b"".join(row[2] for row in rows), dtype=float).reshape(len(rows), -1)
+        distance = np.linalg.norm((vectors - target) / np.maximum(1.0, np.abs(target)), axis=1)
+        order = np.argsort(distance)[:k]
+        return [(rows[i][0], json.loads(rows[i][1]), float(distance[i])) for i in order]
+
+    def seed_incremental(self, incremental, problem, model, build):
+        """Seeds an empty ``IncrementalSolver`` with the optimal basis of the nearest stored scenario.
+
+        ``build`` turns stored inputs back into a model dict (e.g.
+        ``service.MODEL_BUILDERS[problem]``). Returns True when a basis was
+        stored; the solver then checks it against ``model`` as usual.
+        """
+        if incremental.bases or is_mip(model):
+            return False
+        for key, params, _ in self.nearest(problem, model):
+            result = self.get(key)
+            if result is not None and getattr(result, "lower", None) is not None:
+                incremental.update(build(params), result)
+                return bool(incremental.bases)
+        return False
+
+    def stats(self):
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM solutions").fetchone()
+        return {"entries": count, "hits": self.hits, "misses": self.misses, "path": self.path}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,117 @@
+"""Content-addressed LRU cache for LP solves.
+
+Keys are a hash of the normalized model inputs (c, A_ub, b_ub, A_eq, b_eq,
+bounds and method), so identical models built on different reruns or
+sessions share one entry. The cache is process-wide and thread-safe.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse as sp
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def model_key(model, method, options=None):
+    """Returns a stable hex digest for a model dict, solver method and solver options.
+
+    ``time_limit`` is left out of the key: only results that finished within
+    their limit are cached, and those do not depend on it.
+    """
+    h = hashlib.sha256()
+    for name in ("c", "A_ub", "b_ub", "A_eq", "b_eq", "bounds", "integrality"):
+        h.update(name.encode())
+        value = model.get(name)
+        if value is None:
+            continue
+        if sp.issparse(value):
+            value = sp.csr_matrix(value)
+            if not value.has_canonical_format:
+                value = value.copy()
+                value.sum_duplicates()
+            parts = (value.indptr, value.indices, value.data)
+        else:
+            value = np.asarray(value, dtype=float)
+            parts = (value,)
+        h.update(str(value.shape).encode())
+        for part in parts:
+            h.update(np.ascontiguousarray(part).tobytes())
+    h.update(method.encode())
+    for name, value in sorted((options or {}).items()):
+        if name != "time_limit":
+            h.update(f"{name}={value!r}".encode())
+    return h.hexdigest()
+
+
+class SolveCache:
+    """Thread-safe LRU mapping of model keys to solver results with hit/miss counters."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.time_saved = 0.0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.time_saved += entry[1]
+            return entry[0]
+
+    def put(self, key, result, solve_time):
+        with self._lock:
+            self._entries[key] = (result, solve_time)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.time_saved = 0.0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "time_saved_s": self.time_saved,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def cached_solve(cache, model, method, solve):
+    """Returns ``solve(model, method)`` from the cache, solving it on a miss.
+
+    Only optimal results (status 0) are stored, as in ``jobs`` and
+    ``solution_store``: a result stopped at a limit or a failed solve is
+    solved again next time.
+    """
+    key = model_key(model, method)
+    result = cache.get(key)
+    if result is None:
+        start = time.perf_counter()
+        result = solve(model, method)
+        if result.status == 0:
+            cache.put(key, result, time.perf_counter() - start)
+    return result
@@ -0,0 +1,151 @@
+"""Headless solver core for the OR case study models.
+
+Builds and solves Problem 13.8-5 (production planning) and Problem 13.8-9
+(resource allocation) without importing Streamlit, so batch jobs and worker
+processes can use the models directly.
+"""
+import numpy as np
+from scipy.optimize import linprog, milp
+
+from knapsack import is_knapsack, solve_knapsack
+from lp_model import make_model, linprog_args, milp_args, is_mip
+from solve_cache import cached_solve
+
+# scipy belum mengenal status HiGHS 16 (batas node) dan melaporkannya sebagai status 4
+_NODE_LIMIT_MARKER = "HiGHS Status 16"
+NODE_LIMIT_MESSAGE = "Node limit reached."
+
+# ==============================================================================
+# DATA DEFAULT MODEL
+# ==============================================================================
+P1_VARIABLES = ['x₁₁ (Gergaji Reg)', 'x₁₂ (Gergaji OT)', 'x₂₁ (Bor Reg)', 'x₂₂ (Bor OT)']
+P1_DEFAULTS = {
+    "obj_coeffs": [150, 50, 100, 75],
+    "A_ub": [[1, 1, 1, 1], [2, 2, 1, 1]],
+    "b_ub": [10000, 15000],
+    "upper_bounds": [3000, 2000, 5000, 3000],
+}
+
+P2_VARIABLES = ['x₁ᴿ (Reguler P1)', 'x₁ᴼ (Lembur P1)', 'x₂ᴿ (Reguler P2)', 'x₂ᴼ (Lembur P2)']
+P2_DEFAULTS = {
+    "obj_coeffs": [1, 1, 1, 1],
+    "cost_coeffs": [15, 25, 16, 24],
+    "cost_limit": 60000,
+    "upper_bounds": [2000, 1000, 1000, 500],
+}
+
+DEFAULT_METHOD = 'highs'
+# Opsi HiGHS yang diterima scipy.optimize.milp
+MILP_OPTIONS = ("disp", "presolve", "time_limit", "node_limit", "mip_rel_gap")
+
+
+# ==============================================================================
+# MODEL BUILDERS
+# ==============================================================================
+def build_13_8_5(obj_coeffs, A_ub, b_ub, bounds, integrality=None):
+    """Returns the production planning model (maximize profit) as a generic model dict."""
+    return make_model(obj_coeffs, A_ub, b_ub, bounds, sense="max", variables=P1_VARIABLES,
+                      constraints=["Total Machine Capacity", "Production Capacity"], integrality=integrality)
+
+def build_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds):
+    """Returns the resource allocation model (maximize output) as a generic model dict."""
+    return make_model(obj_coeffs, [cost_coeffs], [cost_limit], bounds, sense="max", variables=P2_VARIABLES,
+                      constraints=["Budget"])
+
+def default_bounds(upper_bounds):
+    return [(0, ub) for ub in upper_bounds]
+
+
+# ==============================================================================
+# SOLVE
+# ==============================================================================
+def solve_model(model, method=DEFAULT_METHOD, options=None):
+    """Solves a model dict (see ``lp_model``) and returns the scipy OptimizeResult.
+
+    ``options`` is passed to ``linprog`` (e.g. ``{"time_limit": 10}`` for HiGHS).
+    Models with integer variables go to :func:`solve_milp` instead. With the
+    default method, single-row models such as 13.8-9 are solved in closed
+    form (see ``knapsack``); name a HiGHS variant to force ``linprog``.
+    """
+    if is_mip(model):
+        return solve_milp(model, options)
+    if method == DEFAULT_METHOD and is_knapsack(model):
+        return solve_knapsack(model)
+    return linprog(method=method, options=options, **linprog_args(model))
+
+def solve_milp(model, options=None):
+    """Solves a model with integer variables using HiGHS branch and bound (``scipy.optimize.milp``).
+
+    ``options`` may set ``time_limit``, ``mip_rel_gap`` and ``node_limit``.
+    When a limit stops the search (see :func:`mip_limit`), ``x`` and ``fun``
+    hold the best incumbent found so far, if any, and ``mip_gap`` its relative
+    gap to the dual bound. ``slack`` of the inequality rows is added for any
+    solution.
+    """
+    options = {k: v for k, v in (options or {}).items() if k in MILP_OPTIONS and v is not None}
+    result = milp(options=options, **milp_args(model))
+    if result.status == 4 and _NODE_LIMIT_MARKER in result.message:
+        result.message = NODE_LIMIT_MESSAGE
+        result.node_limit = True
+    if result.x is not None:
+        result.slack = model["b_ub"] - model["A_ub"] @ result.x
+    return result
+
+def mip_limit(result):
+    """``"time"`` or ``"node"`` when that limit stopped a MILP solve, otherwise None.
+
+    scipy reports the time limit as status 1. The node limit (HiGHS status 16,
+    "solution limit reached") comes back as status 4 with an unrecognized
+    status message; :func:`solve_milp` replaces that message and sets
+    ``node_limit``.
+    """
+    if not hasattr(result, "mip_gap") or result.success:
+        return None
+    if getattr(result, "node_limit", False):
+        return "node"
+    return "time" if result.status == 1 else None
+
+def has_incumbent(result):
+    """True for a MILP stopped at a limit that still found a feasible solution."""
+    return mip_limit(result) is not None and getattr(result, "x", None) is not None
+
+def solve_cached(model, method=DEFAULT_METHOD, cache=None):
+    """Like :func:`solve_model`, but looks the model up in a ``SolveCache`` first when one is given."""
+    if cache is None:
+        return solve_model(model, method)
+    return cached_solve(cache, model, method, solve_model)
+
+def solve_13_8_5(obj_coeffs, A_ub, b_ub, bounds, method=DEFAULT_METHOD, cache=None, integrality=None):
+    return solve_cached(build_13_8_5(obj_coeffs, A_ub, b_ub, bounds, integrality), method, cache)
+
+def solve_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds, method=DEFAULT_METHOD, cache=None):
+    return solve_cached(build_13_8_9(obj_coeffs, cost_coeffs, cost_limit, bounds), method, cache)
+
+
+# ==============================================================================
+# POST-PROCESSING (VECTORIZED)
+# ==============================================================================
+def postprocess_13_8_5(x, obj_coeffs, A_ub, b_ub):
+    """Computes usage, slack, utilization and profit contributions for one or many scenarios.
+
+    Inputs may carry a leading batch axis: ``x`` and ``obj_coeffs`` of shape (n, 4),
+    ``A_ub`` of shape (n, 2, 4) and ``b_ub`` of shape (n, 2). Single scenarios
+    without the batch axis work the same way.
+    """
+    x = np.asarray(x, dtype=float)
+    obj_coeffs = np.asarray(obj_coeffs, dtype=float)
+    A_ub = np.asarray(A_ub, dtype=float)
+    b_ub = np.asarray(b_ub, dtype=float)
+
+    contributions = x * obj_coeffs
+    usage = np.einsum('...ij,...j->...i', A_ub, x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        utilization = usage / b_ub * 100
+    return {
+        "profit": contributions.sum(axis=-1),
+        "total_production": x.sum(axis=-1),
+        "contributions": contributions,
+        "usage": usage,
+        "slack": b_ub - usage,
+        "utilization": utilization,
+    }
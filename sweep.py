@@ -0,0 +1,106 @@
+"""Parallel parameter sweeps for Problem 13.8-9 (budget allocation).
+
+A sweep solves the allocation model for many (cost vector, budget) points.
+Points are split into chunks that are solved in a process pool; at most
+``max_pending`` chunks are in flight at once and results are returned in the
+original point order. With the default method and finite upper bounds every
+chunk is solved in one vectorized call of the closed-form knapsack solver
+(see ``knapsack``) instead of one ``linprog`` call per point.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from knapsack import solve_knapsack_batch
+from solver import P2_DEFAULTS, DEFAULT_METHOD, build_13_8_9, default_bounds, solve_model
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def grid_13_8_9(budgets, cost_vectors):
+    """Builds the full grid of every cost vector combined with every budget.
+
+    Returns ``(costs, budgets)`` with shapes (n, 4) and (n,), where
+    n = len(cost_vectors) * len(budgets).
+    """
+    cost_vectors = np.atleast_2d(np.asarray(cost_vectors, dtype=float))
+    budgets = np.asarray(budgets, dtype=float).ravel()
+    costs = np.repeat(cost_vectors, len(budgets), axis=0)
+    return costs, np.tile(budgets, len(cost_vectors))
+
+def _solve_chunk_13_8_9(obj_coeffs, costs, budgets, upper_bounds, method):
+    if method == DEFAULT_METHOD and np.isfinite(upper_bounds).all():
+        n = len(budgets)
+        shape = (n, len(obj_coeffs))
+        out = solve_knapsack_batch(np.broadcast_to(-np.asarray(obj_coeffs, dtype=float), shape), costs, budgets,
+                                   np.zeros(shape), np.broadcast_to(np.asarray(upper_bounds, dtype=float), shape))
+        return out["x"], -out["fun"], out["status"]
+    bounds = default_bounds(upper_bounds)
+    n = len(budgets)
+    x = np.full((n, len(obj_coeffs)), np.nan)
+    output = np.full(n, np.nan)
+    status = np.zeros(n, dtype=int)
+    for k in range(n):
+        result = solve_model(build_13_8_9(obj_coeffs, costs[k], budgets[k], bounds), method)
+        status[k] = result.status
+        if result.success:
+            x[k] = result.x
+            output[k] = -result.fun
+    return x, output, status
+
+def iter_sweep_13_8_9(costs, budgets, obj_coeffs=None, upper_bounds=None, workers=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None, method=DEFAULT_METHOD):
+    """Yields ``(start, x, output, status)`` for each chunk, in point order.
+
+    ``workers=1`` solves in the calling process. Otherwise chunks are sent to a
+    process pool with at most ``max_pending`` (default ``2 * workers``) chunks
+    submitted but not yet collected, which bounds memory on very large grids.
+    """
+    obj_coeffs = list(P2_DEFAULTS["obj_coeffs"] if obj_coeffs is None else obj_coeffs)
+    upper_bounds = list(P2_DEFAULTS["upper_bounds"] if upper_bounds is None else upper_bounds)
+    costs = np.atleast_2d(np.asarray(costs, dtype=float))
+    budgets = np.asarray(budgets, dtype=float).ravel()
+    if len(costs) != len(budgets):
+        raise ValueError("costs and budgets must have the same number of points")
+
+    starts = range(0, len(budgets), chunk_size)
+    chunks = ((s, costs[s:s + chunk_size], budgets[s:s + chunk_size]) for s in starts)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for start, cost_chunk, budget_chunk in chunks:
+            yield (start,) + _solve_chunk_13_8_9(obj_coeffs, cost_chunk, budget_chunk, upper_bounds, method)
+        return
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, cost_chunk, budget_chunk in chunks:
+            pending.append((start, pool.submit(_solve_chunk_13_8_9, obj_coeffs, cost_chunk, budget_chunk, upper_bounds, method)))
+            if len(pending) >= max_pending:
+                start_done, future = pending.popleft()
+                yield (start_done,) + future.result()
+        while pending:
+            start_done, future = pending.popleft()
+            yield (start_done,) + future.result()
+
+def sweep_13_8_9(costs, budgets, **kwargs):
+    """Runs a full sweep and returns a dict of arrays ``x``, ``output`` and ``status``.
+
+    Keyword arguments are passed to :func:`iter_sweep_13_8_9`.
+    """
+    costs = np.atleast_2d(np.asarray(costs, dtype=float))
+    n = len(costs)
+    obj_coeffs = kwargs.get("obj_coeffs")
+    n_vars = len(P2_DEFAULTS["obj_coeffs"] if obj_coeffs is None else obj_coeffs)
+    x = np.full((n, n_vars), np.nan)
+    output = np.full(n, np.nan)
+    status = np.zeros(n, dtype=int)
+    for start, x_chunk, output_chunk, status_chunk in iter_sweep_13_8_9(costs, budgets, **kwargs):
+        stop = start + len(output_chunk)
+        x[start:stop] = x_chunk
+        output[start:stop] = output_chunk
+        status[start:stop] = status_chunk
+    return {"x": x, "output": output, "status": status}
@@ -0,0 +1,1064 @@
+"""Localized UI texts (Bahasa Indonesia & English).
+
+``TEXTS`` maps every key to either a plain string or a ``{"id": ..., "en": ...}``
+dict. ``text_bundle(lang)`` flattens it into one dict per language, built once
+per process, so a lookup during a rerun is a single dict access.
+"""
+from functools import lru_cache
+
+LANGUAGES = ("id", "en")
+
+# ==============================================================================
+# KAMUS TEKS UNTUK MULTI-BAHASA (INDONESIA & INGGRIS)
+# ==============================================================================
+TEXTS = {
+    # Teks Umum & Sidebar
+    "lang_select_label": "Pilih Bahasa / Select Language",
+    "main_header_title": {
+        "id": "📊 Pemecah Studi Kasus Riset Operasi",
+        "en": "📊 Operations Research Case Study Solver"
+    },
+    "main_header_subtitle": {
+        "id": "Solusi Optimal untuk Perencanaan Produksi & Alokasi Sumber Daya",
+        "en": "Optimal Solutions for Production Planning & Resource Allocation"
+    },
+    "sidebar_problem_select_header": {
+        "id": "🎯 Pilih Masalah",
+        "en": "🎯 Select Problem"
+    },
+    "sidebar_problem_select_help": {
+        "id": "Pilih masalah yang ingin diselesaikan",
+        "en": "Choose the problem you want to solve"
+    },
+    "sidebar_info_header": {
+        "id": "ℹ️ Informasi",
+        "en": "ℹ️ Information"
+    },
+    "sidebar_method_header": {
+        "id": "📚 Metode",
+        "en": "📚 Methods"
+    },
+    "sidebar_incremental": {
+        "id": "⚡ Re-solve inkremental",
+        "en": "⚡ Incremental re-solve"
+    },
+    "sidebar_incremental_help": {
+        "id": "Menyimpan basis optimal terakhir. Jika setelah perubahan input basis tersebut terbukti masih optimal, hasil dihitung langsung tanpa memanggil solver.",
+        "en": "Keeps the last optimal basis. If it is provably still optimal after an input change, the result is computed directly without calling the solver."
+    },
+    "sidebar_store": {
+        "id": "Simpan solusi ke disk",
+        "en": "Store solutions on disk"
+    },
+    "sidebar_store_help": {
+        "id": "Solusi optimal disimpan di basis data SQLite lokal dan tetap ada setelah aplikasi dimulai ulang. Skenario yang sama tidak diselesaikan dua kali, dan skenario tersimpan terdekat dipakai sebagai basis awal untuk re-solve inkremental.",
+        "en": "Optimal solutions are kept in a local SQLite database and survive app restarts. The same scenario is never solved twice, and the nearest stored scenario seeds the incremental re-solve."
+    },
+    "sidebar_store_stats": {
+        "id": "- **Solusi tersimpan di disk**: {entries} (hit {hits}, miss {misses})",
+        "en": "- **Solutions stored on disk**: {entries} ({hits} hits, {misses} misses)"
+    },
+    "store_reused": {
+        "id": "💾 Skenario ini sudah pernah diselesaikan; hasil diambil dari penyimpanan solusi di disk.",
+        "en": "💾 This scenario was solved before; the result comes from the on-disk solution store."
+    },
+    "store_header": {
+        "id": "💾 Riwayat Skenario Tersimpan",
+        "en": "💾 Stored Scenario History"
+    },
+    "store_help": {
+        "id": "Cari semua run tersimpan yang salah satu inputnya berada dalam rentang tertentu, misalnya semua run dengan anggaran antara X dan Y.",
+        "en": "Find every stored run with one of its inputs in a given range, e.g. all runs with a budget between X and Y."
+    },
+    "store_empty": {
+        "id": "Belum ada skenario tersimpan untuk problem ini.",
+        "en": "No stored scenarios for this problem yet."
+    },
+    "store_param_label": {
+        "id": "Input",
+        "en": "Input"
+    },
+    "store_low_label": {
+        "id": "Dari",
+        "en": "From"
+    },
+    "store_high_label": {
+        "id": "Sampai",
+        "en": "To"
+    },
+    "store_query_button": {
+        "id": "Cari Run",
+        "en": "Find Runs"
+    },
+    "store_found": {
+        "id": "{count} run ditemukan (terbaru lebih dulu).",
+        "en": "{count} runs found (newest first)."
+    },
+    "store_col_created": {
+        "id": "Waktu",
+        "en": "Time"
+    },
+    "store_col_objective": {
+        "id": "Nilai Objektif",
+        "en": "Objective Value"
+    },
+    "store_col_solve_s": {
+        "id": "Waktu Solve (s)",
+        "en": "Solve Time (s)"
+    },
+    "incremental_reused": {
+        "id": "⚡ Basis sebelumnya masih optimal; solver tidak dipanggil. Input yang berubah: {changes}",
+        "en": "⚡ The previous basis is still optimal; the solver was not called. Changed inputs: {changes}"
+    },
+    "auto_solve_label": {
+        "id": "🔄 Solve otomatis saat input berubah",
+        "en": "🔄 Auto-solve on input change"
+    },
+    "auto_solve_help": {
+        "id": "Model diselesaikan ulang setelah input berhenti berubah sejenak. Input yang sama tidak diselesaikan dua kali, dan hasil hanya digambar ulang jika solusi optimal berubah.",
+        "en": "The model is re-solved once the inputs stop changing for a moment. Identical inputs are not solved twice, and results are only redrawn when the optimal solution changes."
+    },
+    "auto_solve_waiting": {
+        "id": "⏳ Menunggu input selesai diubah...",
+        "en": "⏳ Waiting for edits to settle..."
+    },
+    "auto_solve_unchanged": {
+        "id": "✔️ Solusi optimal tidak berubah.",
+        "en": "✔️ The optimal solution did not change."
+    },
+    "sidebar_time_limit": {
+        "id": "⏱️ Batas waktu solve (detik)",
+        "en": "⏱️ Solve time limit (seconds)"
+    },
+    "sidebar_time_limit_help": {
+        "id": "0 = tanpa batas. Solve dijalankan di latar belakang dan dihentikan HiGHS saat batas waktu tercapai.",
+        "en": "0 = no limit. Solves run in the background and HiGHS stops them when the limit is reached."
+    },
+    "sidebar_jobs_active": {
+        "id": "Job solve aktif di server: {active}",
+        "en": "Active solve jobs on the server: {active}"
+    },
+    "job_running": {
+        "id": "⏳ Job {id} sedang berjalan... ({elapsed:.1f} detik)",
+        "en": "⏳ Job {id} is running... ({elapsed:.1f} s)"
+    },
+    "job_cancel_button": {
+        "id": "✖️ Batalkan Solve",
+        "en": "✖️ Cancel Solve"
+    },
+    "job_cancelled": {
+        "id": "Solve dibatalkan.",
+        "en": "Solve cancelled."
+    },
+    "sidebar_cache_header": {
+        "id": "⚡ Cache Solver",
+        "en": "⚡ Solver Cache"
+    },
+    "sidebar_cache_stats": {
+        "id": "- **Hit**: {hits}\n- **Miss**: {misses}\n- **Rasio hit**: {hit_rate:.1%}\n- **Entri**: {entries}/{max_entries}\n- **Waktu solver dihemat**: {time_saved_s:.3f} s",
+        "en": "- **Hits**: {hits}\n- **Misses**: {misses}\n- **Hit rate**: {hit_rate:.1%}\n- **Entries**: {entries}/{max_entries}\n- **Solver time saved**: {time_saved_s:.3f} s"
+    },
+    "sidebar_profile_header": {
+        "id": "⏱️ Profil Kinerja",
+        "en": "⏱️ Performance Profile"
+    },
+    "sidebar_profile_caption": {
+        "id": "Waktu per fase (ms) dari {reruns} rerun terakhir, semua sesi.",
+        "en": "Time per phase (ms) over the last {reruns} reruns, all sessions."
+    },
+    "sidebar_profile_download": {
+        "id": "⬇️ Unduh Profil (JSON)",
+        "en": "⬇️ Download Profile (JSON)"
+    },
+    "sidebar_show_charts": {
+        "id": "📊 Tampilkan grafik",
+        "en": "📊 Show charts"
+    },
+    "sidebar_show_charts_help": {
+        "id": "Matikan untuk melewati pembuatan grafik sepenuhnya (lebih cepat untuk model besar).",
+        "en": "Turn off to skip chart construction entirely (faster for large models)."
+    },
+    "p1_guide_header": {
+        "id": "📖 Panduan Penggunaan - Perencanaan Produksi",
+        "en": "📖 User Guide - Production Planning"
+    },
+    "p2_guide_header": {
+        "id": "📖 Panduan Penggunaan - Alokasi Sumber Daya",
+        "en": "📖 User Guide - Resource Allocation"
+    },
+
+    "p1_guide_content": {
+        "id": """
+    Panduan ini membantu Anda memahami cara menggunakan solver untuk masalah perencanaan produksi.
+
+    #### **1. Pahami Tujuan & Variabel**
+    - **Tujuan**: Memaksimalkan total profit dari semua unit yang diproduksi.
+    - **Variabel Keputusan**:
+        - `x₁₁ (Gergaji Reg)`: Jumlah unit yang diproduksi mesin gergaji pada waktu reguler.
+        - `x₁₂ (Gergaji OT)`: Jumlah unit yang diproduksi mesin gergaji pada waktu lembur.
+        - `x₂₁ (Bor Reg)`: Jumlah unit yang diproduksi mesin bor pada waktu reguler.
+        - `x₂₂ (Bor OT)`: Jumlah unit yang diproduksi mesin bor pada waktu lembur.
+
+    #### **2. Atur Parameter Input**
+    - **Fungsi Tujuan**: Masukkan nilai profit yang didapat dari setiap unit produk.
+    - **Batasan**: Definisikan batasan sumber daya yang tersedia.
+    - **Batasan Variabel**: Masukkan kapasitas produksi maksimal untuk setiap jenis proses.
+
+    #### **3. Selesaikan dan Analisis**
+    1. Setelah semua parameter sesuai, klik tombol **Selesaikan Masalah Produksi**.
+    2. Hasilnya akan muncul di bawah, menunjukkan alokasi produksi optimal untuk profit maksimal.
+    """,
+        "en": """
+    This guide helps you understand how to use the solver for the production planning problem.
+
+    #### **1. Understand the Goal & Variables**
+    - **Goal**: To maximize the total profit from all units produced.
+    - **Decision Variables**:
+        - `x₁₁ (Gergaji Reg)`: Number of units produced by the saw during regular time.
+        - `x₁₂ (Gergaji OT)`: Number of units produced by the saw during overtime.
+        - `x₂₁ (Bor Reg)`: Number of units produced by the drill during regular time.
+        - `x₂₂ (Bor OT)`: Number of units produced by the drill during overtime.
+
+    #### **2. Set the Input Parameters**
+    - **Objective Function**: Enter the profit value gained from each product unit.
+    - **Constraints**: Define the resource limitations.
+    - **Variable Bounds**: Input the maximum capacity for each specific production type.
+
+    #### **3. Solve and Analyze**
+    1. After all parameters are set, click the **Solve Production Problem** button.
+    2. The results will appear below, showing the optimal production plan for maximum profit.
+    """
+    },
+    "p2_guide_content": {
+        "id": """
+    Panduan ini membantu Anda menggunakan solver untuk masalah alokasi sumber daya.
+
+    #### **1. Pahami Tujuan & Variabel**
+    - **Tujuan**: Memaksimalkan total output (jumlah total unit) dari kedua produk.
+    - **Variabel Keputusan**:
+        - `x₁ᴿ (Reguler P1)`: Unit Produk 1 (Waktu Reguler).
+        - `x₁ᴼ (Lembur P1)`: Unit Produk 1 (Lembur).
+        - `x₂ᴿ (Reguler P2)`: Unit Produk 2 (Waktu Reguler).
+        - `x₂ᴼ (Lembur P2)`: Unit Produk 2 (Lembur).
+
+    #### **2. Atur Parameter Input**
+    - **Fungsi Tujuan**: Koefisien `1` berarti setiap unit dihitung sama dalam total output.
+    - **Batasan Anggaran**: Definisikan biaya per unit dan total anggaran yang tersedia.
+    - **Batasan Kapasitas**: Masukkan batas produksi maksimal untuk setiap jenis produk.
+
+    #### **3. Selesaikan dan Analisis**
+    1. Pastikan semua nilai biaya, anggaran, dan kapasitas sudah benar.
+    2. Klik tombol **Selesaikan Masalah Alokasi**.
+    3. Hasilnya akan menunjukkan jumlah unit optimal untuk diproduksi agar total output maksimal sesuai anggaran.
+    """,
+        "en": """
+    This guide helps you use the solver for the resource allocation problem.
+
+    #### **1. Understand the Goal & Variables**
+    - **Goal**: To maximize the total output (total number of units) from both products.
+    - **Decision Variables**:
+        - `x₁ᴿ (Reguler P1)`: Units of Product 1 (Regular time).
+        - `x₁ᴼ (Lembur P1)`: Units of Product 1 (Overtime).
+        - `x₂ᴿ (Reguler P2)`: Units of Product 2 (Regular time).
+        - `x₂ᴼ (Lembur P2)`: Units of Product 2 (Overtime).
+
+    #### **2. Set the Input Parameters**
+    - **Objective Function**: The default coefficient of `1` means every unit contributes equally to the total output.
+    - **Budget Constraint**: Define the cost per unit and the total available budget.
+    - **Capacity Bounds**: Input the maximum production limit for each individual product type.
+
+    #### **3. Solve and Analyze**
+    1. Ensure all cost, budget, and capacity values are correct.
+    2. Click the **Solve Allocation Problem** button.
+    3. The results will show the optimal number of units to produce for maximum output within the budget.
+    """
+    },
+    "input_parameters_header": {
+        "id": "⚙️ Parameter Input",
+        "en": "⚙️ Input Parameters"
+    },
+    "solve_optimization_header": {
+        "id": "🚀 Selesaikan Optimisasi",
+        "en": "🚀 Solve Optimization"
+    },
+
+    # Teks untuk Masalah 1: Perencanaan Produksi
+    "p1_title": {
+        "id": "🏭 Masalah 1: Perencanaan Produksi",
+        "en": "🏭 Problem 1: Production Planning"
+    },
+    "p1_desc": {
+        "id": "Perusahaan memproduksi produk menggunakan mesin gergaji dan bor. Setiap mesin memiliki waktu operasi reguler dan lembur dengan profit yang berbeda.",
+        "en": "A company manufactures products using a saw and a drill. Each machine has regular and overtime operational hours with different profit margins."
+    },
+    "p1_info": {
+        "id": "**Perencanaan Produksi**: Optimalisasi produksi dengan mesin gergaji dan bor, mempertimbangkan waktu reguler dan lembur.",
+        "en": "**Production Planning**: Optimizing production with a saw and a drill, considering regular and overtime hours."
+    },
+    "p1_solve_button": {
+        "id": "Selesaikan Masalah Produksi",
+        "en": "Solve Production Problem"
+    },
+    "p1_obj_func_header": {
+        "id": "💰 Fungsi Tujuan (Maksimalkan Profit)",
+        "en": "💰 Objective Function (Maximize Profit)"
+    },
+    "p1_constraints_header": {
+        "id": "⚖️ Batasan (Constraints)",
+        "en": "⚖️ Constraints"
+    },
+    "p1_constraint1_label": {
+        "id": "**Batasan 1:** Total Kapasitas Mesin",
+        "en": "**Constraint 1:** Total Machine Capacity"
+    },
+    "p1_constraint2_label": {
+        "id": "**Batasan 2:** Kapasitas Produksi",
+        "en": "**Constraint 2:** Production Capacity"
+    },
+    "p1_bounds_header": {
+        "id": "🔢 Batasan Variabel (Bounds)",
+        "en": "🔢 Variable Bounds"
+    },
+    "p1_df_profit_col": {
+        "id": "Profit Unit ($)",
+        "en": "Unit Profit ($)"
+    },
+    "p1_df_totalprofit_col": {
+        "id": "Total Profit ($)",
+        "en": "Total Profit ($)"
+    },
+    "p1_df_constraint_col": {
+        "id": "Batasan",
+        "en": "Constraint"
+    },
+    "p1_df_constraints": {
+        "id": ['Total Kapasitas Mesin', 'Kapasitas Produksi'],
+        "en": ['Total Machine Capacity', 'Production Capacity']
+    },
+    "p1_metric_profit": {
+        "id": "Profit Maksimum",
+        "en": "Maximum Profit"
+    },
+    "p1_metric_production": {
+        "id": "Total Produksi",
+        "en": "Total Production"
+    },
+    "p1_metric_c1": {
+        "id": "Penggunaan Batasan 1",
+        "en": "Constraint 1 Usage"
+    },
+    "p1_metric_c2": {
+        "id": "Penggunaan Batasan 2",
+        "en": "Constraint 2 Usage"
+    },
+    "p1_chart1_title": {
+        "id": "Nilai Produksi Optimal",
+        "en": "Optimal Production Values"
+    },
+    "p1_chart2_title": {
+        "id": "Kontribusi Profit per Variabel",
+        "en": "Profit Contribution by Variable"
+    },
+    "p1_interpretation_title": {
+        "id": "💡 Interpretasi Hasil",
+        "en": "💡 Result Interpretation"
+    },
+    "p1_interpretation_text": {
+        "id": "Untuk mencapai **profit maksimum sebesar ${profit:,.2f}**, rencana produksi yang optimal adalah dengan **fokus memproduksi {val1:.0f} unit menggunakan Gergaji Reguler dan {val3:.0f} unit menggunakan Bor Reguler** hingga kapasitas maksimalnya. Produksi lembur (`Gergaji OT` dan `Bor OT`) tidak digunakan sama sekali, menandakan bahwa opsi ini tidak efisien secara biaya dibandingkan produksi reguler. Rencana ini sepenuhnya memanfaatkan kapasitas produksi yang ada (`Batasan 2` terpakai 100%), menunjukkan alokasi sumber daya yang sangat efisien.",
+        "en": "To achieve the **maximum profit of ${profit:,.2f}**, the optimal production plan is to **focus on producing {val1:.0f} units using the Regular Saw and {val3:.0f} units using the Regular Drill** to their maximum capacities. Overtime production (`Gergaji OT` and `Bor OT`) is not utilized at all, indicating it is not cost-effective compared to regular production. This plan fully utilizes the available production capacity (`Constraint 2` is at 100% usage), demonstrating a highly efficient allocation of resources."
+    },
+    "p1_pareto_header": {
+        "id": "⚖️ Frontier Pareto: Profit vs Lembur",
+        "en": "⚖️ Pareto Frontier: Profit vs Overtime"
+    },
+    "p1_pareto_help": {
+        "id": "Menghitung semua rencana yang tidak terdominasi antara profit dan total produksi lembur (x₁₂ + x₂₂) dengan metode epsilon-constraint. Titik hanya diselesaikan di tempat frontier berbelok, dan kolom trade-off menunjukkan tambahan profit per unit lembur pada setiap segmen.",
+        "en": "Computes every non-dominated plan between profit and total overtime production (x₁₂ + x₂₂) with the epsilon-constraint method. Points are only solved where the frontier bends, and the trade-off column shows the extra profit per unit of overtime on each segment."
+    },
+    "p1_pareto_criterion_label": {
+        "id": "Total Produksi Lembur (x₁₂ + x₂₂)",
+        "en": "Total Overtime Production (x₁₂ + x₂₂)"
+    },
+    "p1_pareto_value_label": {
+        "id": "Profit Optimal ($)",
+        "en": "Optimal Profit ($)"
+    },
+    "p1_pareto_chart_title": {
+        "id": "Frontier Pareto: Profit vs Lembur",
+        "en": "Pareto Frontier: Profit vs Overtime"
+    },
+    "p2_pareto_header": {
+        "id": "⚖️ Frontier Pareto: Output vs Anggaran",
+        "en": "⚖️ Pareto Frontier: Output vs Budget"
+    },
+    "p2_pareto_help": {
+        "id": "Menghitung output maksimum untuk setiap tingkat anggaran dengan metode epsilon-constraint, dari anggaran nol sampai anggaran yang membeli semua kapasitas. Garis putus-putus menandai batas anggaran saat ini.",
+        "en": "Computes the maximum output for every budget level with the epsilon-constraint method, from a zero budget up to the budget that buys all capacity. The dashed line marks the current budget limit."
+    },
+    "p2_pareto_max_budget_label": {
+        "id": "Anggaran maksimum frontier (0 = tanpa batas)",
+        "en": "Maximum frontier budget (0 = no cap)"
+    },
+    "p2_pareto_max_budget_help": {
+        "id": "Memotong frontier pada anggaran ini.",
+        "en": "Cuts the frontier off at this budget."
+    },
+    "p2_pareto_criterion_label": {
+        "id": "Anggaran ($)",
+        "en": "Budget ($)"
+    },
+    "p2_pareto_value_label": {
+        "id": "Output Optimal",
+        "en": "Optimal Output"
+    },
+    "p2_pareto_chart_title": {
+        "id": "Frontier Pareto: Output vs Anggaran",
+        "en": "Pareto Frontier: Output vs Budget"
+    },
+    "pareto_button": {
+        "id": "Hitung Frontier Pareto",
+        "en": "Compute Pareto Frontier"
+    },
+    "pareto_summary": {
+        "id": "✅ {points} titik patah frontier ditemukan dengan {solves} kali solve ({reused} di antaranya dari basis sebelumnya).",
+        "en": "✅ Found {points} frontier breakpoints using {solves} solves ({reused} of them from a previous basis)."
+    },
+    "pareto_current_label": {
+        "id": "Saat ini",
+        "en": "Current"
+    },
+    "pareto_trade_off_col": {
+        "id": "Trade-off ke Titik Berikutnya (per unit)",
+        "en": "Trade-off to Next Point (per unit)"
+    },
+    "iis_header": {
+        "id": "🔍 Diagnosis Infeasibility",
+        "en": "🔍 Infeasibility Diagnosis"
+    },
+    "iis_help": {
+        "id": "Kendala dan batas variabel di bawah ini saling bertentangan: semuanya tidak dapat dipenuhi sekaligus, tetapi menghapus atau melonggarkan salah satunya menghilangkan konflik ini. Kolom pelonggaran menunjukkan seberapa jauh tiap baris harus digeser pada pelonggaran total terkecil. Model MILP didiagnosis melalui relaksasi LP-nya.",
+        "en": "The constraints and variable bounds below conflict: they cannot all hold at once, but removing or relaxing any one of them resolves this conflict. The relaxation column shows how far each row must move in the smallest total relaxation. MILP models are diagnosed through their LP relaxation."
+    },
+    "iis_feasible": {
+        "id": "Relaksasi LP model ini feasible; infeasibility berasal dari syarat integer.",
+        "en": "The LP relaxation of this model is feasible; the infeasibility comes from the integrality requirements."
+    },
+    "iis_summary": {
+        "id": "{count} kendala/batas yang bertentangan ditemukan dengan {solves} kali solve dalam {seconds:.3f} detik.",
+        "en": "Found {count} conflicting constraints/bounds using {solves} solves in {seconds:.3f} s."
+    },
+    "iis_col_kind": {
+        "id": "Jenis",
+        "en": "Type"
+    },
+    "iis_col_name": {
+        "id": "Nama",
+        "en": "Name"
+    },
+    "iis_col_relaxation": {
+        "id": "Pelonggaran",
+        "en": "Relaxation"
+    },
+    "iis_kinds": {
+        "id": {"row": "Kendala (≤)", "equality": "Kendala (=)", "lower": "Batas bawah", "upper": "Batas atas"},
+        "en": {"row": "Constraint (≤)", "equality": "Constraint (=)", "lower": "Lower bound", "upper": "Upper bound"}
+    },
+    "p1_param_header": {
+        "id": "📈 Analisis Parametrik RHS",
+        "en": "📈 Parametric RHS Analysis"
+    },
+    "p1_param_help": {
+        "id": "Menelusuri profit optimal sebagai fungsi dari satu kapasitas (RHS). Solver hanya dijalankan di titik patah kurva, bukan di setiap titik grid.",
+        "en": "Traces the optimal profit as a function of one capacity (RHS). The solver only runs at the breakpoints of the curve, not at every grid point."
+    },
+    "p1_param_rhs_label": {
+        "id": "Kapasitas yang dianalisis",
+        "en": "Capacity to analyze"
+    },
+    "p1_param_lo_label": {
+        "id": "Dari",
+        "en": "From"
+    },
+    "p1_param_hi_label": {
+        "id": "Sampai",
+        "en": "To"
+    },
+    "p1_param_button": {
+        "id": "Jalankan Analisis Parametrik",
+        "en": "Run Parametric Analysis"
+    },
+    "p1_param_summary": {
+        "id": "✅ {breakpoints} titik patah ditemukan dengan {solves} kali solve.",
+        "en": "✅ Found {breakpoints} breakpoints using {solves} solves."
+    },
+    "p1_param_chart_title": {
+        "id": "Profit Optimal vs Kapasitas",
+        "en": "Optimal Profit vs Capacity"
+    },
+    "p1_param_from_col": {
+        "id": "Dari RHS",
+        "en": "From RHS"
+    },
+    "p1_param_to_col": {
+        "id": "Sampai RHS",
+        "en": "To RHS"
+    },
+    "p1_param_shadow_col": {
+        "id": "Harga Bayangan ($/unit)",
+        "en": "Shadow Price ($/unit)"
+    },
+    "p1_integer_header": {
+        "id": "Variabel Integer (Opsional)",
+        "en": "Integer Variables (Optional)"
+    },
+    "p1_integer_label": {
+        "id": "Variabel bernilai bulat",
+        "en": "Whole-number variables"
+    },
+    "p1_integer_help": {
+        "id": "Variabel yang dipilih hanya boleh bernilai bulat (unit utuh, shift lembur utuh). Model diselesaikan dengan MILP HiGHS (`scipy.optimize.milp`); batas waktu dari sidebar juga berlaku.",
+        "en": "Selected variables may only take whole values (whole units, whole overtime shifts). The model is solved with the HiGHS MILP solver (`scipy.optimize.milp`); the sidebar time limit applies as well."
+    },
+    "p1_mip_gap_label": {
+        "id": "MIP gap (%)",
+        "en": "MIP gap (%)"
+    },
+    "p1_node_limit_label": {
+        "id": "Batas node",
+        "en": "Node limit"
+    },
+    "p1_node_limit_help": {
+        "id": "0 = tanpa batas.",
+        "en": "0 = no limit."
+    },
+    "p1_mip_time_limit": {
+        "id": "Batas waktu tercapai sebelum optimal terbukti.",
+        "en": "The time limit was reached before optimality was proven."
+    },
+    "p1_mip_node_limit": {
+        "id": "Batas node tercapai sebelum optimal terbukti.",
+        "en": "The node limit was reached before optimality was proven."
+    },
+    "p1_mip_incumbent": {
+        "id": "⚠️ {reason} Ditampilkan solusi bulat terbaik yang ditemukan (gap {gap:.2f}%).",
+        "en": "⚠️ {reason} Showing the best integer solution found (gap {gap:.2f}%)."
+    },
+    "p1_mip_no_incumbent": {
+        "id": "{reason} Belum ada solusi bulat yang ditemukan; naikkan batasnya.",
+        "en": "{reason} No integer solution was found yet; raise the limit."
+    },
+    "p1_mip_stats": {
+        "id": "MILP: gap {gap:.3f}% · {nodes} node · batas atas profit ${bound:,.2f}",
+        "en": "MILP: gap {gap:.3f}% · {nodes} nodes · profit upper bound ${bound:,.2f}"
+    },
+    "p1_multi_header": {
+        "id": "🗓️ Perencanaan Multi-Periode",
+        "en": "🗓️ Multi-Period Planning"
+    },
+    "p1_multi_help": {
+        "id": "Model 13.8-5 diulang untuk setiap periode (misalnya 52 minggu) dengan permintaan musiman, persediaan yang dibawa ke periode berikutnya, dan biaya simpan per unit per periode. Persediaan akhir tidak boleh melebihi persediaan awal, sehingga hanya unit yang terjual yang menghasilkan profit. Koefisien dan kapasitas diambil dari input di atas. Seluruh horizon diselesaikan sebagai satu LP *sparse*; mode *rolling horizon* menyelesaikan jendela periode secara berurutan.",
+        "en": "The 13.8-5 model is repeated for every period (e.g. 52 weeks) with seasonal demand, inventory carried to the next period and a holding cost per unit per period. Final inventory may not exceed the initial inventory, so only units that are sold earn profit. Coefficients and capacities come from the inputs above. The whole horizon is solved as one sparse LP; rolling-horizon mode solves windows of periods one after another."
+    },
+    "p1_multi_periods_label": {
+        "id": "Jumlah periode",
+        "en": "Number of periods"
+    },
+    "p1_multi_demand_label": {
+        "id": "Permintaan dasar per periode",
+        "en": "Base demand per period"
+    },
+    "p1_multi_season_label": {
+        "id": "Amplitudo musiman (%)",
+        "en": "Seasonal amplitude (%)"
+    },
+    "p1_multi_holding_label": {
+        "id": "Biaya simpan ($/unit/periode)",
+        "en": "Holding cost ($/unit/period)"
+    },
+    "p1_multi_initial_label": {
+        "id": "Persediaan awal",
+        "en": "Initial inventory"
+    },
+    "p1_multi_max_inv_label": {
+        "id": "Kapasitas gudang",
+        "en": "Storage capacity"
+    },
+    "p1_multi_rolling_label": {
+        "id": "Rolling horizon",
+        "en": "Rolling horizon"
+    },
+    "p1_multi_rolling_help": {
+        "id": "Menyelesaikan jendela periode secara berurutan dan menetapkan separuh pertama setiap jendela. Heuristik: hasilnya bisa sedikit di bawah optimum penuh.",
+        "en": "Solves windows of periods one after another and fixes the first half of each window. Heuristic: the result can be slightly below the full optimum."
+    },
+    "p1_multi_horizon_label": {
+        "id": "Panjang jendela (periode)",
+        "en": "Window length (periods)"
+    },
+    "p1_multi_button": {
+        "id": "Susun Rencana Multi-Periode",
+        "en": "Build Multi-Period Plan"
+    },
+    "p1_multi_summary": {
+        "id": "✅ Rencana {periods} periode ({vars} variabel) diselesaikan dengan {solves} kali solve dalam {seconds:.2f} detik.",
+        "en": "✅ Solved the {periods}-period plan ({vars} variables) with {solves} solves in {seconds:.2f} s."
+    },
+    "p1_multi_chart_title": {
+        "id": "Produksi, Penjualan, dan Persediaan per Periode",
+        "en": "Production, Sales and Inventory per Period"
+    },
+    "p1_multi_period_col": {
+        "id": "Periode",
+        "en": "Period"
+    },
+    "p1_multi_demand_col": {
+        "id": "Permintaan",
+        "en": "Demand"
+    },
+    "p1_multi_sales_col": {
+        "id": "Penjualan",
+        "en": "Sales"
+    },
+    "p1_multi_inventory_col": {
+        "id": "Persediaan",
+        "en": "Inventory"
+    },
+    "p1_multi_download": {
+        "id": "📥 Unduh Rencana",
+        "en": "📥 Download Plan"
+    },
+    "mc_header": {
+        "id": "🎲 Analisis Robustness Monte Carlo",
+        "en": "🎲 Monte Carlo Robustness Analysis"
+    },
+    "p1_mc_help": {
+        "id": "Koefisien profit diperlakukan sebagai perkiraan yang tidak pasti. Ribuan vektor koefisien disampel di sekitar nilai input di atas, setiap sampel diselesaikan, dan distribusi profit optimal serta seberapa sering setiap variabel berada di dalam basis dilaporkan.",
+        "en": "The profit coefficients are treated as uncertain forecasts. Thousands of coefficient vectors are sampled around the inputs above, every sample is solved, and the distribution of the optimal profit and how often each variable is in the basis are reported."
+    },
+    "p2_mc_help": {
+        "id": "Biaya per unit diperlakukan sebagai perkiraan yang tidak pasti. Ribuan vektor biaya disampel di sekitar nilai input di atas, setiap sampel diselesaikan, dan distribusi output optimal serta seberapa sering setiap variabel berada di dalam basis dilaporkan.",
+        "en": "The unit costs are treated as uncertain forecasts. Thousands of cost vectors are sampled around the inputs above, every sample is solved, and the distribution of the optimal output and how often each variable is in the basis are reported."
+    },
+    "mc_samples_label": {
+        "id": "Jumlah sampel",
+        "en": "Number of samples"
+    },
+    "mc_spread_label": {
+        "id": "Ketidakpastian (% dari nilai)",
+        "en": "Uncertainty (% of value)"
+    },
+    "mc_dist_label": {
+        "id": "Distribusi",
+        "en": "Distribution"
+    },
+    "mc_dist_normal": {
+        "id": "Normal",
+        "en": "Normal"
+    },
+    "mc_dist_uniform": {
+        "id": "Uniform",
+        "en": "Uniform"
+    },
+    "mc_dist_triangular": {
+        "id": "Segitiga",
+        "en": "Triangular"
+    },
+    "mc_dist_lognormal": {
+        "id": "Lognormal",
+        "en": "Lognormal"
+    },
+    "mc_seed_label": {
+        "id": "Seed acak",
+        "en": "Random seed"
+    },
+    "mc_button": {
+        "id": "Jalankan Simulasi Monte Carlo",
+        "en": "Run Monte Carlo Simulation"
+    },
+    "mc_summary": {
+        "id": "✅ {n} sampel diselesaikan ({failed} gagal) dalam {seconds:.2f} detik; {reused} di antaranya tanpa memanggil solver (basis sebelumnya tetap optimal).",
+        "en": "✅ Solved {n} samples ({failed} failed) in {seconds:.2f} s; {reused} of them without calling the solver (a previous basis stayed optimal)."
+    },
+    "p1_mc_value_label": {
+        "id": "Profit Optimal ($)",
+        "en": "Optimal Profit ($)"
+    },
+    "p2_mc_value_label": {
+        "id": "Output Optimal",
+        "en": "Optimal Output"
+    },
+    "mc_mean_label": {
+        "id": "Rata-rata {value}",
+        "en": "Mean {value}"
+    },
+    "mc_std_label": {
+        "id": "Simpangan Baku",
+        "en": "Standard Deviation"
+    },
+    "mc_chart_title": {
+        "id": "Distribusi {value}",
+        "en": "Distribution of {value}"
+    },
+    "mc_count_label": {
+        "id": "Jumlah Sampel",
+        "en": "Number of Samples"
+    },
+    "mc_mean_x_col": {
+        "id": "Rata-rata Nilai",
+        "en": "Mean Value"
+    },
+    "mc_basic_col": {
+        "id": "Di Dalam Basis (%)",
+        "en": "In Basis (%)"
+    },
+    "mc_positive_col": {
+        "id": "Bernilai Positif (%)",
+        "en": "Positive (%)"
+    },
+    "mc_patterns_header": {
+        "id": "Pola Basis Terbanyak (B = basis, - = di batas)",
+        "en": "Most Frequent Basis Patterns (B = basic, - = at a bound)"
+    },
+    "mc_pattern_col": {
+        "id": "Pola",
+        "en": "Pattern"
+    },
+    "p1_batch_header": {
+        "id": "📦 Mode Batch Skenario",
+        "en": "📦 Scenario Batch Mode"
+    },
+    "p1_batch_help": {
+        "id": "Setiap baris adalah satu skenario: koefisien profit `c1..c4`, baris batasan `a1_1..a1_4` dan `a2_1..a2_4`, RHS `b1, b2`, serta batas atas `u1..u4`. Unggah CSV dengan kolom yang sama atau edit tabel langsung.",
+        "en": "Each row is one scenario: profit coefficients `c1..c4`, constraint rows `a1_1..a1_4` and `a2_1..a2_4`, RHS `b1, b2` and upper bounds `u1..u4`. Upload a CSV with the same columns or edit the table directly."
+    },
+    "p1_batch_upload_label": {
+        "id": "Unggah CSV skenario",
+        "en": "Upload scenario CSV"
+    },
+    "p1_batch_solve_button": {
+        "id": "Selesaikan Semua Skenario",
+        "en": "Solve All Scenarios"
+    },
+    "p1_batch_summary": {
+        "id": "✅ {solved} dari {total} skenario berhasil diselesaikan.",
+        "en": "✅ {solved} of {total} scenarios solved successfully."
+    },
+    "p1_batch_presolve_label": {
+        "id": "Presolve model sebelum diselesaikan",
+        "en": "Presolve models before solving"
+    },
+    "p1_batch_presolve_help": {
+        "id": "Menghapus variabel tetap (batas atas 0), kolom dan baris kosong, baris redundan, dan baris duplikat, serta menskalakan baris dengan koefisien ekstrem sebelum memanggil solver. Solusi dan nilai dual dipetakan kembali ke model asli.",
+        "en": "Removes fixed variables (upper bound 0), empty columns and rows, redundant and duplicate rows, and scales rows with extreme coefficients before calling the solver. Solutions and dual values are mapped back to the original model."
+    },
+    "p1_batch_presolve_summary": {
+        "id": "Presolve menghapus {vars} variabel dan {rows} baris kendala di semua skenario (presolve {presolve_ms:.1f} ms, solve {solve_ms:.1f} ms).",
+        "en": "Presolve removed {vars} variables and {rows} constraint rows across all scenarios (presolve {presolve_ms:.1f} ms, solve {solve_ms:.1f} ms)."
+    },
+    "p1_batch_download": {
+        "id": "⬇️ Unduh Hasil Batch",
+        "en": "⬇️ Download Batch Results"
+    },
+
+    # Teks untuk Masalah 2: Alokasi Sumber Daya
+    "p2_title": {
+        "id": "💰 Masalah 2: Alokasi Sumber Daya",
+        "en": "💰 Problem 2: Resource Allocation"
+    },
+    "p2_desc": {
+        "id": "Optimalisasi alokasi sumber daya untuk dua produk dengan waktu reguler dan lembur, dengan batasan anggaran dan kapasitas produksi.",
+        "en": "Optimizing resource allocation for two products with regular and overtime hours, subject to a budget and production capacity constraints."
+    },
+    "p2_info": {
+        "id": "**Alokasi Sumber Daya**: Optimalisasi alokasi sumber daya dengan batasan anggaran dan kapasitas produksi.",
+        "en": "**Resource Allocation**: Optimizing resource allocation with a budget constraint and production capacities."
+    },
+    "p2_solve_button": {
+        "id": "Selesaikan Masalah Alokasi",
+        "en": "Solve Allocation Problem"
+    },
+    "p2_obj_func_header": {
+        "id": "📊 Fungsi Tujuan (Maksimalkan Output)",
+        "en": "📊 Objective Function (Maximize Output)"
+    },
+    "p2_budget_header": {
+        "id": "💸 Batasan Anggaran (Budget Constraint)",
+        "en": "💸 Budget Constraint"
+    },
+    "p2_capacity_header": {
+        "id": "🔢 Batasan Kapasitas",
+        "en": "🔢 Capacity Bounds"
+    },
+    "p2_df_unitcost_col": {
+        "id": "Biaya Unit ($)",
+        "en": "Unit Cost ($)"
+    },
+    "p2_df_totalcost_col": {
+        "id": "Total Biaya ($)",
+        "en": "Total Cost ($)"
+    },
+    "p2_df_cap_usage_col": {
+        "id": "Penggunaan Kapasitas (%)",
+        "en": "Capacity Usage (%)"
+    },
+    "p2_df_budget_item_col": {
+        "id": "Item",
+        "en": "Item"
+    },
+    "p2_df_budget_items": {
+        "id": ['Anggaran Dialokasikan', 'Anggaran Terpakai', 'Sisa Anggaran', 'Utilisasi Anggaran'],
+        "en": ['Budget Allocated', 'Budget Used', 'Budget Remaining', 'Budget Utilization']
+    },
+    "p2_metric_output": {
+        "id": "Output Maksimum",
+        "en": "Maximum Output"
+    },
+    "p2_metric_cost": {
+        "id": "Total Biaya",
+        "en": "Total Cost"
+    },
+    "p2_metric_budget_usage": {
+        "id": "Penggunaan Anggaran",
+        "en": "Budget Usage"
+    },
+    "p2_metric_rem_budget": {
+        "id": "Sisa Anggaran",
+        "en": "Remaining Budget"
+    },
+    "p2_chart1_title": {
+        "id": "Alokasi Sumber Daya Optimal",
+        "en": "Optimal Resource Allocation"
+    },
+    "p2_chart2_title": {
+        "id": "Distribusi Biaya per Variabel",
+        "en": "Cost Distribution by Variable"
+    },
+    "p2_interpretation_title": {
+        "id": "💡 Interpretasi Hasil",
+        "en": "💡 Result Interpretation"
+    },
+    "p2_interpretation_text": {
+        "id": "Untuk memaksimalkan total output, strategi terbaik adalah **memanfaatkan penuh opsi produksi termurah terlebih dahulu**. Dalam kasus ini, produksi `Reguler P1` (biaya $15) dan `Reguler P2` (biaya $16) digunakan hingga kapasitas maksimalnya. Sisa anggaran kemudian dialokasikan untuk memproduksi {val4:.0f} unit `Lembur P2` (biaya $24), karena ini adalah opsi termurah berikutnya yang tersedia. Produksi `Lembur P1` (biaya $25) tidak digunakan sama sekali. Strategi ini berhasil **menghabiskan seluruh anggaran** ({usage:.1f}%) untuk mendapatkan output setinggi mungkin.",
+        "en": "To maximize total output, the best strategy is to **fully utilize the cheapest production options first**. In this case, `Regular P1` (cost $15) and `Regular P2` (cost $16) are used to their maximum capacity. The remaining budget is then allocated to produce {val4:.0f} units of `Overtime P2` (cost $24), as it's the next cheapest available option. `Overtime P1` (cost $25) is not used at all. This strategy successfully **exhausts the entire budget** ({usage:.1f}%) to achieve the highest possible output."
+    },
+
+    # Teks untuk Masalah 3: Model Kustom (Impor File)
+    "p3_title": {
+        "id": "📂 Masalah 3: Model Kustom (Impor File)",
+        "en": "📂 Problem 3: Custom Model (File Import)"
+    },
+    "p3_desc": {
+        "id": "Muat model LP berukuran besar dari file CSV atau Parquet: daftar variabel, daftar batasan, dan koefisien matriks dalam format baris-kolom-nilai.",
+        "en": "Load a large LP model from CSV or Parquet files: a variable list, a constraint list and the matrix coefficients in row-column-value format."
+    },
+    "p3_info": {
+        "id": "**Model Kustom**: Impor model LP besar (matriks sparse) dari file CSV/Parquet dan selesaikan dengan HiGHS.",
+        "en": "**Custom Model**: Import a large LP model (sparse matrix) from CSV/Parquet files and solve it with HiGHS."
+    },
+    "p3_guide_header": {
+        "id": "📖 Panduan Format File",
+        "en": "📖 File Format Guide"
+    },
+    "p3_guide_content": {
+        "id": """
+    - **Variabel**: kolom `name`, `objective`, serta opsional `lower` dan `upper` (default 0 dan tak terbatas).
+    - **Batasan**: kolom `name`, `rhs`, serta opsional `sense` (`<=`, `>=`, atau `=`; default `<=`).
+    - **Matriks**: kolom `row`, `col`, `value` untuk setiap koefisien bukan nol. `row`/`col` berisi nama batasan/variabel atau indeks mulai dari 0.
+
+    File dibaca per potongan (*chunk*) sehingga file berukuran ratusan MB tetap dapat dimuat.
+    """,
+        "en": """
+    - **Variables**: columns `name`, `objective`, and optional `lower` and `upper` (default 0 and unbounded).
+    - **Constraints**: columns `name`, `rhs`, and optional `sense` (`<=`, `>=` or `=`; default `<=`).
+    - **Matrix**: columns `row`, `col`, `value` for every nonzero coefficient. `row`/`col` hold constraint/variable names or 0-based indices.
+
+    Files are read in chunks, so files of several hundred MB can still be loaded.
+    """
+    },
+    "p3_variables_upload": {
+        "id": "File variabel",
+        "en": "Variables file"
+    },
+    "p3_constraints_upload": {
+        "id": "File batasan",
+        "en": "Constraints file"
+    },
+    "p3_matrix_upload": {
+        "id": "File matriks koefisien",
+        "en": "Coefficient matrix file"
+    },
+    "p3_sense_label": {
+        "id": "Arah optimasi",
+        "en": "Optimization sense"
+    },
+    "p3_sense_max": {
+        "id": "Maksimalkan",
+        "en": "Maximize"
+    },
+    "p3_sense_min": {
+        "id": "Minimalkan",
+        "en": "Minimize"
+    },
+    "p3_solve_button": {
+        "id": "Selesaikan Model Kustom",
+        "en": "Solve Custom Model"
+    },
+    "p3_import_error": {
+        "id": "❌ Gagal membaca file model:",
+        "en": "❌ Could not read the model files:"
+    },
+    "p3_metric_objective": {
+        "id": "Nilai Tujuan Optimal",
+        "en": "Optimal Objective Value"
+    },
+    "p3_metric_constraints": {
+        "id": "Batasan",
+        "en": "Constraints"
+    },
+    "p3_chart1_title": {
+        "id": "Nilai Variabel Terbesar",
+        "en": "Largest Variable Values"
+    },
+    "p3_chart2_title": {
+        "id": "Distribusi Nilai Variabel",
+        "en": "Distribution of Variable Values"
+    },
+    "p3_metric_nnz": {
+        "id": "Koefisien Bukan Nol",
+        "en": "Nonzero Coefficients"
+    },
+
+    # Teks Umum Hasil
+    "results_header": {
+        "id": "📊 Hasil & Analisis",
+        "en": "📊 Results & Analysis"
+    },
+    "success_message": {
+        "id": "✅ Optimisasi Berhasil! Solusi optimal telah ditemukan.",
+        "en": "✅ Optimization Successful! An optimal solution has been found."
+    },
+    "error_message": {
+        "id": "❌ Optimisasi Gagal:",
+        "en": "❌ Optimization Failed:"
+    },
+    "optimal_vars_header": {
+        "id": "📋 Nilai Variabel Optimal",
+        "en": "📋 Optimal Variable Values"
+    },
+    "constraint_analysis_header": {
+        "id": "🔍 Analisis Batasan",
+        "en": "🔍 Constraint Analysis"
+    },
+    "budget_analysis_header": {
+        "id": "💰 Analisis Anggaran",
+        "en": "💰 Budget Analysis"
+    },
+    "df_variable_col": {
+        "id": "Variabel",
+        "en": "Variable"
+    },
+    "df_optimal_val_col": {
+        "id": "Nilai Optimal",
+        "en": "Optimal Value"
+    },
+    "df_usage_col": {
+        "id": "Penggunaan",
+        "en": "Usage"
+    },
+    "df_limit_col": {
+        "id": "Batas",
+        "en": "Limit"
+    },
+    "df_slack_col": {
+        "id": "Sisa (Slack)",
+        "en": "Slack"
+    },
+    "df_utilization_col": {
+        "id": "Utilisasi (%)",
+        "en": "Utilization (%)"
+    },
+    "df_value_col": {
+        "id": "Nilai",
+        "en": "Value"
+    },
+    "sensitivity_header": {
+        "id": "🎯 Analisis Sensitivitas",
+        "en": "🎯 Sensitivity Analysis"
+    },
+    "sensitivity_help": {
+        "id": "Harga bayangan, biaya tereduksi, dan rentang koefisien diambil dari nilai dual solver HiGHS pada solusi yang sama, tanpa solve tambahan. Selama perubahan berada di dalam rentang yang diizinkan, basis optimal tidak berubah.",
+        "en": "Shadow prices, reduced costs and coefficient ranges come from the HiGHS dual values of the same solution, with no extra solves. As long as a change stays within the allowable range, the optimal basis does not change."
+    },
+    "sensitivity_vars_header": {
+        "id": "Variabel",
+        "en": "Variables"
+    },
+    "sensitivity_cons_header": {
+        "id": "Batasan",
+        "en": "Constraints"
+    },
+    "sensitivity_var_cols": {
+        "id": {"value": "Nilai", "reduced_cost": "Biaya Tereduksi", "objective": "Koefisien Tujuan", "obj_allow_increase": "Kenaikan Diizinkan", "obj_allow_decrease": "Penurunan Diizinkan"},
+        "en": {"value": "Value", "reduced_cost": "Reduced Cost", "objective": "Objective Coefficient", "obj_allow_increase": "Allowable Increase", "obj_allow_decrease": "Allowable Decrease"}
+    },
+    "sensitivity_cons_cols": {
+        "id": {"usage": "Penggunaan", "rhs": "RHS", "slack": "Sisa (Slack)", "shadow_price": "Harga Bayangan", "rhs_allow_increase": "Kenaikan RHS Diizinkan", "rhs_allow_decrease": "Penurunan RHS Diizinkan"},
+        "en": {"usage": "Usage", "rhs": "RHS", "slack": "Slack", "shadow_price": "Shadow Price", "rhs_allow_increase": "RHS Allowable Increase", "rhs_allow_decrease": "RHS Allowable Decrease"}
+    },
+    "export_header": {
+        "id": "⬇️ Ekspor Hasil",
+        "en": "⬇️ Export Results"
+    },
+    "export_download": {
+        "id": "Unduh",
+        "en": "Download"
+    },
+     "chart_vars_label": {
+        "id": "Variabel",
+        "en": "Variables"
+    },
+    "chart_other_label": {
+        "id": "Lainnya",
+        "en": "Other"
+    },
+    "chart_count_label": {
+        "id": "Jumlah Variabel",
+        "en": "Number of Variables"
+    },
+    "chart_units_label": {
+        "id": "Unit Produksi",
+        "en": "Production Units"
+    },
+    "chart_resources_label": {
+        "id": "Sumber Daya Dialokasikan",
+        "en": "Allocated Resources"
+    },
+    "problem_summary": {
+        "id": "Ringkasan Masalah",
+        "en": "Problem Summary"
+    },
+    "summary_vars": {
+        "id": "Variabel Keputusan",
+        "en": "Decision Variables"
+    },
+    "summary_constraints": {
+        "id": "Batasan Pertidaksamaan",
+        "en": "Inequality Constraints"
+    },
+    "summary_bounds": {
+        "id": "Batasan Kapasitas",
+        "en": "Capacity Limitations"
+    },
+    "summary_objective": {
+        "id": "Tujuan",
+        "en": "Objective"
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def text_bundle(lang):
+    """Returns ``{key: text}`` for one language (shared, do not modify)."""
+    if lang not in LANGUAGES:
+        raise ValueError(f"Unknown language: {lang}")
+    return {key: value[lang] if isinstance(value, dict) else value for key, value in TEXTS.items()}